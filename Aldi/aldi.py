@@ -1,15 +1,18 @@
-import requests
-import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, transport
 
 URL = "https://www.jobs.aldi.ch/rest/jobs/search"
 OUTPUT_FILE = "aldi_jobs.json"
 
 def download_jobs():
-    response = requests.get(URL)
+    response = transport.get(URL)
     response.raise_for_status()  # Raises HTTPError for bad responses
     jobs_data = response.json()
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(jobs_data, f, ensure_ascii=False, indent=2)
+        jsonio.dump(jobs_data, f)
     print(f"Downloaded {len(jobs_data.get('jobs', []))} jobs to {OUTPUT_FILE}")
 
 if __name__ == "__main__":
@@ -1,28 +1,22 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import sys
+from pathlib import Path
+
 import requests
-import json
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio
+from jobboard.shape import JobList
 
 URL = "https://recrutement.chuv.ch/utf8/ic_job_feeds.feed_engine?p_web_site_id=5352&p_published_to=WWW&p_language=DEFAULT&p_direct=Y&p_format=MOBILE&p_search=&p_summary=Y&p_order=DATE_ON"
 
+JOBS = JobList("chuv")  # job-list path sniffed once, reused and re-checked on every run
+
+
 def extract_jobs(payload):
-    # If the payload is already a list, that's our jobs.
-    if isinstance(payload, list):
-        return payload
-    # Common dict shapes: {"items":[...]}, {"jobs":[...]}, {"results":[...]}, {"data":{"items":[...]}} ...
-    if isinstance(payload, dict):
-        for key in ("items", "jobs", "results", "rows", "offers", "vacancies"):
-            v = payload.get(key)
-            if isinstance(v, list):
-                return v
-            if isinstance(v, dict) and isinstance(v.get("items"), list):
-                return v["items"]
-        # Fallback: first list value in the dict
-        for v in payload.values():
-            if isinstance(v, list):
-                return v
-    return []
+    return JOBS.extract(payload)
 
 def main():
     resp = requests.get(URL, timeout=30)
@@ -31,7 +25,7 @@ def main():
     jobs = extract_jobs(data)
 
     with open("chuv_jobs.json", "w", encoding="utf-8") as f:
-        json.dump(jobs if jobs else data, f, ensure_ascii=False, indent=2)
+        jsonio.dump(jobs if jobs else data, f)
 
     if jobs:
         print(f"✅ Saved {len(jobs)} jobs to chuv_jobs.json")
@@ -1,13 +1,17 @@
 # epfl_scientifique_table_to_json.py
 # pip install requests beautifulsoup4
-import json
 import re
+import sys
 import time
+from pathlib import Path
 from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio
+
 START_URL = "https://careers.epfl.ch/go/Personnel-Scientifique-%28FR%29/504774/"
 OUTFILE = "epfl_personnel_scientifique.json"
 PAGE_STEP = 25  # SuccessFactors list pages usually paginate by 25
@@ -154,7 +158,7 @@ def main():
             break
 
     with open(OUTFILE, "w", encoding="utf-8") as f:
-        json.dump(all_rows, f, ensure_ascii=False, indent=2)
+        jsonio.dump(all_rows, f)
 
     log(f"✅ Saved {len(all_rows)} rows to {OUTFILE}")
     if headers_master:
@@ -1,7 +1,11 @@
 import requests
 from bs4 import BeautifulSoup
-import json
 import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio
 
 def fetch_html(url):
     """
@@ -136,7 +140,7 @@ if __name__ == "__main__":
         extracted_jobs = extract_ethz_jobs(html_content)
 
         # Output the jobs in JSON format
-        jobs_json = json.dumps(extracted_jobs, indent=4, ensure_ascii=False)
+        jobs_json = jsonio.dumps(extracted_jobs)
         print(jobs_json)
 
         print(f"\nSuccessfully extracted {len(extracted_jobs)} jobs.")
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json, re, sys, time
-from dataclasses import asdict, dataclass
-from typing import List, Dict, Set, Optional
+import re, sys, time
+from pathlib import Path
+from typing import List, Set, Optional
 import requests
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import record
+from jobboard.record import Record
+
 BASE = "https://jobs.h-och.ch/search/"
 PARAMS_BASE = {
     "q": "",
@@ -44,8 +48,7 @@ ROW_SELECTORS = [
 ]
 
 
-@dataclass
-class Job:
+class Job(Record, intern=("location", "department", "company", "source")):
     title: str
     url: str
     location: Optional[str] = None
@@ -176,7 +179,7 @@ def fetch_page(sess: requests.Session, startrow: int) -> str:
 def main():
     out_file = "h_och_jobs.json"
     step = 25
-    collected: List[Dict] = []
+    collected: List[Job] = []
     seen_urls: Set[str] = set()
     total_expected: Optional[int] = None
 
@@ -195,7 +198,7 @@ def main():
             for j in page_jobs:
                 if j.url not in seen_urls:
                     seen_urls.add(j.url)
-                    collected.append(asdict(j))
+                    collected.append(j)
                     new_count += 1
 
             print(f"[Page {page_idx:>2} startrow={startrow}] found={len(page_jobs)} new={new_count} total={len(collected)}"
@@ -215,7 +218,7 @@ def main():
 
     # Ergebnis speichern
     with open(out_file, "w", encoding="utf-8") as f:
-        json.dump(collected, f, ensure_ascii=False, indent=2)
+        record.dump(collected, f)
 
     print(f"✅ Saved {len(collected)} jobs to {out_file}"
           + (f" (site total said {total_expected})" if total_expected else ""))
@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 # helsana_fixed.py — robust stop conditions (4 pages etc.)
-import json, re, time, random, logging, hashlib
-from dataclasses import dataclass, asdict
+import re, sys, time, random, logging, hashlib
 from typing import Dict, List, Optional, Tuple, Set
 from collections import deque
+from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 import httpx
 from bs4 import BeautifulSoup, Tag
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import record
+from jobboard.record import Record
+
 START_URL   = "https://jobs.helsana.ch/?lang=de"
 OUTPUT      = "helsana_jobs.json"
 
@@ -22,8 +26,7 @@ SEND_PAG_RE  = re.compile(r"sendPagination\((\d+)\)")
 logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)-7s | %(message)s")
 log = logging.getLogger("helsana")
 
-@dataclass
-class Job:
+class Job(Record, intern=("location",)):
     title: str
     location: Optional[str]
     teaser_url: str
@@ -200,10 +203,10 @@ def main() -> int:
             if nxt not in seen_offsets and nxt not in queue:
                 queue.append(nxt)
 
-        data = [asdict(j) for j in results]
+        data = results
 
     with open(OUTPUT, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        record.dump(data, f)
 
     log.info("Done. Pages visited: %d | Jobs: %d", len(seen_offsets), len(data))
     print(f"Wrote {OUTPUT} with {len(data)} jobs. Offsets seen: {sorted(seen_offsets)}")
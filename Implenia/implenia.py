@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
 import re
+import sys
+from pathlib import Path
 from typing import List, Dict, Optional
-import requests
+from urllib.parse import urljoin
 from bs4 import BeautifulSoup, NavigableString, Tag
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, transport
+
 BASE_URL = "https://implenia.com/karriere/jobs/"
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) "
@@ -19,7 +23,7 @@ TOTAL_RE = re.compile(r"\b(\d+)\s+Stellen\b", re.I)
 JOBID_RE = re.compile(r"\bJob\s+(\d+)\b", re.I)
 
 def fetch_soup(url: str) -> BeautifulSoup:
-    r = requests.get(url, headers=HEADERS, timeout=30)
+    r = transport.get(url, headers=HEADERS, timeout=30)
     r.raise_for_status()
     return BeautifulSoup(r.text, "lxml")
 
@@ -53,7 +57,7 @@ def parse_listing_group(h3: Tag) -> Optional[Dict]:
     if not a or "/karriere/job/" not in a["href"]:
         return None
     title = " ".join(a.get_text(" ", strip=True).split())
-    url = requests.compat.urljoin(BASE_URL, a["href"])
+    url = urljoin(BASE_URL, a["href"])
 
     # Find the next h3 (marks the next listing), then gather the segment in between
     next_h3 = h3.find_next("h3")
@@ -152,7 +156,7 @@ def main():
     print(f"[✓] Extracted {len(jobs)} jobs from overview")
 
     with open(out_file, "w", encoding="utf-8") as f:
-        json.dump(jobs, f, ensure_ascii=False, indent=2)
+        jsonio.dump(jobs, f)
 
     print(f"[✓] Saved to {out_file}")
 
@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 # fetch_jobs_paginated.py
-import json
 import sys
 import time
 from pathlib import Path
 
-import requests
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, transport
+from jobboard.paging import PageSizeProbe
+from jobboard.shape import JobList
 
 BASE_URL = "https://ohws.prospective.ch/public/v1/medium/1000666/jobs"
 LANG = "de"
-LIMIT = 200  # API only allows up to 200
+DEFAULT_LIMIT = 200  # known-good page size; the probe may negotiate a larger one
 OUT_FILE = Path("jobs.json")
 MAX_PAGES = 50  # safety guard
 
@@ -21,29 +25,28 @@ HEADERS = {
 RETRY_STATUSES = {429, 500, 502, 503, 504}
 
 
+JOBS = JobList("insel")
+
+
 def extract_items(payload):
-    """Return a list of job items from various possible response shapes."""
-    if isinstance(payload, list):
-        return payload
-    if isinstance(payload, dict):
-        for key in ("jobs", "items", "results", "data"):
-            if key in payload and isinstance(payload[key], list):
-                return payload[key]
-    return []
-
-
-def fetch_page(offset):
-    """Fetch a single page with retries."""
-    params = {"lang": LANG, "offset": offset, "limit": LIMIT}
+    """Return the list of job items (path sniffed on the first page, then looked up directly)."""
+    return JOBS.extract(payload)
+
+
+def fetch_page(offset, limit=DEFAULT_LIMIT):
+    """Fetch a single page with retries (client errors such as a rejected limit fail at once)."""
+    params = {"lang": LANG, "offset": offset, "limit": limit}
     backoff = 1.0
     for attempt in range(5):
         try:
-            r = requests.get(BASE_URL, headers=HEADERS, params=params, timeout=30)
+            r = transport.get(BASE_URL, headers=HEADERS, params=params, timeout=30)
             if r.status_code in RETRY_STATUSES:
-                raise requests.HTTPError(f"HTTP {r.status_code}")
+                raise httpx.HTTPStatusError(f"HTTP {r.status_code}", request=r.request, response=r)
             r.raise_for_status()
             return r.json()
-        except (requests.RequestException, ValueError) as e:
+        except (httpx.HTTPError, ValueError) as e:
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code not in RETRY_STATUSES:
+                raise
             if attempt == 4:
                 raise
             time.sleep(backoff)
@@ -56,10 +59,22 @@ def main():
     all_jobs = []
     seen_ids = set()
 
+    size = PageSizeProbe().negotiate(
+        BASE_URL,
+        fetch=lambda n: fetch_page(0, n),
+        items=extract_items,
+        total=lambda p: p.get("total") if isinstance(p, dict) else None,
+        default=DEFAULT_LIMIT,
+    )
+    limit = size.limit
+
     total_fetched = 0
     for page in range(MAX_PAGES):
-        offset = page * LIMIT
-        payload = fetch_page(offset)
+        offset = page * limit
+        if page == 0 and size.first_payload is not None:
+            payload = size.first_payload  # the probe already fetched page 1
+        else:
+            payload = fetch_page(offset, limit)
         items = extract_items(payload)
 
         # De-duplicate by "id" if present
@@ -75,13 +90,13 @@ def main():
         total_fetched += len(items)
         print(f"[page {page+1}] offset={offset} got={len(items)} unique_added={len(new_items)}")
 
-        # Stop when the current page returns fewer than LIMIT items
-        if len(items) < LIMIT:
+        # Stop when the current page returns fewer than limit items
+        if len(items) < limit:
             break
 
     # Write combined JSON
     with OUT_FILE.open("w", encoding="utf-8") as f:
-        json.dump(all_jobs, f, ensure_ascii=False, indent=2)
+        jsonio.dump(all_jobs, f)
 
     print(f"✅ Saved {len(all_jobs)} jobs to {OUT_FILE} (fetched {total_fetched} raw items across {page+1} page(s)).")
 
@@ -1,14 +1,17 @@
-import requests
-import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, transport
 
 url = "https://www.ag.ch/io/jobs-proxy//jobs"
 
-response = requests.get(url)
+response = transport.get(url)
 response.raise_for_status()  # löst eine Exception bei HTTP-Fehlern aus
 
 data = response.json()  # JSON wird direkt eingelesen
 
 with open("ag_jobs.json", "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+    jsonio.dump(data, f)
 
 print("✅ JSON gespeichert als ag_jobs.json")
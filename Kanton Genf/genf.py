@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
 import re
+import sys
+from pathlib import Path
 from typing import List, Dict, Optional
+from urllib.parse import urljoin
 import requests
 from bs4 import BeautifulSoup, Tag
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, metrics
+from jobboard.html import segment_by_anchors
+
 BASE_URL = "https://www.ge.ch/offres-emploi-etat-geneve/liste-offres"
+OFFER_PATH = "/offres-emploi-etat-geneve/liste-offres/"
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) "
                   "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -22,6 +29,48 @@ def fetch_soup(url: str) -> BeautifulSoup:
     r.raise_for_status()
     return BeautifulSoup(r.text, "lxml")
 
+def is_offer_anchor(a: Tag) -> bool:
+    return OFFER_PATH in (a.get("href") or "")
+
+def parse_block(title: str, href: str, block: str) -> Dict:
+    """Field heuristics for the text that follows one offer's title link."""
+    # Department/office: first sentence/line that’s not the “Rémunération / Taux …” labels
+    department = None
+    remuneration = None
+    activity_rate = None
+
+    # Split into pseudo-lines to stabilize parsing
+    parts = [p.strip() for p in re.split(r"\s{2,}|\n| {3,}", block) if p.strip()]
+    # 1) Find a reasonable department/office line:
+    for p in parts:
+        if p.lower().startswith("rémunération") or p.lower().startswith("taux d'activité"):
+            continue
+        # Often looks like "Département ... / Office ..."
+        if " / " in p or "Département" in p or "Pouvoir judiciaire" in p or "Autres" in p:
+            department = p
+            break
+
+    # 2) Remuneration (e.g., "classe 21" or "En cours")
+    # The page sometimes places "Rémunération" label and then the class next.
+    m = REMU_RE.search(" ".join(parts))
+    if m:
+        remuneration = m.group(0)
+
+    # 3) Activity rate, e.g., "80%" or "80 à 100%"
+    m2 = RATE_RE.search(" ".join(parts))
+    if m2:
+        # normalize spaces
+        activity_rate = m2.group(0).replace("  ", " ").strip()
+
+    return {
+        "title": title or None,
+        "url": href,
+        "department": department,
+        "remuneration": remuneration,
+        "activity_rate": activity_rate
+    }
+
+@metrics.timed("parse")
 def extract_jobs(soup: BeautifulSoup) -> List[Dict]:
     """
     The overview page lists offers as bullet items:
@@ -32,97 +81,19 @@ def extract_jobs(soup: BeautifulSoup) -> List[Dict]:
         Taux d'activité
         <rate>
 
-    We’ll walk the content and, for each job link (href contains '/liste-offres/'),
-    gather nearby text until the next job link to collect department, remuneration, and rate.
+    One pass over the document splits it into per-offer blocks at the offer
+    links (href contains '/liste-offres/'); each block holds the text after
+    the link up to the next one and goes through the field heuristics.
     """
     jobs: List[Dict] = []
-
-    # Narrow to the main content area that contains the list (keeps parsing stable)
-    main = soup
-    # Find all anchors that look like offer titles
-    anchors: List[Tag] = [
-        a for a in main.find_all("a", href=True)
-        if "/offres-emploi-etat-geneve/liste-offres/" in a["href"]
-    ]
-
     seen = set()
-    for i, a in enumerate(anchors):
+    for a, texts in segment_by_anchors(soup, is_offer_anchor):
         # De-dup: the same anchor might appear in TOC or elsewhere
-        href = requests.compat.urljoin(BASE_URL, a["href"])
+        href = urljoin(BASE_URL, a["href"])
         title = " ".join(a.get_text(" ", strip=True).split())
         if not title or href in seen:
             continue
-
-        # Collect sibling text until the next job anchor
-        # Strategy: iterate through the next siblings in the DOM until we bump into
-        # another anchor that also looks like a job title (or until parent section ends).
-        texts: List[str] = []
-        node = a.parent
-        # Ensure we start scanning after the anchor’s container if it is within a list item
-        # so we capture the block following it.
-        start = a
-        # Advance step-by-step in document order
-        cur = start.next_sibling
-        next_href = anchors[i + 1]["href"] if i + 1 < len(anchors) else None
-
-        # To cap our scan, we stop once we hit the next anchor (by id or href match), or
-        # a new list item beginning with another offer’s anchor.
-        while cur:
-            if isinstance(cur, Tag):
-                # If we encounter another job link, stop
-                links = cur.find_all("a", href=True)
-                if links:
-                    if any("/offres-emploi-etat-geneve/liste-offres/" in l["href"] for l in links):
-                        break
-                # Otherwise, collect visible text
-                t = cur.get_text(" ", strip=True)
-                if t:
-                    texts.append(t)
-            else:
-                # NavigableString
-                t = str(cur).strip()
-                if t:
-                    texts.append(t)
-            cur = cur.next_sibling
-
-        block = " ".join(texts).strip()
-
-        # Heuristics to extract fields from the block
-        # Department/office: first sentence/line that’s not the “Rémunération / Taux …” labels
-        department = None
-        remuneration = None
-        activity_rate = None
-
-        # Split into pseudo-lines to stabilize parsing
-        parts = [p.strip() for p in re.split(r"\s{2,}|\n| {3,}", block) if p.strip()]
-        # 1) Find a reasonable department/office line:
-        for p in parts:
-            if p.lower().startswith("rémunération") or p.lower().startswith("taux d'activité"):
-                continue
-            # Often looks like "Département ... / Office ..."
-            if " / " in p or "Département" in p or "Pouvoir judiciaire" in p or "Autres" in p:
-                department = p
-                break
-
-        # 2) Remuneration (e.g., "classe 21" or "En cours")
-        # The page sometimes places "Rémunération" label and then the class next.
-        m = REMU_RE.search(" ".join(parts))
-        if m:
-            remuneration = m.group(0)
-
-        # 3) Activity rate, e.g., "80%" or "80 à 100%"
-        m2 = RATE_RE.search(" ".join(parts))
-        if m2:
-            # normalize spaces
-            activity_rate = m2.group(0).replace("  ", " ").strip()
-
-        jobs.append({
-            "title": title or None,
-            "url": href,
-            "department": department,
-            "remuneration": remuneration,
-            "activity_rate": activity_rate
-        })
+        jobs.append(parse_block(title, href, " ".join(texts).strip()))
         seen.add(href)
 
     return jobs
@@ -137,7 +108,7 @@ def main():
     jobs = list(uniq.values())
 
     with open(out_file, "w", encoding="utf-8") as f:
-        json.dump(jobs, f, ensure_ascii=False, indent=2)
+        jsonio.dump(jobs, f)
 
     print(f"[✓] Saved {len(jobs)} jobs to {out_file}")
 
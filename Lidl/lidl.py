@@ -13,10 +13,16 @@ Usage:
 import json
 import time
 import sys
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 import requests
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, transport
+from jobboard.paging import PageSizeProbe
+
 BASE_URL = "https://team.lidl.ch/de/search_api/jobsearch"
+HOST = "team.lidl.ch"
 OUTPUT_FILE = "lidl_jobs.json"
 
 # Empty filters as requested
@@ -36,23 +42,26 @@ HEADERS = {
 RETRY_STATUS = {429, 500, 502, 503, 504}
 MAX_RETRIES = 5
 INITIAL_BACKOFF = 1.0  # seconds
-PAGE_DELAY = 0.2       # politeness delay between pages
+PAGE_SIZE_CANDIDATES = (200, 100, 50)
+DEFAULT_PAGE_SIZE = 10  # floor if the API stops reporting result.count
 
 
-def fetch_page(session: requests.Session, page: int) -> Optional[Dict[str, Any]]:
-    """Fetch a single page with basic retry/backoff."""
+def fetch_page(session: requests.Session, page: int,
+               per_page: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """Fetch a single page with basic retry/backoff (client errors are not retried)."""
     params = {
         "page": page,
         "filter": json.dumps(FILTER, separators=(",", ":")),
         "with_event": "true",
-        # You *might* try a larger page size if the API supports it:
-        # "resultsPerPage": 100,
     }
+    if per_page:
+        params["resultsPerPage"] = per_page
 
     backoff = INITIAL_BACKOFF
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            resp = session.get(BASE_URL, params=params, timeout=30)
+            # CircuitOpenError is not a RequestException: a dead host ends the run at once
+            resp = transport.guarded(HOST, lambda: session.get(BASE_URL, params=params, timeout=30))
             if resp.status_code in RETRY_STATUS:
                 raise requests.HTTPError(
                     f"HTTP {resp.status_code} on page {page}", response=resp
@@ -60,6 +69,10 @@ def fetch_page(session: requests.Session, page: int) -> Optional[Dict[str, Any]]
             resp.raise_for_status()
             return resp.json()
         except (requests.RequestException, ValueError) as e:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            if status is not None and status not in RETRY_STATUS:
+                print(f"[!] HTTP {status} on page {page}, not retrying", file=sys.stderr)
+                return None
             if attempt >= MAX_RETRIES:
                 print(f"[!] Failed to fetch page {page} after {attempt} attempts: {e}", file=sys.stderr)
                 return None
@@ -77,11 +90,30 @@ def main() -> None:
     all_hits: List[Dict[str, Any]] = []
     seen_ids = set()
 
+    def probe_fetch(n: int) -> Dict[str, Any]:
+        data = fetch_page(session, 1, n)
+        if data is None:
+            raise RuntimeError("no response")
+        return data
+
+    size = PageSizeProbe().negotiate(
+        BASE_URL,
+        fetch=probe_fetch,
+        items=lambda d: d.get("result", {}).get("hits", []),
+        total=lambda d: d.get("result", {}).get("count"),
+        candidates=PAGE_SIZE_CANDIDATES,
+        default=DEFAULT_PAGE_SIZE,
+    )
+    per_page = size.limit
+
     page = 1
     total_reported = None  # from payload "result.count", optional
 
     while True:
-        data = fetch_page(session, page)
+        if page == 1 and size.first_payload is not None:
+            data = size.first_payload  # the probe already fetched page 1
+        else:
+            data = fetch_page(session, page, per_page)
         if data is None:
             # Hard stop on repeated failures
             break
@@ -112,20 +144,19 @@ def main() -> None:
             new_count += 1
 
         print(f"[+] Page {page}: {len(hits)} hits ({new_count} new). Total collected: {len(all_hits)}")
-        page += 1
-        time.sleep(PAGE_DELAY)
+        page += 1  # pacing: jobboard.throttle
 
     output = {
         "scraped_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         "source": BASE_URL,
-        "params": {"filter": FILTER, "with_event": True},
+        "params": {"filter": FILTER, "with_event": True, "resultsPerPage": per_page},
         "reported_total": total_reported,
         "collected_count": len(all_hits),
         "hits": all_hits,
     }
 
     with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+        jsonio.dump(output, f)
 
     print(f"\n✅ Saved {len(all_hits)} job offers to {OUTPUT_FILE}")
     if total_reported is not None:
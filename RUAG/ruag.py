@@ -5,10 +5,14 @@ import math
 import json
 import re
 import sys
+from pathlib import Path
 from typing import List, Dict, Optional
-import requests
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, metrics, transport
+from jobboard.vocab import Vocabulary
+
 BASE_URL = "https://www.ruag.ch/en/working-us/job-portal"
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) "
@@ -20,12 +24,32 @@ RESULTS_RE = re.compile(r"(\d+)\s+Results\s+found", re.I)
 WORKLOAD_RE = re.compile(r"(\d{1,3}(?:[–-]\d{1,3})?%)\s*$")
 MFDFLAG_RE = re.compile(r"\bm/f/d\b", re.I)
 
+# Experience categories shown on the page (e.g. “Berufserfahrene”, “Experienced professionals”,
+# “Studierende”, “Berufseinsteigende”, “Young professionals”, “School leavers”); matched as word prefixes.
+EXPERIENCE_HINTS = Vocabulary([
+    "Berufserfahrene", "Berufseinsteigende", "Studierende",
+    "Experienced", "professionals", "Young", "School", "leavers",
+    "Professionisti", "esperti",  # Italian seen on the page
+])
+
+def split_experience_and_locations(words: List[str]):
+    if not words:
+        return None, []
+    # Consume the leading run of experience-looking tokens; the rest are places.
+    # Places are capitalized too, so this is fuzzy.
+    i = 0
+    while i < len(words) and EXPERIENCE_HINTS.startswith(words[i]):
+        i += 1
+    experience = " ".join(words[:i]) if i else None
+    return experience, words[i:]
+
 def parse_total_results(soup: BeautifulSoup) -> Optional[int]:
     # Look for the “### 122 Results found” text block
     text = soup.get_text(" ", strip=True)
     m = RESULTS_RE.search(text)
     return int(m.group(1)) if m else None
 
+@metrics.timed("parse")
 def extract_jobs_from_page(soup: BeautifulSoup) -> List[Dict]:
     """
     On each page, job items are linked to jobs.ruag.ch.
@@ -85,35 +109,6 @@ def extract_jobs_from_page(soup: BeautifulSoup) -> List[Dict]:
             rest = []
 
         # The remaining 'rest' tokens are typically: experience + locations (maybe multiple words)
-        # Experience is one of the categories shown on the page (e.g., “Berufserfahrene”, “Experienced professionals”,
-        # “Studierende”, “Berufseinsteigende”, “Young professionals”, “School leavers”).
-        # We’ll try to detect a leading experience phrase from a small dictionary of known starts.
-        EXPERIENCE_HINTS = [
-            "Berufserfahrene", "Berufseinsteigende", "Studierende",
-            "Experienced", "professionals", "Young", "School", "leavers",
-            "Professionisti", "esperti",  # Italian seen on the page
-        ]
-
-        def split_experience_and_locations(words: List[str]):
-            if not words:
-                return None, []
-            # If the first token looks like experience (matches hints), consume tokens
-            # until we hit something that looks like a place (capitalized or contains comma).
-            # However, places can also be capitalized regularly; this is fuzzy.
-            # We’ll consume a leading run of experience-looking tokens.
-            exp_tokens = []
-            i = 0
-            while i < len(words):
-                w = words[i]
-                if any(w.startswith(h) for h in EXPERIENCE_HINTS):
-                    exp_tokens.append(w)
-                    i += 1
-                else:
-                    break
-            experience = " ".join(exp_tokens) if exp_tokens else None
-            locations_tokens = words[i:]
-            return experience, locations_tokens
-
         experience, loc_tokens = split_experience_and_locations(rest)
 
         # Sometimes there are multiple locations separated by commas, or joined by commas in the text.
@@ -134,7 +129,7 @@ def extract_jobs_from_page(soup: BeautifulSoup) -> List[Dict]:
 
 def fetch_page(page: int) -> BeautifulSoup:
     url = f"{BASE_URL}?page={page}"
-    resp = requests.get(url, headers=HEADERS, timeout=30)
+    resp = transport.get(url, headers=HEADERS, timeout=30)
     resp.raise_for_status()
     return BeautifulSoup(resp.text, "lxml")
 
@@ -183,7 +178,7 @@ def main():
     deduped_jobs = list(dedup.values())
 
     with open(out_file, "w", encoding="utf-8") as f:
-        json.dump(deduped_jobs, f, ensure_ascii=False, indent=2)
+        jsonio.dump(deduped_jobs, f)
 
     print(f"[✓] Collected {len(deduped_jobs)} jobs")
     print(f"[✓] Saved to {out_file}")
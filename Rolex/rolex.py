@@ -7,14 +7,19 @@ Usage:
   python rolex_scraper.py
 """
 
-import json
 import re
+import sys
 import time
+from pathlib import Path
 from urllib.parse import urljoin
 
-import requests
+import httpx
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, metrics, transport
+from jobboard.vocab import Vocabulary
+
 BASE = "https://www.carrieres-rolex.com"
 LISTING_TMPL = (
     BASE
@@ -22,7 +27,6 @@ LISTING_TMPL = (
 )
 STEP = 25
 OUTFILE = "rolex_jobs.json"
-SLEEP_SECONDS = 0.7
 TIMEOUT = 20
 
 # Known vocab on the site to help extract columns without opening detail pages
@@ -47,19 +51,23 @@ DOMAINS = {
 SITES = {"Genève", "Bienne", "Fribourg"}
 CONTRACTS = {"CDI", "CDD", "Apprentissage", "Stage", "Stage découverte"}
 
+# Compiled once; longest term wins, so 'Stage découverte' beats 'Stage'
+DOMAIN_VOCAB = Vocabulary(DOMAINS)
+SITE_VOCAB = Vocabulary(SITES, whole_words=True)
+CONTRACT_VOCAB = Vocabulary(CONTRACTS)
+
 DETAIL_HREF_RE = re.compile(r"/Rolex/job/.+?/\d+/?$")
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; JobScraper/1.0; +https://example.com)",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
-    "Connection": "keep-alive",
 }
 
 def fetch_html(url: str) -> str:
     for attempt in range(3):
         try:
-            r = requests.get(url, headers=HEADERS, timeout=TIMEOUT)
+            r = transport.get(url, headers=HEADERS, timeout=TIMEOUT)
             if r.status_code == 429:
                 wait = 2 ** attempt
                 print(f"[rate-limit] 429 on {url} — backing off {wait}s")
@@ -67,7 +75,7 @@ def fetch_html(url: str) -> str:
                 continue
             r.raise_for_status()
             return r.text
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             if attempt == 2:
                 raise
             wait = 2 ** attempt
@@ -101,17 +109,9 @@ def extract_columns_from_row(row_text: str, title: str):
     # Normalize spacing and weird non-breaking spaces
     clean = re.sub(r"\s+", " ", clean).replace("\xa0", " ").strip()
 
-    found_domain = next((d for d in DOMAINS if d in clean), None)
-    found_site = next((s for s in SITES if re.search(rf"\b{s}\b", clean)), None)
-    # 'Stage découverte' must be checked before 'Stage'
-    found_contract = None
-    for c in sorted(CONTRACTS, key=len, reverse=True):
-        if c in clean:
-            found_contract = c
-            break
-
-    return found_domain, found_site, found_contract
+    return DOMAIN_VOCAB.search(clean), SITE_VOCAB.search(clean), CONTRACT_VOCAB.search(clean)
 
+@metrics.timed("parse")
 def parse_jobs(html: str):
     soup = BeautifulSoup(html, "html.parser")
     jobs = []
@@ -161,8 +161,7 @@ def main():
             break
         all_jobs.extend(page_jobs)
         offset += STEP
-        page_idx += 1
-        time.sleep(SLEEP_SECONDS)
+        page_idx += 1  # pacing: jobboard.throttle
 
     # De-dup across pages (just in case)
     dedup = {}
@@ -171,7 +170,7 @@ def main():
     final_list = list(dedup.values())
 
     with open(OUTFILE, "w", encoding="utf-8") as f:
-        json.dump(final_list, f, ensure_ascii=False, indent=2)
+        jsonio.dump(final_list, f)
 
     print(f"✅ Saved {len(final_list)} jobs to {OUTFILE}")
 
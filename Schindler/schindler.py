@@ -14,16 +14,20 @@ Run:
   python schindler_scrape.py
 """
 
-import json
 import re
+import sys
 import time
-from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import List, Optional
 from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import record
+from jobboard.record import Record
+
 BASE = "https://job.schindler.com"
 SEARCH_PATH = "/search/"
 # We keep your requested filters here (CH + sort by date desc)
@@ -40,8 +44,7 @@ HEADERS = {
 }
 
 
-@dataclass
-class Job:
+class Job(Record, intern=("location", "posted")):
     title: str
     url: str
     location: Optional[str]
@@ -232,9 +235,8 @@ def scrape_all() -> List[Job]:
 def main():
     jobs = scrape_all()
     out_path = "schindler_jobs_ch.json"
-    data = [asdict(j) for j in jobs]
     with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        record.dump(jobs, f)
     print(f"\n✅ Saved {len(jobs)} jobs to {out_path}")
 
 
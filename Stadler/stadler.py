@@ -1,15 +1,18 @@
-import requests
-import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, transport
 
 url = "https://www.stadlerrail.com/de/api/prospective-jobs?filter=25:1098730&search="
 
-response = requests.get(url)
+response = transport.get(url)
 response.raise_for_status()  # wirft bei HTTP-Fehlern eine Ausnahme
 
 data = response.json()  # JSON direkt einlesen
 
 # JSON lesbar formatieren und speichern
 with open("stadler_jobs.json", "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
+    jsonio.dump(data, f)
 
 print("✅ JSON gespeichert als stadler_jobs.json")
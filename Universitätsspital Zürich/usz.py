@@ -1,11 +1,39 @@
-import requests
-import json
+import sys
+from pathlib import Path
 
-url = "https://ohws.prospective.ch/public/v1/medium/1001134/jobs?lang=de&limit=200&f=25:1140601&offset=0"
-response = requests.get(url)
-response.raise_for_status()  # Raises an error for bad responses
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, transport
+from jobboard.paging import PageSizeProbe
 
-data = response.json()
+BASE_URL = "https://ohws.prospective.ch/public/v1/medium/1001134/jobs"
+PARAMS = {"lang": "de", "f": "25:1140601"}
+DEFAULT_LIMIT = 200
+
+
+def fetch_page(offset, limit):
+    response = transport.get(BASE_URL, params={**PARAMS, "offset": offset, "limit": limit})
+    response.raise_for_status()  # Raises an error for bad responses
+    return response.json()
+
+
+size = PageSizeProbe().negotiate(
+    BASE_URL + "?f=" + PARAMS["f"],
+    fetch=lambda n: fetch_page(0, n),
+    items=lambda p: p.get("jobs", []),
+    total=lambda p: p.get("total"),
+    default=DEFAULT_LIMIT,
+)
+
+data = size.first_payload or fetch_page(0, size.limit)
+
+# Page through the rest if the feed outgrew one window
+offset = len(data["jobs"])
+while data.get("total") and offset < data["total"]:
+    page = fetch_page(offset, size.limit)
+    if not page.get("jobs"):
+        break
+    data["jobs"].extend(page["jobs"])
+    offset += len(page["jobs"])
 
 with open("usz_jobs.json", "w", encoding="utf-8") as f:
-    json.dump(data, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+    jsonio.dump(data, f)
\ No newline at end of file
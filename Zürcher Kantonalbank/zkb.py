@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
 import re
+import sys
 from pathlib import Path
 from urllib.parse import urljoin
 
@@ -11,6 +11,9 @@ from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio
+
 URL = "https://apply.refline.ch/792841/search.html"
 OUTFILE = Path("zkb_jobs.json")
 
@@ -132,7 +135,7 @@ def main():
         raise SystemExit("✗ Could not find a jobs table on the page. The structure may have changed.")
 
     data = table_to_json(table, URL)
-    OUTFILE.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    jsonio.write(OUTFILE, data)
     print(f"✓ Extracted {len(data)} rows → {OUTFILE}")
 
 if __name__ == "__main__":
@@ -1,37 +1,41 @@
 """
-Hirslanden (SuccessFactors) job overview scraper — requests + BeautifulSoup only.
+Hirslanden (SuccessFactors) job overview scraper — jobboard.transport + BeautifulSoup.
 
 - Follows the site's real "More Search Results" link when present.
 - Falls back to startrow pagination, auto-detecting per-page from the banner.
 - Saves overview only (title, url, facility, city, job_id) to hirslanden_jobs.json.
 
 Usage:
-  pip install requests beautifulsoup4 lxml
+  pip install httpx beautifulsoup4 lxml
   python hirslanden.py
 """
 
 from __future__ import annotations
-import json
 import re
-import time
-from dataclasses import dataclass, asdict
+import sys
+from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse, urlunparse, urlencode, urljoin, parse_qs
 
-import requests
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import record, transport
+from jobboard.record import Record
+
 START_URL = ("https://careers.mediclinic.com/Hirslanden/search/"
              "?createNewAlert=false&q=&optionsFacetsDD_customfield3="
              "&optionsFacetsDD_country=&optionsFacetsDD_customfield5="
              "&optionsFacetsDD_facility=&optionsFacetsDD_shifttype=")
 
 OUTFILE = "hirslanden_jobs.json"
-POLITE_DELAY = 0.5  # seconds
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; HirslandenScraper/2.0)",
+    "Accept-Language": "de-CH,de;q=0.9,en;q=0.8",
+}
 
 
-@dataclass
-class Job:
+class Job(Record, intern=("facility", "city")):
     title: str
     url: str
     facility: Optional[str] = None
@@ -39,8 +43,8 @@ class Job:
     job_id: Optional[str] = None
 
 
-def get_soup(session: requests.Session, url: str) -> BeautifulSoup:
-    r = session.get(url, timeout=25, allow_redirects=True)
+def get_soup(url: str) -> BeautifulSoup:
+    r = transport.get(url, headers=HEADERS, timeout=25)
     r.raise_for_status()
     return BeautifulSoup(r.text, "lxml")
 
@@ -168,18 +172,12 @@ def update_query(url: str, **params) -> str:
 
 
 def main():
-    session = requests.Session()
-    session.headers.update({
-        "User-Agent": "Mozilla/5.0 (compatible; HirslandenScraper/2.0)",
-        "Accept-Language": "de-CH,de;q=0.9,en;q=0.8",
-    })
-
     all_jobs: list[Job] = []
     visited_pages = set()
 
     # 1) Load first page
     url = START_URL
-    soup = get_soup(session, url)
+    soup = get_soup(url)
     total, window = parse_total_and_window(soup)
     if total:
         print(f"[info] Site reports total={total}, page_window={window or '?'}")
@@ -207,8 +205,7 @@ def main():
             break
 
         # Load next page
-        time.sleep(POLITE_DELAY)
-        soup = get_soup(session, next_url)
+        soup = get_soup(next_url)
         url = next_url
         page_idx += 1
 
@@ -232,7 +229,7 @@ def main():
             page_url = update_query(START_URL, startrow=startrow)
             print(f"[startrow={startrow}] {page_url}")
 
-            soup = get_soup(session, page_url)
+            soup = get_soup(page_url)
             pg_total, pg_window = parse_total_and_window(soup)
             if pg_total and not total:
                 total = pg_total
@@ -255,12 +252,11 @@ def main():
                 break
 
             startrow += per_page
-            time.sleep(POLITE_DELAY)
 
     all_jobs = dedupe(all_jobs)
 
     with open(OUTFILE, "w", encoding="utf-8") as f:
-        json.dump([asdict(j) for j in all_jobs], f, ensure_ascii=False, indent=2)
+        record.dump(all_jobs, f)
 
     print(f"✅ Saved {len(all_jobs)} jobs to {OUTFILE}")
     if total:
@@ -0,0 +1,6 @@
+"""
+Shared building blocks for the jobboard scrapers.
+
+The per-company scripts live in their own folders and stay runnable on their
+own; they put the repository root on ``sys.path`` and import from here.
+"""
@@ -0,0 +1,331 @@
+"""
+Local read-only HTTP query API over the scraped jobs.
+
+Serves the per-source search segments (``jobboard.search``), whose stored
+fields already carry location, workload range, contract type, first_seen,
+canton and resolved coordinates (``jobboard.geo``), so no ``*_jobs.json`` file
+is read per request. Per segment the server keeps location-word, contract and
+canton lookups, and one grid index over all coordinates for radius queries;
+results of a filter set are kept in an LRU cache and paged from there.
+Segments are reloaded when the index changes.
+
+Endpoints (GET only):
+  /jobs      source=a,b  location=bern  workload_min=60  workload_max=100
+             contract=permanent|temporary|internship|apprenticeship|doctoral
+             first_seen_from=2025-09-01  first_seen_to=...  q=pflege*  (full text)
+             canton=BE  near=Bern|46.95,7.44  radius_km=25 (default)
+             limit=50 (max 500)  cursor=<next_cursor of the previous page>
+  /sources   docs per source
+  /health
+
+``/jobs`` streams ``{"items": [...], "total": n, "next_cursor": ...}`` as
+chunked JSON; with ``q`` items are ranked by BM25, with ``near`` nearest first
+(plus ``distance_km``), otherwise newest first_seen first.
+
+Usage:
+  python -m jobboard.api --port 8765
+  curl 'http://127.0.0.1:8765/jobs?q=pflegefach*&location=zurich&workload_min=80'
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from . import geo, jsonio, search
+
+DEFAULT_PORT = 8765
+DEFAULT_LIMIT = 50
+DEFAULT_RADIUS_KM = 25.0
+MAX_LIMIT = 500
+CACHE_SIZE = 256              # filter sets whose full result list is kept
+CHUNK_BYTES = 16 * 1024
+
+_F = {name: i for i, name in enumerate(search.DOC_FIELDS)}
+FILTERS = ("source", "location", "workload_min", "workload_max", "contract", "first_seen_from",
+           "first_seen_to", "q", "canton", "near", "radius_km")
+
+
+class BadRequest(ValueError):
+    pass
+
+
+def _index_version() -> int:
+    try:
+        return search.INDEX_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+
+class Catalog:
+    """The loaded index plus per-segment lookups and the result cache."""
+
+    def __init__(self):
+        self.version = _index_version()
+        self.index = search.Index()
+        self.by_name = {seg.name: seg for seg in self.index.segments}
+        self.places: Dict[str, Dict[str, Set[int]]] = {}
+        self.contracts: Dict[str, Dict[str, Set[int]]] = {}
+        self.cantons: Dict[str, Dict[str, Set[int]]] = {}
+        self.grid = geo.GridIndex()
+        for seg in self.index.segments:
+            places, contracts, cantons = defaultdict(set), defaultdict(set), defaultdict(set)
+            for i, doc in enumerate(seg.docs):
+                for tok in search.tokenize(doc[_F["location"]]):
+                    places[tok].add(i)
+                if doc[_F["contract"]]:
+                    contracts[doc[_F["contract"]]].add(i)
+                if doc[_F["canton"]]:
+                    cantons[doc[_F["canton"]]].add(i)
+                for lat, lon in doc[_F["points"]]:
+                    self.grid.add(lat, lon, (seg.name, i))
+            self.places[seg.name], self.contracts[seg.name], self.cantons[seg.name] = places, contracts, cantons
+        self._cache: "OrderedDict[Tuple, List[Tuple[Optional[float], search.Segment, int]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ---------- querying ----------
+    def _candidates(self, seg: search.Segment, params: Dict[str, str]) -> Optional[Set[int]]:
+        """Doc ids passing the indexed filters (None: no indexed filter given)."""
+        ids: Optional[Set[int]] = None
+        if params.get("location"):
+            for tok in search.tokenize(params["location"]):
+                hit = self.places[seg.name].get(tok, set())
+                ids = hit if ids is None else ids & hit
+            ids = ids if ids is not None else set()
+        if params.get("contract"):
+            hit = self.contracts[seg.name].get(params["contract"], set())
+            ids = hit if ids is None else ids & hit
+        if params.get("canton"):
+            hit = self.cantons[seg.name].get(params["canton"].upper(), set())
+            ids = hit if ids is None else ids & hit
+        return ids
+
+    @staticmethod
+    def _scalar_ok(doc: list, lo: Optional[int], hi: Optional[int], since: Optional[str],
+                   until: Optional[str]) -> bool:
+        if lo is not None or hi is not None:
+            wmin, wmax = doc[_F["workload_min"]], doc[_F["workload_max"]]
+            if wmin is None or (lo is not None and wmax < lo) or (hi is not None and wmin > hi):
+                return False
+        if since or until:
+            seen = doc[_F["first_seen"]]
+            if seen is None or (since and seen < since) or (until and seen > until):
+                return False
+        return True
+
+    def _run(self, params: Dict[str, str]) -> List[Tuple[Optional[float], search.Segment, int]]:
+        names = [n for n in params.get("source", "").split(",") if n] or list(self.by_name)
+        unknown = [n for n in names if n not in self.by_name]
+        if unknown:
+            raise BadRequest(f"unknown source(s): {', '.join(unknown)}")
+        lo, hi = _int(params, "workload_min"), _int(params, "workload_max")
+        since, until = params.get("first_seen_from"), params.get("first_seen_to")
+
+        allowed = {n: self._candidates(self.by_name[n], params) for n in names}
+        distance: Dict[Tuple[str, int], float] = {}
+        if params.get("near"):
+            origin = _origin(params)
+            for d, hit in self.grid.within(*origin, _radius(params)):
+                distance.setdefault(hit, d)  # nearest of a job's places
+            for n in names:
+                near = {doc for (name, doc) in distance if name == n}
+                allowed[n] = near if allowed[n] is None else allowed[n] & near
+
+        if params.get("q"):
+            ranked = self.index.scored(params["q"], names)
+        else:
+            ranked = [(None, self.by_name[n], doc) for n in names for doc in range(len(self.by_name[n].docs))]
+        out = [(score, seg, doc) for score, seg, doc in ranked
+               if (allowed[seg.name] is None or doc in allowed[seg.name])
+               and self._scalar_ok(seg.docs[doc], lo, hi, since, until)]
+        if distance and not params.get("q"):
+            out.sort(key=lambda r: distance[(r[1].name, r[2])])
+        elif not params.get("q"):
+            out.sort(key=lambda r: (r[1].docs[r[2]][_F["first_seen"]] or "", r[1].name), reverse=True)
+        return out
+
+    def results(self, params: Dict[str, str]) -> List[Tuple[Optional[float], search.Segment, int]]:
+        key = tuple(params.get(f, "") for f in FILTERS)
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None:
+                self._cache.move_to_end(key)
+                return hit
+        hit = self._run(params)
+        with self._lock:
+            self._cache[key] = hit
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return hit
+
+
+def _int(params: Dict[str, str], name: str) -> Optional[int]:
+    if not params.get(name):
+        return None
+    try:
+        return int(params[name])
+    except ValueError:
+        raise BadRequest(f"{name} must be an integer") from None
+
+
+def _origin(params: Dict[str, str]) -> Tuple[float, float]:
+    origin = geo.point(params["near"])
+    if origin is None:
+        raise BadRequest(f"unknown place: {params['near']}")
+    return origin
+
+
+def _radius(params: Dict[str, str]) -> float:
+    try:
+        return float(params.get("radius_km") or DEFAULT_RADIUS_KM)
+    except ValueError:
+        raise BadRequest("radius_km must be a number") from None
+
+
+def item_dict(score: Optional[float], seg: search.Segment, doc: int,
+              origin: Optional[Tuple[float, float]] = None) -> Dict[str, object]:
+    d = dict(zip(search.DOC_FIELDS, seg.docs[doc]))
+    d["source"] = seg.name
+    if score is not None:
+        d["score"] = round(score, 4)
+    if origin is not None and d["points"]:
+        d["distance_km"] = round(min(geo.distance_km(*origin, lat, lon) for lat, lon in d["points"]), 1)
+    return d
+
+
+# ---------- cursors ----------
+def encode_cursor(offset: int, version: int) -> str:
+    return base64.urlsafe_b64encode(f"{offset}:{version}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, version: int) -> int:
+    try:
+        offset, ver = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode().split(":")
+        offset, ver = int(offset), int(ver)
+    except ValueError:
+        raise BadRequest("invalid cursor") from None
+    if ver != version:
+        raise BadRequest("stale cursor: the index was rebuilt, restart from the first page")
+    return offset
+
+
+# ---------- server ----------
+_catalog: Optional[Catalog] = None
+_catalog_lock = threading.Lock()
+
+
+def catalog() -> Catalog:
+    """The current catalog, reloaded when a segment was (re)built."""
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None or _catalog.version != _index_version():
+            t0 = time.perf_counter()
+            _catalog = Catalog()
+            print(f"[api] loaded {_catalog.index.num_docs} docs from {len(_catalog.by_name)} sources "
+                  f"in {time.perf_counter() - t0:.2f}s")
+        return _catalog
+
+
+def page(params: Dict[str, str]) -> Iterator[bytes]:
+    """The ``/jobs`` response body, in pieces."""
+    cat = catalog()
+    limit = _int(params, "limit") or DEFAULT_LIMIT
+    if not 0 < limit <= MAX_LIMIT:
+        raise BadRequest(f"limit must be 1..{MAX_LIMIT}")
+    offset = decode_cursor(params["cursor"], cat.version) if params.get("cursor") else 0
+    rows = cat.results(params)
+    origin = _origin(params) if params.get("near") else None
+    chunk = rows[offset:offset + limit]
+    nxt = encode_cursor(offset + limit, cat.version) if offset + limit < len(rows) else None
+
+    def body() -> Iterator[bytes]:
+        yield b'{"items":['
+        for i, row in enumerate(chunk):
+            yield (b"," if i else b"") + jsonio.dumpb(item_dict(*row, origin), pretty=False)
+        yield f'],"total":{len(rows)},"next_cursor":{jsonio.dumps(nxt, pretty=False)}}}'.encode()
+
+    return body()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "jobboard-api"
+    disable_nagle_algorithm = True  # headers and chunks are separate writes
+
+    def log_message(self, fmt, *args):
+        print(f"[api] {self.address_string()} {fmt % args}")
+
+    def _send_json(self, status: int, doc: object) -> None:
+        data = jsonio.dumpb(doc, pretty=False)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _stream(self, pieces: Iterator[bytes]) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        buf = bytearray()
+        for piece in pieces:
+            buf += piece
+            if len(buf) >= CHUNK_BYTES:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(buf), bytes(buf)))
+                buf.clear()
+        if buf:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(buf), bytes(buf)))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        try:
+            if url.path == "/jobs":
+                self._stream(page(params))
+            elif url.path == "/sources":
+                cat = catalog()
+                self._send_json(200, {name: len(seg.docs) for name, seg in cat.by_name.items()})
+            elif url.path == "/health":
+                self._send_json(200, {"ok": True, "docs": catalog().index.num_docs})
+            else:
+                self._send_json(404, {"error": f"no such endpoint: {url.path}"})
+        except BadRequest as e:
+            self._send_json(400, {"error": str(e)})
+
+    def _read_only(self):
+        self._send_json(405, {"error": "read-only API"})
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = _read_only
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = ap.parse_args(argv)
+
+    catalog()
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    print(f"[api] serving on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
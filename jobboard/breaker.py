@@ -0,0 +1,153 @@
+"""
+Per-host circuit breaker for the shared fetch layer.
+
+- closed:    requests pass; ``FAILURE_THRESHOLD`` consecutive failures
+             (transport errors or 5xx) open the circuit. Congestion
+             answers (``throttle.CONGESTION_STATUS``: 429, 502-504) are not
+             failures: the host is up, and the pacing controller and the
+             scrapers' retry loops back off from them.
+- open:      requests fail fast with ``CircuitOpenError`` for ``cooldown``
+             seconds instead of burning timeouts and retry sleeps.
+- half-open: after the cooldown one probe request is let through; success
+             closes the circuit, failure re-opens it with twice the cooldown.
+
+``CircuitOpenError`` is deliberately not an ``httpx``/``requests`` error, so
+the scrapers' own retry loops do not catch it and the source stops at once.
+
+State lives in memory. Open circuits are mirrored to
+``.jobboard/breakers/<host>.json`` when the circuit opens or closes, and a
+process reads that file once, on its first request to the host, so scraper
+subprocesses (and the next scheduled run, until the cooldown ends) start
+with the circuit open.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .paths import STATE_DIR
+from .throttle import CONGESTION_STATUS
+
+BREAKER_DIR = STATE_DIR / "breakers"
+FAILURE_THRESHOLD = 3
+COOLDOWN_S = 120.0
+MAX_COOLDOWN_S = 1800.0
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"circuit open for {host} (next probe in {retry_in:.0f}s)")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class HostBreaker:
+    def __init__(self, host: str):
+        self.host = host
+        self.failures = 0
+        self.open_until: Optional[float] = None  # wall clock, shared with other processes
+        self.cooldown = COOLDOWN_S
+        self.probing = False
+        self._lock = threading.Lock()
+        self._load()
+
+    @property
+    def _file(self):
+        return BREAKER_DIR / f"{self.host.replace(':', '_')}.json"
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self._file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not self.open_until or data["open_until"] > self.open_until:
+            self.open_until, self.cooldown = data["open_until"], data["cooldown"]
+
+    def _save(self) -> None:
+        try:
+            if self.open_until is None:
+                self._file.unlink(missing_ok=True)
+            else:
+                BREAKER_DIR.mkdir(parents=True, exist_ok=True)
+                self._file.write_text(json.dumps({"open_until": self.open_until, "cooldown": self.cooldown,
+                                                  "failures": self.failures}), encoding="utf-8")
+        except OSError:
+            pass  # best effort; the in-process state still works
+
+    def before(self) -> None:
+        """Raise ``CircuitOpenError`` unless a request may go out now."""
+        with self._lock:
+            if self.open_until is None:
+                return
+            now = time.time()
+            if now < self.open_until or self.probing:
+                raise CircuitOpenError(self.host, max(0.0, self.open_until - now))
+            self.probing = True  # half-open: this request is the probe
+
+    def release(self) -> None:
+        """End a request that says nothing about the host's health (only frees the half-open probe)."""
+        with self._lock:
+            self.probing = False
+
+    def after(self, ok: bool) -> None:
+        with self._lock:
+            was_probe, self.probing = self.probing, False
+            if ok:
+                if self.open_until is not None or self.failures:
+                    self.failures, self.open_until, self.cooldown = 0, None, COOLDOWN_S
+                    if was_probe:
+                        print(f"[breaker] {self.host}: closed")
+                        self._save()
+                return
+            self.failures += 1
+            if was_probe:
+                self.cooldown = min(MAX_COOLDOWN_S, self.cooldown * 2)
+            if was_probe or self.failures >= FAILURE_THRESHOLD:
+                self.open_until = time.time() + self.cooldown
+                print(f"[breaker] {self.host}: open for {self.cooldown:.0f}s after {self.failures} failure(s)")
+                self._save()
+
+    def state(self) -> Dict[str, Any]:
+        with self._lock:
+            state = "closed" if self.open_until is None else ("half-open" if self.probing else "open")
+            return {"state": state, "failures": self.failures, "open_until": self.open_until}
+
+
+_breakers: Dict[str, HostBreaker] = {}
+_lock = threading.Lock()
+
+
+def for_host(host: str) -> HostBreaker:
+    with _lock:
+        b = _breakers.get(host)
+        if b is None:
+            b = _breakers[host] = HostBreaker(host)
+        return b
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    with _lock:
+        breakers = list(_breakers.values())
+    return {b.host: b.state() for b in breakers}
+
+
+def call(host: str, send: Callable[[], Any]) -> Any:
+    """Run ``send()`` (returns an httpx/requests response) behind ``host``'s breaker."""
+    b = for_host(host)
+    b.before()
+    try:
+        response = send()
+    except Exception:
+        b.after(False)
+        raise
+    except BaseException:
+        b.release()  # e.g. KeyboardInterrupt: says nothing about the host
+        raise
+    if response.status_code in CONGESTION_STATUS:
+        b.release()  # busy, not down: left to the pacing controller and retry loops
+    else:
+        b.after(response.status_code < 500)
+    return response
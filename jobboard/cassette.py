@@ -0,0 +1,114 @@
+"""
+Record and replay HTTP traffic of the shared transport.
+
+- ``record``: requests go to the network as usual and every response (status,
+  headers, raw body) is stored under the cassette directory.
+- ``replay``: responses are served from the cassette; nothing touches the
+  network, so profiles and parser changes can be compared run to run.
+  A request that was never recorded raises ``httpx.ConnectError``.
+
+Entries are keyed by method, full URL (with query) and request body, and
+stored as ``<dir>/<host>/<sha1>.json``.
+
+Only requests over ``jobboard.transport`` are covered: the in-process
+adapters except ``umantis`` and the scripts that call ``transport.get`` /
+``transport.post`` (Bern, fenaco, Hirslanden, Insel, USZ, Post, ...).
+Scrapers that keep their own ``requests.Session`` or ``httpx.Client``
+(Lidl, Helsana, Schindler, CHUV, EPFL, ETH, ZKB, HOCH, Genf) still go to
+the network in both modes.
+
+Settings travel in the environment so script subprocesses inherit them:
+  JOBBOARD_HTTP_MODE     record | replay
+  JOBBOARD_CASSETTE_DIR  cassette directory (default .jobboard/cassettes)
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .paths import STATE_DIR
+
+MODES = ("record", "replay")
+CASSETTE_DIR = STATE_DIR / "cassettes"
+
+
+def enable(http_mode: str, directory: Optional[Path] = None) -> None:
+    if http_mode not in MODES:
+        raise ValueError(f"Unknown HTTP mode {http_mode!r} (expected one of {', '.join(MODES)})")
+    os.environ["JOBBOARD_HTTP_MODE"] = http_mode
+    os.environ["JOBBOARD_CASSETTE_DIR"] = str(directory or CASSETTE_DIR)
+
+
+def _entry_path(directory: Path, request: httpx.Request) -> Path:
+    h = hashlib.sha1()
+    h.update(request.method.encode())
+    h.update(b" ")
+    h.update(str(request.url).encode())
+    h.update(b"\n")
+    h.update(request.read())
+    host = request.url.host or "_"
+    return directory / host / f"{h.hexdigest()}.json"
+
+
+class RecordingTransport(httpx.BaseTransport):
+    def __init__(self, inner: httpx.BaseTransport, directory: Path):
+        self.inner = inner
+        self.directory = Path(directory)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self.inner.handle_request(request)
+        try:
+            body = response.read()  # still content-encoded at this layer
+        finally:
+            response.close()
+        entry: Dict[str, Any] = {
+            "method": request.method,
+            "url": str(request.url),
+            "status": response.status_code,
+            "headers": [[k.decode("latin-1"), v.decode("latin-1")] for k, v in response.headers.raw],
+            "body": base64.b64encode(body).decode("ascii"),
+        }
+        path = _entry_path(self.directory, request)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(entry), encoding="utf-8")
+        os.replace(tmp, path)
+        return httpx.Response(response.status_code, headers=response.headers.raw, content=body,
+                              extensions=response.extensions, request=request)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class ReplayTransport(httpx.BaseTransport):
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        path = _entry_path(self.directory, request)
+        if not path.exists():
+            raise httpx.ConnectError(f"not in cassette: {request.method} {request.url}", request=request)
+        entry = json.loads(path.read_text(encoding="utf-8"))
+        headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in entry["headers"]]
+        return httpx.Response(entry["status"], headers=headers, content=base64.b64decode(entry["body"]),
+                              request=request)
+
+
+def transport_from_env(**transport_kwargs) -> Optional[httpx.BaseTransport]:
+    """The transport for ``$JOBBOARD_HTTP_MODE``, or None for plain network access."""
+    http_mode = os.environ.get("JOBBOARD_HTTP_MODE")
+    if not http_mode:
+        return None
+    directory = Path(os.environ.get("JOBBOARD_CASSETTE_DIR") or CASSETTE_DIR)
+    if http_mode == "replay":
+        return ReplayTransport(directory)
+    if http_mode == "record":
+        return RecordingTransport(httpx.HTTPTransport(**transport_kwargs), directory)
+    raise ValueError(f"Unknown JOBBOARD_HTTP_MODE {http_mode!r}")
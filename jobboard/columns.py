@@ -0,0 +1,335 @@
+"""
+Dictionary-encoded categorical columns in the snapshots.
+
+Most of a snapshot's bytes are the same few strings over and over:
+"LANDI Schweiz AG", "unbefristet", Rolex ``site``/``contract``, the
+Bundesverwaltung ``attributes`` lists (``verwaltungseinheit``, ``region``,
+``lohnklasse``). ``store.archive`` writes those fields as small integer codes
+and ``store.read`` puts the strings back:
+
+- columns: the normalized ``employer``, ``location`` and ``contract``
+  (``store.normalize`` / ``store.contract_type``) plus the source's own
+  categorical fields, learned once from the first items archived (string or
+  string-list leaves, at most ``MAX_DEPTH`` deep, present in most items and
+  with few distinct values) and kept in ``codes.json``;
+- code tables: one per column per source, in ``codes.json``, append-only,
+  so a code means the same value in every snapshot of the source;
+- on disk each snapshot line carries the row's codes (a plain code for a
+  single-valued column, a list of codes for a list-valued one, null where
+  the item has no such value) and the item with every encoded leaf replaced
+  by ``0``. Decoded items hold the tables' own string objects, so a value
+  is in memory once however many postings carry it;
+- a ``Frame`` holds a single-valued column as an ``array('i')`` of codes
+  (``-1`` = missing) and a list-valued one as ``offsets`` into a flat
+  ``codes`` array, read from the codes alone without parsing an item.
+
+Group-bys over many daily snapshots then count ints and decode each
+distinct value once.
+
+Usage:
+  python -m jobboard.columns bundesverwaltung --by attributes.region
+  python -m jobboard.columns rolex --by site --all       # every snapshot
+  python -m jobboard.columns --rebuild                   # re-encode every source's snapshots
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import jsonio, registry, store
+
+CODES_FILE = "codes.json"
+CODES_VERSION = 2
+NORMALIZED = ("employer", "location", "contract")
+MAX_DEPTH = 3
+MIN_PRESENCE = 0.5     # a learned column must be set in at least half the items
+MAX_DISTINCT = 0.3     # ... and have at most this many distinct values per value seen
+MAX_VALUE_LEN = 120
+PLACEHOLDER = 0        # stands in the stored item for an encoded leaf
+
+
+class CodeTable:
+    """Value <-> code, append-only."""
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: List[str] = list(values)
+        self.index: Dict[str, int] = {v: i for i, v in enumerate(self.values)}
+
+    def code(self, value: str) -> int:
+        c = self.index.get(value)
+        if c is None:
+            c = self.index[value] = len(self.values)
+            self.values.append(value)
+        return c
+
+    def __getitem__(self, code: int) -> str:
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@dataclass
+class Column:
+    codes: array = field(default_factory=lambda: array("i"))
+    offsets: Optional[array] = None  # list-valued: row i is codes[offsets[i]:offsets[i + 1]]
+
+    def row(self, i: int) -> Tuple[int, ...]:
+        if self.offsets is None:
+            c = self.codes[i]
+            return (c,) if c >= 0 else ()
+        return tuple(self.codes[self.offsets[i]:self.offsets[i + 1]])
+
+
+@dataclass
+class Frame:
+    """One snapshot's categorical columns, rows in snapshot (key) order."""
+    source: str
+    stamp: str
+    keys: List[str]
+    columns: Dict[str, Column]
+    tables: Dict[str, CodeTable]
+
+    def counts(self, name: str) -> Counter:
+        """Rows per value of ``name`` (a list-valued row counts once for each value)."""
+        table = self.tables[name]
+        return Counter({table[code]: n for code, n in Counter(self.columns[name].codes).items() if code >= 0})
+
+    def values(self, name: str, i: int) -> List[str]:
+        table = self.tables[name]
+        return [table[c] for c in self.columns[name].row(i)]
+
+
+# ---------- learned columns ----------
+def _single(value: Any) -> bool:
+    return isinstance(value, str) and len(value) <= MAX_VALUE_LEN
+
+
+def _multi(value: Any) -> bool:
+    return isinstance(value, list) and all(_single(v) for v in value)
+
+
+def _leaves(node: Any, prefix: Tuple[str, ...], depth: int, out: Dict[Tuple[str, ...], Any]) -> None:
+    for k, v in node.items():
+        path = prefix + (str(k),)
+        if isinstance(v, dict) and depth > 1:
+            _leaves(v, path, depth - 1, out)
+        elif _single(v) or _multi(v):
+            out[path] = v
+
+
+def learn_fields(items: List[Dict[str, Any]]) -> Tuple[List[List[str]], List[str]]:
+    """Field paths whose values repeat enough to be worth a code table, and which of them hold lists."""
+    values: Dict[Tuple[str, ...], Counter] = {}
+    present: Counter = Counter()
+    lists: Counter = Counter()
+    for item in items:
+        leaves: Dict[Tuple[str, ...], Any] = {}
+        _leaves(item, (), MAX_DEPTH, leaves)
+        for path, v in leaves.items():
+            if path[0] in store.VOLATILE_FIELDS or ".".join(path) in NORMALIZED:  # a raw "location" would shadow ours
+                continue
+            present[path] += 1
+            lists[path] += isinstance(v, list)
+            values.setdefault(path, Counter()).update(v if isinstance(v, list) else [v])
+    n = len(items)
+    fields, listed = [], []
+    for path, counts in values.items():
+        if present[path] >= MIN_PRESENCE * n and len(counts) <= max(1, MAX_DISTINCT * sum(counts.values())):
+            fields.append(list(path))
+            if lists[path] * 2 > present[path]:
+                listed.append(".".join(path))
+    return sorted(fields), sorted(listed)
+
+
+def _get(item: Any, path: List[str]) -> Any:
+    for part in path:
+        if not isinstance(item, dict):
+            return None
+        item = item.get(part)
+    return item
+
+
+def _replaced(node: Dict[str, Any], path: List[str], value: Any) -> Dict[str, Any]:
+    """Copy of ``node`` with the leaf at ``path`` set to ``value`` (only the dicts on the path are copied)."""
+    node = dict(node)
+    node[path[0]] = value if len(path) == 1 else _replaced(node[path[0]], path[1:], value)
+    return node
+
+
+def _set(node: Dict[str, Any], path: List[str], value: Any) -> None:
+    for part in path[:-1]:
+        node = node[part]
+    node[path[-1]] = value
+
+
+# ---------- codec ----------
+class Codec:
+    """A source's learned columns and code tables: encodes items for the snapshot and decodes them back."""
+
+    def __init__(self, name: str, fields: Optional[List[List[str]]] = None, lists: Iterable[str] = (),
+                 tables: Optional[Dict[str, CodeTable]] = None):
+        self.name = name
+        self.fields = fields  # None until learned
+        self.lists = set(lists)
+        self.tables: Dict[str, CodeTable] = tables or {}
+
+    @property
+    def path(self) -> Path:
+        return store.source_dir(self.name) / CODES_FILE
+
+    @classmethod
+    def load(cls, name: str) -> "Codec":
+        """The saved codec; a fresh one if there is none (or one of an older layout)."""
+        codec = cls(name)
+        try:
+            doc = json.loads(codec.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return codec
+        if doc.get("version") != CODES_VERSION:
+            return codec
+        return cls(name, doc["fields"], doc["lists"],
+                   {col: CodeTable(vals) for col, vals in doc["tables"].items()})
+
+    def save(self) -> None:
+        path = self.path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        doc = {"version": CODES_VERSION, "fields": self.fields, "lists": sorted(self.lists),
+               "tables": {col: t.values for col, t in sorted(self.tables.items())}}
+        jsonio.write(tmp, doc, pretty=False)
+        tmp.replace(path)
+
+    @property
+    def learned(self) -> bool:
+        return self.fields is not None
+
+    def learn(self, items: List[Dict[str, Any]]) -> None:
+        if self.fields is None:
+            self.fields, lists = learn_fields(items)
+            self.lists = set(lists)
+
+    @property
+    def names(self) -> List[str]:
+        return list(NORMALIZED) + [".".join(p) for p in self.fields or ()]
+
+    def _table(self, column: str) -> CodeTable:
+        table = self.tables.get(column)
+        if table is None:
+            table = self.tables[column] = CodeTable()
+        return table
+
+    def _code(self, column: str, value: str) -> int:
+        return self._table(column).code(value)
+
+    def encode(self, item: Dict[str, Any], source: registry.Source) -> Tuple[List[Any], Dict[str, Any]]:
+        """(codes, item as stored): one code (or list of codes, or None) per column in ``names`` order."""
+        norm = store.normalize(item, source)
+        norm["contract"] = store.contract_type(norm["title"], store.description(item))
+        codes: List[Any] = [self._code(n, norm[n]) if norm[n] else None for n in NORMALIZED]
+        stored = item
+        for path in self.fields or ():
+            name = ".".join(path)
+            value = _get(item, path)
+            code: Any = None
+            if name in self.lists:
+                if _multi(value):
+                    table = self._table(name)  # decoding looks it up even for an empty list
+                    code = [table.code(v) for v in value]
+            elif _single(value):
+                code = self._code(name, value)
+            codes.append(code)
+            if code is not None:
+                stored = _replaced(stored, path, PLACEHOLDER)
+        return codes, stored
+
+    def decode(self, codes: List[Any], item: Dict[str, Any]) -> Dict[str, Any]:
+        """Put the encoded values back into ``item`` (in place)."""
+        for path, code in zip(self.fields or (), codes[len(NORMALIZED):]):
+            if code is None:
+                continue
+            table = self.tables[".".join(path)]
+            _set(item, path, [table[c] for c in code] if isinstance(code, list) else table[code])
+        return item
+
+
+# ---------- frames ----------
+def load(source: registry.Source, snapshot: Path) -> Frame:
+    """The snapshot's categorical columns, from the stored codes (lines of older snapshots are encoded)."""
+    codec = Codec.load(source.name)
+    if not codec.learned:
+        codec.learn([item for _, _, item in islice(store.read(snapshot), store.LEARN_SAMPLE)])
+    names = codec.names
+    columns = {n: Column(offsets=array("i", [0]) if n in codec.lists else None) for n in names}
+    cols = [columns[n] for n in names]
+    keys: List[str] = []
+    grown = False
+    for key, _, raw in store.read_index(snapshot):
+        codes_text, sep, item_text = raw.partition("\t")
+        if sep:
+            codes = json.loads(codes_text)
+        else:  # written before snapshots were encoded
+            codes, _ = codec.encode(json.loads(raw), source)
+            grown = True
+        keys.append(key)
+        for col, code in zip(cols, codes):
+            if col.offsets is None:
+                col.codes.append(-1 if code is None else code)
+            else:
+                col.codes.extend(code or ())
+                col.offsets.append(len(col.codes))
+    if grown:
+        codec.save()
+    return Frame(source.name, store.stamp_of(snapshot), keys, columns, codec.tables)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("sources", nargs="*", help="source names (default with --rebuild: all)")
+    ap.add_argument("--by", help="column to count values of")
+    ap.add_argument("--all", action="store_true", help="every snapshot, not just the latest")
+    ap.add_argument("--rebuild", action="store_true", help="re-encode the source's snapshots")
+    ap.add_argument("-n", type=int, default=20, help="values to show")
+    args = ap.parse_args(argv)
+
+    sources = [registry.get_source(n) for n in args.sources] if args.sources else registry.load_sources()
+    for source in sources:
+        snaps = store.snapshots(source.name)
+        if not snaps:
+            continue
+        if args.rebuild:
+            before = sum(p.stat().st_size for p in snaps)
+            store.rewrite(source)
+            after = sum(p.stat().st_size for p in snaps)
+            print(f"[columns] {source.name}: {len(snaps)} snapshot(s), {before // 1024} KB -> {after // 1024} KB")
+        if not args.all:
+            snaps = snaps[-1:]
+        if not args.by:
+            codec = Codec.load(source.name)
+            print(f"{source.name}: " + ", ".join(
+                f"{n}{'[]' if n in codec.lists else ''} ({len(codec.tables.get(n, ()))})" for n in codec.names))
+            continue
+        total: Counter = Counter()
+        for snap in snaps:
+            frame = load(source, snap)
+            if args.by not in frame.columns:
+                print(f"[columns] {source.name}: no column {args.by!r} ({', '.join(frame.columns)})",
+                      file=sys.stderr)
+                return 1
+            total.update(frame.counts(args.by))
+        print(f"{source.name} by {args.by} ({len(snaps)} snapshot(s)):")
+        for value, n in total.most_common(args.n):
+            print(f"{n:7d}  {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""
+Cross-source near-duplicate postings with MinHash + LSH.
+
+The same vacancy often appears in several feeds (an agency's own portal and
+Bundesverwaltung, LANDI/Volg teasers on fenaco, hospital ohws feeds and
+aggregators). Exact ``(title, url)`` matching cannot see those, so:
+
+- every item is normalized (``store.normalize``) to title, location, employer
+  and turned into shingles: character 5-grams of the title (accents, gender
+  markers and workload percentages removed) plus location and employer words,
+- each shingle set gets a ``NUM_BINS``-slot MinHash signature (one hash per
+  shingle, binned and densified, so the cost is linear in the shingles),
+- signatures are cut into ``BANDS`` bands of ``ROWS`` slots; items sharing a
+  band land in the same bucket, and only cross-source pairs within a bucket
+  are compared. No all-pairs pass.
+
+A candidate pair is a duplicate when the shingle Jaccard is >= ``THRESHOLD``
+and location and employer do not contradict each other (when both are known,
+most words of the shorter one must occur in the longer), so "Verkäufer/in" at
+Volg Schafisheim and at Lidl Kriens, or Kanton Zürich and Kanton St.Gallen, stay apart.
+
+Matches are merged into clusters and written to ``.jobboard/duplicates.json``.
+
+Usage:
+  python -m jobboard.dedup                     # every source with an output file
+  python -m jobboard.dedup bundesverwaltung insel usz --threshold 0.7 --print
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import sys
+import time
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from . import jsonio, registry, store
+from .paths import STATE_DIR
+
+OUTPUT = STATE_DIR / "duplicates.json"
+SHINGLE = 5
+NUM_BINS = 64
+BANDS, ROWS = 16, 4           # P(candidate) = 1 - (1 - s^4)^16: ~0.5 at s=0.5, >0.95 at s=0.7
+THRESHOLD = 0.6
+MAX_BUCKET = 500              # buckets larger than this are generic titles, not duplicates
+
+_BIN_BITS = NUM_BINS.bit_length() - 1
+_EMPTY = 1 << 64
+_GENDER_RE = re.compile(r"\((?:[mwfhdxae]\s*/\s*)*[mwfhdxae]\)|\b[mwfh]\s*/\s*[mwfh](?:\s*/\s*[dx])?\b", re.I)
+_PERCENT_RE = re.compile(r"\d+\s*(?:-|–|bis|à)?\s*\d*\s*%")
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+_FILLER = frozenset({"ag", "sa", "gmbh", "schweiz", "suisse", "svizzera", "ch", "und", "et", "der", "die", "das",
+                     "des", "de", "du", "la", "le", "les", "fur", "pour", "in", "im", "am", "bei", "b"})
+
+
+@dataclass
+class Record:
+    source: str
+    key: str
+    title: str
+    location: Optional[str]
+    employer: Optional[str]
+    url: Optional[str]
+    shingles: FrozenSet[str]
+    place: FrozenSet[str]
+    org: FrozenSet[str]
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {"source": self.source, "key": self.key, "title": self.title,
+                "location": self.location, "employer": self.employer, "url": self.url}
+
+
+# ---------- shingling ----------
+def clean(text: Optional[str]) -> str:
+    """Lowercase ASCII words: no accents, gender markers, percentages or punctuation."""
+    if not text:
+        return ""
+    text = _PERCENT_RE.sub(" ", _GENDER_RE.sub(" ", text))
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+    return " ".join(_NON_WORD_RE.sub(" ", text).split())
+
+
+def words(text: Optional[str]) -> FrozenSet[str]:
+    return frozenset(w for w in clean(text).split() if w not in _FILLER and not w.isdigit())
+
+
+def shingles(title: Optional[str], location: Optional[str], employer: Optional[str]) -> FrozenSet[str]:
+    t = clean(title)
+    out: Set[str] = {t[i:i + SHINGLE] for i in range(max(1, len(t) - SHINGLE + 1))} if t else set()
+    out.update("l:" + w for w in words(location))
+    out.update("e:" + w for w in words(employer))
+    return frozenset(out)
+
+
+# ---------- MinHash / LSH ----------
+def _hash64(s: str) -> int:
+    return int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def signature(shingle_set: Iterable[str]) -> List[int]:
+    """One-permutation MinHash: min hash per bin, empty bins filled from the next bin to the right."""
+    sig = [_EMPTY] * NUM_BINS
+    for s in shingle_set:
+        h = _hash64(s)
+        b, v = h & (NUM_BINS - 1), h >> _BIN_BITS
+        if v < sig[b]:
+            sig[b] = v
+    if all(v == _EMPTY for v in sig):
+        return sig
+    for b in range(NUM_BINS):
+        if sig[b] == _EMPTY:
+            step = 1
+            while sig[(b + step) % NUM_BINS] >= _EMPTY:
+                step += 1
+            sig[b] = _EMPTY + sig[(b + step) % NUM_BINS] * NUM_BINS + step  # distinct from real mins
+    return sig
+
+
+def band_keys(sig: List[int]) -> Iterable[Tuple[int, int]]:
+    for band in range(BANDS):
+        yield band, hash(tuple(sig[band * ROWS:(band + 1) * ROWS]))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+def compatible(a: FrozenSet[str], b: FrozenSet[str]) -> bool:
+    """Unknown on either side, or more than half of the shorter word set is shared."""
+    return not a or not b or 2 * len(a & b) > min(len(a), len(b))
+
+
+# ---------- records ----------
+def load_records(sources: Iterable[registry.Source]) -> List[Record]:
+    records: List[Record] = []
+    for source in sources:
+        items = store.load_items(source)
+        if not items:
+            continue
+        keyer = store.keyer_for(source, items)
+        for item in items:
+            fields = store.normalize(item, source)
+            if not fields["title"]:
+                continue
+            records.append(Record(source.name, keyer.key(item), fields["title"], fields["location"],
+                                  fields["employer"], fields["url"],
+                                  shingles(fields["title"], fields["location"], fields["employer"]),
+                                  words(fields["location"]), words(fields["employer"])))
+    return records
+
+
+def candidate_pairs(records: List[Record]) -> Set[Tuple[int, int]]:
+    buckets: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+    for i, rec in enumerate(records):
+        if rec.shingles:
+            for bk in band_keys(signature(rec.shingles)):
+                buckets[bk].append(i)
+    pairs: Set[Tuple[int, int]] = set()
+    for members in buckets.values():
+        if len(members) < 2 or len(members) > MAX_BUCKET:
+            continue
+        for x in range(len(members)):
+            i = members[x]
+            for j in members[x + 1:]:
+                if records[i].source != records[j].source:
+                    pairs.add((i, j))
+    return pairs
+
+
+def find_duplicates(records: List[Record], threshold: float = THRESHOLD) -> List[Dict[str, object]]:
+    """Clusters of cross-source near-duplicates, largest first."""
+    parent = list(range(len(records)))
+
+    def root(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    best: Dict[int, float] = {}
+    for i, j in candidate_pairs(records):
+        a, b = records[i], records[j]
+        if not (compatible(a.place, b.place) and compatible(a.org, b.org)):
+            continue
+        sim = jaccard(a.shingles, b.shingles)
+        if sim >= threshold:
+            ri, rj = root(i), root(j)
+            if ri != rj:
+                parent[rj] = ri
+            best[i] = max(best.get(i, 0.0), sim)
+            best[j] = max(best.get(j, 0.0), sim)
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for i in best:
+        groups[root(i)].append(i)
+    clusters = []
+    for members in groups.values():
+        members.sort(key=lambda i: (records[i].source, records[i].key))
+        clusters.append({"sources": sorted({records[i].source for i in members}),
+                         "similarity": round(min(best[i] for i in members), 3),
+                         "members": [records[i].to_dict() for i in members]})
+    clusters.sort(key=lambda c: (-len(c["members"]), c["members"][0]["title"]))
+    return clusters
+
+
+def write(clusters: List[Dict[str, object]], records: int, threshold: float, path: Path = OUTPUT) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    doc = {"generated": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()), "threshold": threshold,
+           "records": records, "clusters": clusters}
+    jsonio.write(path, doc)
+    return path
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("sources", nargs="*", help="source names (default: all)")
+    ap.add_argument("--threshold", type=float, default=THRESHOLD, help="minimum Jaccard similarity")
+    ap.add_argument("--out", type=Path, default=OUTPUT)
+    ap.add_argument("--print", action="store_true", help="print every cluster")
+    args = ap.parse_args(argv)
+
+    sources = [registry.get_source(n) for n in args.sources] if args.sources else registry.load_sources()
+    t0 = time.perf_counter()
+    records = load_records(sources)
+    clusters = find_duplicates(records, args.threshold)
+    path = write(clusters, len(records), args.threshold, args.out)
+    print(f"[dedup] {len(records)} postings, {len(clusters)} cross-source clusters "
+          f"in {time.perf_counter() - t0:.1f}s -> {path}")
+    if args.print:
+        for c in clusters:
+            print(f"\n{c['similarity']:.2f}  {', '.join(c['sources'])}")
+            for m in c["members"]:
+                print(f"  {m['source']:<18} {m['title']} | {m['location'] or '-'} | {m['employer'] or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
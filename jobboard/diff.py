@@ -0,0 +1,127 @@
+"""
+Added / removed / modified postings between two snapshots of a source.
+
+Snapshots (``jobboard.store``) are sorted by key, so the diff is one merge
+pass over two streams: memory stays constant however large the sources are,
+and unchanged jobs are skipped on their fingerprint without parsing their JSON.
+
+Usage:
+  python -m jobboard.diff migros                 # latest run vs. the one before
+  python -m jobboard.diff migros --since 20250906T000000Z --jsonl > changes.jsonl
+  python -m jobboard.diff --all                  # summary for every source
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from . import store
+
+ADDED, REMOVED, MODIFIED = "added", "removed", "modified"
+
+
+@dataclass
+class Change:
+    kind: str
+    key: str
+    old: Optional[str] = None  # raw snapshot row before
+    new: Optional[str] = None  # raw snapshot row after
+    source: str = ""           # whose code tables the rows use
+
+    def to_dict(self) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"kind": self.kind, "key": self.key}
+        if self.old is not None:
+            d["old"] = store.decode(self.source, self.old)
+        if self.new is not None:
+            d["new"] = store.decode(self.source, self.new)
+        return d
+
+
+_END = object()
+
+
+def diff_paths(old_path: Optional[Path], new_path: Path) -> Iterator[Change]:
+    """Stream the changes from ``old_path`` to ``new_path`` (no old snapshot: all added)."""
+    name = new_path.parent.name
+    old_rows = store.read_index(old_path) if old_path else iter(())
+    new_rows = store.read_index(new_path)
+    o = next(old_rows, _END)
+    n = next(new_rows, _END)
+    while o is not _END or n is not _END:
+        if n is _END or (o is not _END and o[0] < n[0]):
+            yield Change(REMOVED, o[0], old=o[2], source=name)
+            o = next(old_rows, _END)
+        elif o is _END or n[0] < o[0]:
+            yield Change(ADDED, n[0], new=n[2], source=name)
+            n = next(new_rows, _END)
+        else:
+            if o[1] != n[1]:
+                yield Change(MODIFIED, n[0], old=o[2], new=n[2], source=name)
+            o = next(old_rows, _END)
+            n = next(new_rows, _END)
+
+
+def pick(name: str, since: Optional[str] = None) -> Tuple[Optional[Path], Optional[Path]]:
+    """(old, new) snapshots: latest vs. the previous one, or vs. the last one at/before ``since``."""
+    paths = store.snapshots(name)
+    if not paths:
+        return None, None
+    new = paths[-1]
+    if since:
+        older = [p for p in paths[:-1] if store.stamp_of(p) <= since]
+        return (older[-1] if older else None), new
+    return (paths[-2] if len(paths) > 1 else None), new
+
+
+def diff_source(name: str, since: Optional[str] = None) -> Iterator[Change]:
+    old, new = pick(name, since)
+    if new is None:
+        return iter(())
+    return diff_paths(old, new)
+
+
+def summarize(changes: Iterator[Change]) -> Dict[str, int]:
+    counts = {ADDED: 0, REMOVED: 0, MODIFIED: 0}
+    for c in changes:
+        counts[c.kind] += 1
+    return counts
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("sources", nargs="*")
+    ap.add_argument("--all", action="store_true", help="every source with snapshots")
+    ap.add_argument("--since", metavar="STAMP", help="compare against the last snapshot at/before this stamp")
+    ap.add_argument("--jsonl", action="store_true", help="print every change as a JSON line")
+    args = ap.parse_args(argv)
+
+    names = list(args.sources)
+    if args.all and store.SNAPSHOT_DIR.exists():
+        names += sorted(p.name for p in store.SNAPSHOT_DIR.iterdir() if p.is_dir())
+    if not names:
+        ap.error("name at least one source (or --all)")
+
+    for name in names:
+        old, new = pick(name, args.since)
+        if new is None:
+            print(f"[diff] {name}: no snapshots", file=sys.stderr)
+            continue
+        changes = diff_paths(old, new)
+        if args.jsonl:
+            for c in changes:
+                print(json.dumps({"source": name, **c.to_dict()}, ensure_ascii=False))
+            continue
+        counts = summarize(changes)
+        since = store.stamp_of(old) if old else "-"
+        print(f"{name:<22} {since} -> {store.stamp_of(new)}  "
+              f"+{counts[ADDED]} -{counts[REMOVED]} ~{counts[MODIFIED]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
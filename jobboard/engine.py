@@ -0,0 +1,163 @@
+"""
+Runs registry sources through their platform adapters.
+
+- Sources on the same host run one after another (politeness); different
+  hosts run concurrently on a small thread pool.
+- Adapter payloads are written to the source's output file; the collected
+  count (and the site total, if the adapter did not report one) is read back
+  from that file via ``source.items`` / ``source.total``.
+- Requests and bytes are attributed to the running source for the run report;
+  request timings and output writes go to ``jobboard.metrics``.
+- Each successful run is archived as a snapshot (``jobboard.store``, its
+  categorical fields dictionary-encoded by ``jobboard.columns``), diffed
+  against the previous one for the report and folded into the
+  posting-lifetime history (``jobboard.history``); its full-text index
+  segment is rebuilt from that snapshot (``jobboard.search``). The
+  change count feeds the source's refresh interval (``jobboard.schedule``).
+- Before crawling, adapters with a ``probe`` fetch their first page only; if
+  its total and top postings match the last full crawl (``jobboard.probes``)
+  the source is skipped and keeps its current output and snapshot, whose
+  jobs the history records as still open that day.
+- A failing source is recorded and never stops the others.
+- With profiling enabled (``jobboard.profiling``) each in-process adapter run
+  is profiled; script adapters profile their own subprocess.
+"""
+
+from __future__ import annotations
+
+import time
+import traceback
+from collections import defaultdict
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import (diff, history, jsonio, jsonstream, metrics, probes, profiling, schedule, search, store,
+               transport)
+from .platforms import get_adapter
+from .registry import Source
+
+DEFAULT_WORKERS = 4
+
+
+@dataclass
+class SourceRun:
+    source: Source
+    ok: bool = False
+    error: Optional[str] = None
+    collected: Optional[int] = None
+    reported_total: Optional[int] = None
+    requests: Optional[int] = None
+    bytes: Optional[int] = None
+    seconds: float = 0.0
+    changes: Optional[Dict[str, int]] = None  # added/removed/modified since the last snapshot
+    skipped: bool = False                     # the probe saw no change; the output was kept
+
+
+def write_output(source: Source, payload: Any) -> None:
+    path = source.output_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        jsonio.dump(payload, f)
+
+
+def read_counts(source: Source) -> Tuple[Optional[int], Optional[int]]:
+    """(collected, reported total) as found in the source's output file."""
+    path = source.output_path
+    if path is None or not path.exists():
+        return None, None
+    collected = sum(1 for _ in jsonstream.iter_records(path, source.items or ""))
+    if not collected and not isinstance(jsonstream.value_at(path, source.items or ""), list):
+        collected = None
+    total = jsonstream.value_at(path, source.total) if source.total else None
+    return collected, total if isinstance(total, int) else None
+
+
+def _probe(adapter, source: Source) -> Optional[probes.Signature]:
+    """The adapter's first-page signature; None if it has no probe or the probe failed."""
+    if not hasattr(adapter, "probe"):
+        return None
+    try:
+        with transport.source_scope(source.name), metrics.stage_timer("probe"):
+            return adapter.probe(source)
+    except Exception as e:
+        print(f"[{source.name}] probe failed ({type(e).__name__}: {e}), crawling in full")
+        return None
+
+
+def _skip(run: SourceRun) -> None:
+    source = run.source
+    run.collected, run.reported_total = read_counts(source)
+    run.changes = {diff.ADDED: 0, diff.REMOVED: 0, diff.MODIFIED: 0}
+    run.ok = run.skipped = True
+    schedule.record_unchanged(source.name)
+    history.update(source.name, stamp=store.stamp_now())  # still open today
+
+
+def _crawl(run: SourceRun, result) -> None:
+    """Write the adapter's payload, count it, snapshot it and derive the rest from the snapshot."""
+    source = run.source
+    if result.payload is not None:
+        with metrics.stage_timer("write"):
+            write_output(source, result.payload)
+    run.collected, total_in_file = read_counts(source)
+    run.reported_total = result.reported_total if result.reported_total is not None else total_in_file
+    run.ok = True
+    with metrics.stage_timer("snapshot"):
+        snapshot = store.archive(source)
+        if snapshot:
+            run.changes = diff.summarize(diff.diff_source(source.name))
+            schedule.record(source.name, run.changes)
+            history.update(source.name, snapshot)
+            search.build_segment(source, snapshot)
+
+
+def run_source(source: Source, probe: bool = True) -> SourceRun:
+    run = SourceRun(source)
+    t0 = time.perf_counter()
+    result = None
+    try:
+        adapter = get_adapter(source.platform)
+        signature = _probe(adapter, source) if probe else None
+        if signature is not None and source.output_path.exists() and probes.unchanged(source.name, signature):
+            _skip(run)
+        else:
+            profiled = profiling.mode() and getattr(adapter, "IN_PROCESS", True)
+            with transport.source_scope(source.name):  # write/snapshot stage timings belong to the source too
+                with profiling.profile(source.name) if profiled else nullcontext():
+                    result = adapter.fetch(source)
+                _crawl(run, result)
+            if signature is not None:
+                probes.remember(source.name, signature)
+    except Exception as e:
+        run.error = f"{type(e).__name__}: {e}"
+        traceback.print_exc()
+    run.seconds = time.perf_counter() - t0
+
+    usage = transport.usage(source.name)
+    if result is not None and result.usage:
+        usage = {k: usage.get(k, 0) + result.usage.get(k, 0) for k in ("requests", "bytes")}
+    if usage["requests"]:
+        run.requests, run.bytes = usage["requests"], usage["bytes"]
+    status = "unchanged (probe), skipped" if run.skipped else "ok" if run.ok else f"FAILED ({run.error})"
+    print(f"[{source.name}] {status} — {run.collected} jobs in {run.seconds:.1f}s")
+    return run
+
+
+def _run_group(sources: List[Source], probe: bool = True) -> List[SourceRun]:
+    return [run_source(s, probe) for s in sources]
+
+
+def runnable(sources: Iterable[Source]) -> List[Source]:
+    return [s for s in sources if s.platform and s.output_path]
+
+
+def run_all(sources: Iterable[Source], workers: int = DEFAULT_WORKERS, probe: bool = True) -> List[SourceRun]:
+    groups: Dict[str, List[Source]] = defaultdict(list)
+    for s in runnable(sources):
+        groups[s.host].append(s)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(lambda group: _run_group(group, probe), groups.values()))
+    return [run for group in results for run in group]
@@ -0,0 +1,269 @@
+"""
+Free-text job locations -> Swiss places, and a grid index for radius queries.
+
+Sources spell locations every which way: "Genève", "Biel/Bienne", "Zürich
+Seebach", "Bellinzona, Svizzera", "Ebikon, Luzern, CH", "Muri (AG)",
+"Tessin (TI)", "Bern / Homeoffice (Bern)", "Eschlikon 100". ``resolve_all``
+splits such a string into place candidates, drops postal codes, workload
+numbers and country suffixes, and looks every candidate up in a bundled
+offline gazetteer (``data/ch_places.csv``: place, canton, approximate centre
+coordinates, alternate names). A canton in the text ("(AG)", "Kt. Zug",
+", Aargau, CH") picks between same-named places; if no place matches, the
+canton itself (``data/ch_cantons.csv``) is returned with ``precision="canton"``.
+Lookups are memoized; a scrape repeats the same few hundred strings.
+
+``GridIndex`` buckets points into ``CELL_KM`` squares, so "within 25 km of
+Bern" visits a handful of cells instead of every job.
+
+Usage:
+  python -m jobboard.geo "Zürich Seebach" "Tessin (TI)"
+  python -m jobboard.geo --near Bern --km 25       # jobs from the search index
+  python -m jobboard.geo --unresolved              # most frequent misses
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+import re
+import sys
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+PLACES_CSV = DATA_DIR / "ch_places.csv"
+CANTONS_CSV = DATA_DIR / "ch_cantons.csv"
+CELL_KM = 10.0
+EARTH_KM = 6371.0
+KM_PER_DEG_LAT = 110.57
+KM_PER_DEG_LON = 111.32 * math.cos(math.radians(46.8))  # Switzerland's mid latitude
+
+_COUNTRY = r"(?:ch|schweiz|suisse|svizzera|switzerland)"
+_TRIPLE_RE = re.compile(rf"^(?P<city>[^,]+),\s*(?P<region>[^,]+),\s*{_COUNTRY}$")
+_COUNTRY_RE = re.compile(rf"(?:,\s*|\(){_COUNTRY}\)?\s*$")
+_CANTON_CODE_RE = re.compile(r"\(([a-z]{2})\)|\s([a-z]{2})$")
+_CANTON_WORD_RE = re.compile(r"\b(?:kt\.?|kanton|canton|cantone)\s+([a-z\-]+(?:\.?\s[a-z\-]+)?)")
+_SPLIT_RE = re.compile(r"\s*(?:/|,|;|\s-\s|\bund/oder\b|\bund\b|\boder\b|\bet\b|\bou\b|\band\b|\bor\b|\be\b)\s*")
+_PAREN_RE = re.compile(r"\(([^)]*)\)")
+_NUMBER_RE = re.compile(r"\b\d+(?:\s*-\s*\d+)?\b")
+_KEY_RE = re.compile(r"[^a-z0-9]+")
+
+
+@dataclass(frozen=True)
+class Place:
+    name: str
+    canton: str
+    lat: float
+    lon: float
+    precision: str = "place"  # or "canton"
+
+
+def key(text: str) -> str:
+    """Lookup key: lowercase, no accents, punctuation as single spaces ("St.Gallen" -> "st gallen")."""
+    text = unicodedata.normalize("NFKD", text.replace("ß", "ss"))
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    return " ".join(_KEY_RE.sub(" ", text).split())
+
+
+# ---------- gazetteer ----------
+class Gazetteer:
+    def __init__(self, places_csv: Path = PLACES_CSV, cantons_csv: Path = CANTONS_CSV):
+        self.places: Dict[str, List[Place]] = defaultdict(list)
+        self.cantons: Dict[str, Place] = {}
+        self.canton_names: Dict[str, str] = {}
+        with open(cantons_csv, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                code = row["code"]
+                self.cantons[code] = Place(row["names"].split("|")[0], code, float(row["lat"]), float(row["lon"]),
+                                           "canton")
+                for name in [code] + row["names"].split("|"):
+                    self.canton_names[key(name)] = code
+        with open(places_csv, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                place = Place(row["name"], row["canton"], float(row["lat"]), float(row["lon"]))
+                for name in [row["name"]] + [a for a in (row["aliases"] or "").split("|") if a]:
+                    self.places[key(name)].append(place)
+
+    def place(self, k: str, canton: Optional[str] = None) -> Optional[Place]:
+        found = self.places.get(k)
+        if not found:
+            return None
+        return next((p for p in found if p.canton == canton), found[0])
+
+    def canton(self, text: str) -> Optional[str]:
+        return self.canton_names.get(key(text))
+
+
+@lru_cache(maxsize=1)
+def gazetteer() -> Gazetteer:
+    return Gazetteer()
+
+
+def _canton_hint(gaz: Gazetteer, text: str) -> Optional[str]:
+    m = _CANTON_WORD_RE.search(text)
+    if m:
+        code = gaz.canton(m.group(1)) or gaz.canton(m.group(1).split()[0])
+        if code:
+            return code
+    for m in _CANTON_CODE_RE.finditer(text):
+        code = (m.group(1) or m.group(2)).upper()
+        if code in gaz.cantons:
+            return code
+    return None
+
+
+def _lookup(gaz: Gazetteer, part: str, canton: Optional[str]) -> Optional[Place]:
+    """Whole part, then its leading words, then any run of words (longest first)."""
+    words = key(_NUMBER_RE.sub(" ", part)).split()
+    if not words:
+        return None
+    for n in range(len(words), 0, -1):
+        hit = gaz.place(" ".join(words[:n]), canton)
+        if hit:
+            return hit
+    for n in range(len(words) - 1, 0, -1):
+        for i in range(1, len(words) - n + 1):
+            phrase = " ".join(words[i:i + n])
+            if len(phrase) >= 4:
+                hit = gaz.place(phrase, canton)
+                if hit:
+                    return hit
+    return None
+
+
+@lru_cache(maxsize=8192)
+def resolve_all(text: Optional[str]) -> Tuple[Place, ...]:
+    """Every place named in ``text`` (in order, without repeats); a canton if no place is known."""
+    if not text:
+        return ()
+    gaz = gazetteer()
+    low = " ".join(text.lower().split())
+    m = _TRIPLE_RE.match(low)
+    if m:  # "Ebikon, Luzern, CH": city, region, country
+        canton = gaz.canton(m.group("region")) or _canton_hint(gaz, low)
+        hit = _lookup(gaz, m.group("city"), canton)
+        if hit:
+            return (hit,)
+        return (gaz.cantons[canton],) if canton else ()
+    low = _COUNTRY_RE.sub("", low)
+    asides = _PAREN_RE.findall(low)  # "Interlaken (Bern)": a hint, only a place if nothing else is
+    canton = _canton_hint(gaz, low) or next(filter(None, map(gaz.canton, asides)), None)
+
+    def parts(text: str) -> List[str]:
+        return [p for p in _SPLIT_RE.split(text) if p and not (len(p) == 2 and p.upper() in gaz.cantons)]
+
+    low = _CANTON_WORD_RE.sub(" / ", low)  # "Cham - Kt. Zug": the canton is only a hint
+    main_parts, aside_parts = parts(_PAREN_RE.sub(" ", low)), [p for a in asides for p in parts(a)]
+    for group in (main_parts, aside_parts):
+        out: List[Place] = []
+        for part in group:
+            hit = _lookup(gaz, part, canton)
+            if hit and hit not in out:
+                out.append(hit)
+        if out:
+            return tuple(out)
+    for part in main_parts + aside_parts:
+        code = gaz.canton(_NUMBER_RE.sub(" ", part))
+        if code:
+            return (gaz.cantons[code],)
+    return (gaz.cantons[canton],) if canton else ()
+
+
+def resolve(text: Optional[str]) -> Optional[Place]:
+    found = resolve_all(text)
+    return found[0] if found else None
+
+
+# ---------- spatial index ----------
+def distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class GridIndex:
+    """Points bucketed into ``cell_km`` squares (equirectangular, fine at Swiss scale)."""
+
+    def __init__(self, cell_km: float = CELL_KM):
+        self.cell_km = cell_km
+        self.cells: Dict[Tuple[int, int], List[Tuple[float, float, Any]]] = defaultdict(list)
+        self.size = 0
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return (int(math.floor(lon * KM_PER_DEG_LON / self.cell_km)),
+                int(math.floor(lat * KM_PER_DEG_LAT / self.cell_km)))
+
+    def add(self, lat: float, lon: float, value: Any) -> None:
+        self.cells[self._cell(lat, lon)].append((lat, lon, value))
+        self.size += 1
+
+    def within(self, lat: float, lon: float, km: float) -> List[Tuple[float, Any]]:
+        """``(distance_km, value)`` for every point within ``km``, nearest first."""
+        cx, cy = self._cell(lat, lon)
+        reach = int(math.ceil(km / self.cell_km))
+        out = []
+        for x in range(cx - reach, cx + reach + 1):
+            for y in range(cy - reach, cy + reach + 1):
+                for plat, plon, value in self.cells.get((x, y), ()):
+                    d = distance_km(lat, lon, plat, plon)
+                    if d <= km:
+                        out.append((d, value))
+        out.sort(key=lambda r: r[0])
+        return out
+
+
+def point(text: str) -> Optional[Tuple[float, float]]:
+    """``"46.95,7.44"`` or a place name -> (lat, lon)."""
+    try:
+        lat, lon = (float(v) for v in text.split(","))
+        return lat, lon
+    except ValueError:
+        place = resolve(text)
+        return (place.lat, place.lon) if place else None
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("texts", nargs="*", help="location strings to resolve")
+    ap.add_argument("--near", help="place name or lat,lon")
+    ap.add_argument("--km", type=float, default=25.0)
+    ap.add_argument("--unresolved", action="store_true", help="list unresolved locations in the search index")
+    args = ap.parse_args(argv)
+
+    for text in args.texts:
+        found = resolve_all(text)
+        print(f"{text!r}: " + ("; ".join(f"{p.name} ({p.canton}) {p.lat:.3f},{p.lon:.3f} [{p.precision}]"
+                                         for p in found) or "-"))
+    if not (args.near or args.unresolved):
+        return 0
+
+    from . import search  # the index is only needed for these two
+    index = search.Index()
+    loc, title = search.DOC_FIELDS.index("location"), search.DOC_FIELDS.index("title")
+    if args.unresolved:
+        misses = Counter(doc[loc] for seg in index.segments for doc in seg.docs if doc[loc] and not resolve(doc[loc]))
+        for text, n in misses.most_common(50):
+            print(f"{n:5d}  {text}")
+    if args.near:
+        origin = point(args.near)
+        if origin is None:
+            print(f"[geo] unknown place: {args.near}", file=sys.stderr)
+            return 1
+        grid, points = GridIndex(), search.DOC_FIELDS.index("points")
+        for seg in index.segments:
+            for doc in seg.docs:
+                for lat, lon in doc[points]:
+                    grid.add(lat, lon, (seg.name, doc[title], doc[loc]))
+        for d, (source, job, where) in grid.within(*origin, args.km):
+            print(f"{d:5.1f} km  {source:<18} {job} | {where}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
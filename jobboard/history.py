@@ -0,0 +1,222 @@
+"""
+Posting lifetimes and daily open-job counts per source.
+
+Built from the snapshots in ``jobboard.store`` (the last one of each day)
+into ``.jobboard/history/<source>.json``:
+
+- ``days``:   the observed days, delta-encoded date ordinals
+- ``counts``: open jobs on each observed day
+- ``jobs``:   per job key, the runs of observed days it was listed in, as
+              delta-encoded ``[start, length, gap, length, ...]`` indices into
+              ``days``. first_seen / last_seen follow from the first and last run.
+
+A job listed for a year costs a handful of ints, not 365 copies. Daily counts
+are stored pre-aggregated, so ``daily_counts()`` is a single file read.
+
+Usage:
+  python -m jobboard.history migros              # daily open jobs
+  python -m jobboard.history migros --lifetimes  # key, first_seen, last_seen, days open
+  python -m jobboard.history --rebuild --all     # from every stored snapshot
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from . import jsonio, store
+from .paths import STATE_DIR
+
+HISTORY_DIR = STATE_DIR / "history"
+
+
+def _day_of(stamp: str) -> int:
+    return dt.date(int(stamp[:4]), int(stamp[4:6]), int(stamp[6:8])).toordinal()
+
+
+def _iso(ordinal: int) -> str:
+    return dt.date.fromordinal(ordinal).isoformat()
+
+
+def _delta(values: List[int]) -> List[int]:
+    return [v - (values[i - 1] if i else 0) for i, v in enumerate(values)]
+
+
+def _undelta(deltas: List[int]) -> List[int]:
+    out, acc = [], 0
+    for d in deltas:
+        acc += d
+        out.append(acc)
+    return out
+
+
+class History:
+    """One source's history; ``runs[key]`` is a flat ``[s0, e0, s1, e1, ...]`` of day indices."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.days: List[int] = []
+        self.counts: List[int] = []
+        self.runs: Dict[str, List[int]] = {}
+
+    @property
+    def path(self) -> Path:
+        return HISTORY_DIR / f"{self.name}.json"
+
+    # ---------- persistence ----------
+    @classmethod
+    def load(cls, name: str) -> "History":
+        h = cls(name)
+        if h.path.exists():
+            doc = json.loads(h.path.read_text(encoding="utf-8"))
+            h.days = _undelta(doc["days"])
+            h.counts = doc["counts"]
+            for key, enc in doc["jobs"].items():
+                # [start, length, gap, length, ...] -> [s0, e0, s1, e1, ...] (inclusive ends)
+                flat, pos = [], 0
+                for i, v in enumerate(enc):
+                    if i % 2 == 0:
+                        pos += v
+                        flat.append(pos)
+                    else:
+                        pos += v - 1
+                        flat.append(pos)
+                h.runs[key] = flat
+        return h
+
+    def save(self) -> Path:
+        jobs = {}
+        for key, flat in self.runs.items():
+            enc, prev_end = [], 0
+            for i in range(0, len(flat), 2):
+                s, e = flat[i], flat[i + 1]
+                enc += [s - prev_end, e - s + 1]
+                prev_end = e
+            jobs[key] = enc
+        doc = {"source": self.name, "days": _delta(self.days), "counts": self.counts, "jobs": jobs}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        jsonio.write(tmp, doc, pretty=False)
+        tmp.replace(self.path)
+        return self.path
+
+    # ---------- updates ----------
+    def _drop_last_day(self) -> None:
+        last = len(self.days) - 1
+        for key in list(self.runs):
+            flat = self.runs[key]
+            if flat[-1] == last:
+                if flat[-2] == last:
+                    del flat[-2:]
+                else:
+                    flat[-1] = last - 1
+                if not flat:
+                    del self.runs[key]
+        self.days.pop()
+        self.counts.pop()
+
+    def add_day(self, day: int, keys: Iterable[str]) -> None:
+        """Record the jobs open on ``day``; a later run of the last day replaces it."""
+        if self.days and day < self.days[-1]:
+            raise ValueError(f"{self.name}: {_iso(day)} is before the last recorded day {_iso(self.days[-1])}")
+        if self.days and day == self.days[-1]:
+            self._drop_last_day()
+        idx = len(self.days)
+        self.days.append(day)
+        n = 0
+        for key in keys:
+            n += 1
+            flat = self.runs.get(key)
+            if flat is None:
+                self.runs[key] = [idx, idx]
+            elif flat[-1] == idx - 1:
+                flat[-1] = idx  # still open: extend the current run
+            elif flat[-1] != idx:
+                flat += [idx, idx]  # re-listed after a gap
+        self.counts.append(n)
+
+    # ---------- queries ----------
+    def daily_counts(self) -> List[Tuple[str, int]]:
+        return [(_iso(d), c) for d, c in zip(self.days, self.counts)]
+
+    def lifetimes(self) -> Iterator[Tuple[str, str, str, int]]:
+        """(key, first_seen, last_seen, observed days open)."""
+        for key, flat in self.runs.items():
+            open_days = sum(flat[i + 1] - flat[i] + 1 for i in range(0, len(flat), 2))
+            yield key, _iso(self.days[flat[0]]), _iso(self.days[flat[-1]]), open_days
+
+    def open_on(self, date: str) -> Set[str]:
+        day = dt.date.fromisoformat(date).toordinal()
+        if day not in self.days:
+            return set()
+        idx = self.days.index(day)
+        return {k for k, flat in self.runs.items()
+                if any(flat[i] <= idx <= flat[i + 1] for i in range(0, len(flat), 2))}
+
+
+def _daily_snapshots(name: str) -> Dict[int, Path]:
+    """Last snapshot of each day."""
+    by_day: Dict[int, Path] = {}
+    for path in store.snapshots(name):
+        by_day[_day_of(store.stamp_of(path))] = path  # oldest first, so the last one wins
+    return by_day
+
+
+def _keys(path: Path) -> Iterator[str]:
+    return (key for key, _, _ in store.read_index(path))
+
+
+def update(name: str, snapshot: Optional[Path] = None, stamp: Optional[str] = None) -> History:
+    """Fold the newest snapshot (or ``snapshot``) into the source's history, as of its own day or ``stamp``'s.
+
+    A run skipped as unchanged (``jobboard.probes``) writes no snapshot; passing its ``stamp`` records
+    the newest snapshot's jobs as still open that day. ``rebuild`` only sees the snapshots' own days.
+    """
+    h = History.load(name)
+    snapshot = snapshot or (store.snapshots(name) or [None])[-1]
+    if snapshot is None:
+        return h
+    h.add_day(_day_of(stamp or store.stamp_of(snapshot)), _keys(snapshot))
+    h.save()
+    return h
+
+
+def rebuild(name: str) -> History:
+    h = History(name)
+    for day, path in sorted(_daily_snapshots(name).items()):
+        h.add_day(day, _keys(path))
+    h.save()
+    return h
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("sources", nargs="*")
+    ap.add_argument("--all", action="store_true", help="every source with snapshots")
+    ap.add_argument("--rebuild", action="store_true", help="rebuild from all stored snapshots first")
+    ap.add_argument("--lifetimes", action="store_true", help="print per-job first/last seen instead of counts")
+    args = ap.parse_args(argv)
+
+    names = list(args.sources)
+    if args.all and store.SNAPSHOT_DIR.exists():
+        names += sorted(p.name for p in store.SNAPSHOT_DIR.iterdir() if p.is_dir())
+    if not names:
+        ap.error("name at least one source (or --all)")
+
+    for name in names:
+        h = rebuild(name) if args.rebuild else History.load(name)
+        if args.lifetimes:
+            for key, first, last, days in sorted(h.lifetimes(), key=lambda r: r[1]):
+                print(f"{name}\t{key}\t{first}\t{last}\t{days}")
+        else:
+            for day, count in h.daily_counts():
+                print(f"{name}\t{day}\t{count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Small BeautifulSoup helpers shared by the HTML adapters."""
+
+from __future__ import annotations
+
+import re
+from typing import Callable, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, NavigableString, PageElement, Tag
+
+_WS_RE = re.compile(r"\s+")
+
+
+def soup(html: str) -> BeautifulSoup:
+    try:
+        return BeautifulSoup(html, "lxml")
+    except Exception:  # lxml not installed
+        return BeautifulSoup(html, "html.parser")
+
+
+def text(node: Optional[Tag]) -> str:
+    """Visible text with collapsed whitespace (and no non-breaking spaces)."""
+    if node is None:
+        return ""
+    return _WS_RE.sub(" ", node.get_text(" ", strip=True).replace("\xa0", " ")).strip()
+
+
+def _after(node: PageElement) -> Optional[PageElement]:
+    """First node after ``node``'s subtree in document order."""
+    while node is not None:
+        if node.next_sibling is not None:
+            return node.next_sibling
+        node = node.parent
+    return None
+
+
+def segment_by_anchors(root: Tag, is_boundary: Callable[[Tag], bool]) -> List[Tuple[Tag, List[str]]]:
+    """
+    Split ``root`` into blocks in a single pass over its descendants.
+
+    Every anchor for which ``is_boundary(a)`` holds opens a block; the block
+    collects the text that follows the anchor inside the anchor's parent, up
+    to the next boundary anchor. Text inside the anchor itself is skipped.
+    Returns ``[(anchor, [text, ...]), ...]`` in document order; the cost is
+    linear in the size of the document regardless of the number of blocks.
+    """
+    blocks: List[Tuple[Tag, List[str]]] = []
+    texts: Optional[List[str]] = None
+    block_end = anchor_end = None
+    in_anchor = False
+
+    for node in root.descendants:
+        if node is block_end:
+            texts, block_end = None, None
+        if node is anchor_end:
+            in_anchor, anchor_end = False, None
+
+        if isinstance(node, Tag):
+            if node.name == "a" and is_boundary(node):
+                texts = []
+                blocks.append((node, texts))
+                block_end = _after(node.parent) if node.parent is not None else None
+                anchor_end = _after(node)
+                in_anchor = True
+            continue
+
+        if texts is None or in_anchor or type(node) is not NavigableString:
+            continue
+        t = node.strip()
+        if t:
+            texts.append(t)
+    return blocks
@@ -0,0 +1,75 @@
+"""
+JSON writing for scrapers and tooling.
+
+- Backend: orjson when installed (several times faster than the stdlib
+  encoder and writes UTF-8 bytes directly), ``json`` otherwise. Values orjson
+  cannot encode (ints beyond 64 bits, ...) fall back to ``json`` per call.
+- Compact by default (no whitespace): output files are read by machines, and
+  ``indent=2`` roughly doubled the big ones (migros, lidl, raiffeisen).
+- Pretty (2-space indent) only on request: ``pretty=True`` per call, or for a
+  whole run with ``run.py --pretty-json`` / ``JOBBOARD_JSON=pretty``, which
+  script subprocesses inherit.
+
+Non-ASCII text is written as is (``ensure_ascii=False``) in both modes.
+
+Usage:
+  from jobboard import jsonio
+  with open("jobs.json", "w", encoding="utf-8") as f:
+      jsonio.dump(jobs, f)
+  jsonio.write(Path("jobs.json"), jobs, pretty=True)
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+from pathlib import Path
+from typing import IO, Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+ENV = "JOBBOARD_JSON"
+MODES = ("compact", "pretty")
+
+
+def enable(mode: str) -> None:
+    if mode not in MODES:
+        raise ValueError(f"Unknown JSON mode {mode!r} (expected one of {', '.join(MODES)})")
+    os.environ[ENV] = mode
+
+
+def pretty_default() -> bool:
+    return os.environ.get(ENV) == "pretty"
+
+
+def dumpb(obj: Any, pretty: Optional[bool] = None) -> bytes:
+    """``obj`` as UTF-8 JSON bytes."""
+    pretty = pretty_default() if pretty is None else pretty
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0))
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any, pretty: Optional[bool] = None) -> str:
+    return dumpb(obj, pretty).decode("utf-8")
+
+
+def dump(obj: Any, f: IO, pretty: Optional[bool] = None) -> None:
+    """Write ``obj`` to a text (UTF-8) or binary file."""
+    if isinstance(f, io.TextIOBase):
+        f.write(dumps(obj, pretty))
+    else:
+        f.write(dumpb(obj, pretty))
+
+
+def write(path: Union[str, Path], obj: Any, pretty: Optional[bool] = None) -> None:
+    Path(path).write_bytes(dumpb(obj, pretty))
@@ -0,0 +1,17 @@
+"""Dotted paths into JSON documents, e.g. ``"result.hits"`` or ``"message.jobs"``."""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+
+def get_path(doc: Any, path: Optional[str], default: Any = None) -> Any:
+    """Follow ``path`` through nested dicts; ``""``/``None`` returns ``doc`` itself."""
+    if not path:
+        return doc
+    cur = doc
+    for part in path.split("."):
+        if not isinstance(cur, dict) or part not in cur:
+            return default
+        cur = cur[part]
+    return cur
@@ -0,0 +1,241 @@
+"""
+Incremental reader for large JSON dumps.
+
+Streams the elements of one array inside a JSON document without loading
+the document: the file is decoded chunk by chunk, values on the way to the
+array are skipped by a bracket/string scanner (never built), and every array
+element is parsed on its own with ``json.JSONDecoder.raw_decode``. Memory is
+bounded by the largest single record, not the file.
+
+- BOMs are detected and stripped (UTF-8, UTF-16, UTF-32), e.g. the
+  ``kanton Zürich/download.json`` dump starts with a UTF-8 BOM.
+- The array is found by dotted path (``"jobs"``, ``"result.hits"``); with
+  several candidate paths the first one present in document order wins.
+  A top-level array is streamed as is.
+
+Usage:
+  from jobboard import jsonstream
+  for job in jsonstream.iter_records("kanton Zürich/download.json", "jobs"): ...
+  total = jsonstream.value_at("Bundesverwaltung/jobs.json", "total")
+
+  python -m jobboard.jsonstream "kanton Zürich/download.json" --path jobs --jsonl > jobs.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import codecs
+import json
+import re
+import sys
+from pathlib import Path
+from typing import IO, Any, Iterator, List, Optional, Sequence, Tuple, Union
+
+DEFAULT_PATHS = ("jobs", "hits", "items", "result.hits")
+CHUNK_CHARS = 64 * 1024
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"), (codecs.BOM_UTF32_BE, "utf-32"),  # before UTF-16: same first bytes
+    (codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_WS_RE = re.compile(r"[ \t\n\r]*")
+_STRUCT_RE = re.compile(r'["{}\[\]]')
+_NUMBER_TAIL = frozenset("0123456789.eE+-")
+_STRING_REST_RE = re.compile(r'(?:[^"\\]|\\.)*"', re.S)  # after the opening quote
+
+Source = Union[str, Path, IO[bytes]]
+
+
+def sniff_encoding(head: bytes) -> str:
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    return "utf-8"
+
+
+class JSONStream:
+    """A cursor over a JSON text that is read and decoded on demand."""
+
+    def __init__(self, f: IO[bytes], chunk_chars: int = CHUNK_CHARS):
+        head = f.read(4)
+        self._f = f
+        self._decoder = codecs.getincrementaldecoder(sniff_encoding(head))()
+        self._json = json.JSONDecoder()
+        self.chunk = chunk_chars
+        self.buf = self._decoder.decode(head)
+        self.pos = 0
+        self.eof = False
+
+    # ---------- buffer ----------
+    def _fill(self) -> bool:
+        """Append the next chunk (dropping what was consumed); False at end of input."""
+        if self.eof:
+            return False
+        data = self._f.read(self.chunk)
+        text = self._decoder.decode(data, final=not data)
+        self.eof = not data
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at the end)."""
+        while True:
+            self.pos = _WS_RE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str) -> None:
+        got = self.peek()
+        if got != ch:
+            raise ValueError(f"expected {ch!r}, got {got or 'end of input'!r}")
+        self.pos += 1
+
+    # ---------- values ----------
+    def value(self) -> Any:
+        """Parse the next value (re-reading more input while it is cut off)."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._json.raw_decode(self.buf, self.pos)
+                # a number is only complete once something other than a digit, ".", "e" or sign follows it
+                if self.eof or (end < len(self.buf) and self.buf[end] not in _NUMBER_TAIL):
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def skip(self) -> None:
+        """Step over the next value without building it."""
+        c = self.peek()
+        if c not in "{[":
+            self.value()  # scalar or string: small
+            return
+        depth = 0
+        while True:
+            m = _STRUCT_RE.search(self.buf, self.pos)
+            if m is None:
+                self.pos = len(self.buf)
+                if not self._fill():
+                    raise ValueError("unexpected end of input")
+                continue
+            ch = m.group()
+            if ch == '"':
+                rest = _STRING_REST_RE.match(self.buf, m.end())
+                if rest is None:  # string runs past the buffer
+                    self.pos = m.start()
+                    if not self._fill():
+                        raise ValueError("unterminated string")
+                    continue
+                self.pos = rest.end()
+                continue
+            self.pos = m.end()
+            depth += 1 if ch in "{[" else -1
+            if depth == 0:
+                return
+
+    def items(self) -> Iterator[Any]:
+        """Elements of the array starting here."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            c = self.peek()
+            self.pos += 1
+            if c == "]":
+                return
+            if c != ",":
+                raise ValueError(f"expected ',' or ']' in array, got {c or 'end of input'!r}")
+
+    # ---------- navigation ----------
+    def seek(self, paths: Sequence[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+        """Move to the value at the first of ``paths`` found in document order; returns that path."""
+        if any(not p for p in paths):
+            return ()
+        if self.peek() != "{":
+            self.skip()
+            return None
+        self.pos += 1
+        first = True
+        while True:
+            c = self.peek()
+            if c == "}":
+                self.pos += 1
+                return None
+            if not first:
+                self.expect(",")
+            first = False
+            key = self.value()
+            self.expect(":")
+            deeper = [p[1:] for p in paths if p[0] == key]
+            if deeper:
+                found = self.seek(deeper)
+                if found is not None:
+                    return (key,) + found
+                continue  # not below this key after all; seek() consumed its value
+            self.skip()
+
+
+def _split(paths: Union[str, Sequence[str], None]) -> List[List[str]]:
+    if paths is None or isinstance(paths, str):
+        paths = [paths or ""]
+    return [p.split(".") if p else [] for p in paths]
+
+
+def _open(src: Source):
+    return src if hasattr(src, "read") else open(src, "rb")
+
+
+def iter_records(src: Source, paths: Union[str, Sequence[str], None] = DEFAULT_PATHS,
+                 chunk_chars: int = CHUNK_CHARS) -> Iterator[Any]:
+    """Lazily yield the elements of the array at ``paths`` (a top-level array is used as is)."""
+    f = _open(src)
+    try:
+        s = JSONStream(f, chunk_chars)
+        if s.peek() == "[":
+            yield from s.items()
+            return
+        found = s.seek(_split(paths))
+        if found is not None and s.peek() == "[":
+            yield from s.items()
+    finally:
+        if f is not src:
+            f.close()
+
+
+def value_at(src: Source, path: str, default: Any = None) -> Any:
+    """The value at dotted ``path``, skipping (not building) everything before it."""
+    f = _open(src)
+    try:
+        s = JSONStream(f)
+        return s.value() if s.seek(_split(path)) is not None else default
+    finally:
+        if f is not src:
+            f.close()
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("file", type=Path)
+    ap.add_argument("--path", action="append", help=f"array path, repeatable (default: {', '.join(DEFAULT_PATHS)})")
+    ap.add_argument("--jsonl", action="store_true", help="print every record as a JSON line (default: count)")
+    args = ap.parse_args(argv)
+
+    n = 0
+    for record in iter_records(args.file, args.path or DEFAULT_PATHS):
+        n += 1
+        if args.jsonl:
+            print(json.dumps(record, ensure_ascii=False))
+    if not args.jsonl:
+        print(n)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
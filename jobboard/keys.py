@@ -0,0 +1,155 @@
+"""
+Stable, cheap keys for de-duplicating job items.
+
+- Learns the identifying field of a source once, from the first page it sees,
+  and reuses that decision for every later item (one dict lookup per item).
+- If no id field is usable, hashes the whole item minus ``VOLATILE_FIELDS``
+  and timestamp-like fields (``fingerprint(item, identity=True)``) with a
+  fast non-cryptographic hash (xxhash when installed, an 8-byte blake2b
+  otherwise) instead of SHA-256, so items that differ only in a nested or
+  optional field keep apart, and a shifted page offset or a new
+  ``dateModified`` does not make a new key.
+
+Usage:
+  keyer = ItemKeyer()
+  keyer.learn(first_page_items)   # optional; the first key() call learns too
+  key = keyer.key(item)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+try:
+    import xxhash
+except ImportError:  # optional speed-up
+    xxhash = None
+
+# Same candidates the scrapers probed by hand, in order of preference
+ID_FIELDS: Tuple[str, ...] = (
+    "id", "jobId", "jobID", "job_id", "guid", "uuid",
+    "jobReference", "reference", "slug", "url", "detailUrl", "applyUrl",
+    "jobItemId",
+    # stable detail links of the HTML scrapers
+    "teaser_url", "stelle_url", "detail_url", "linkDetailPage", "link",
+)
+NESTED_ID_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("link", "url"),
+    ("links", "self"),
+    ("meta", "id"),
+    ("document", "id"),
+)
+
+# Page offsets etc. that change without the job changing
+VOLATILE_FIELDS = frozenset({"source_offset", "source_context", "scraped_at", "fetched_at"})
+# Field names that look like timestamps: they change when a posting is edited, so they never identify it
+TIMESTAMP_FIELD_RE = re.compile(r"date|time|stamp|modified|updated|created|published|_at$", re.I)
+KEYER_VERSION = 2  # bump when learned decisions must be redone (see store.keyer_for)
+
+Field = Union[str, Tuple[str, str]]
+_SCALARS = (str, int)
+_SEP = "\x1f"
+
+
+def fast_hash(text: str) -> str:
+    """64-bit hex digest; stable across runs (unlike the builtin hash())."""
+    data = text.encode("utf-8", "surrogatepass")
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def identifying(field: str) -> bool:
+    """False for volatile and timestamp-like fields."""
+    return field not in VOLATILE_FIELDS and not TIMESTAMP_FIELD_RE.search(field)
+
+
+def fingerprint(item: Dict[str, Any], identity: bool = False) -> str:
+    """Hash of the item's canonical JSON, minus ``VOLATILE_FIELDS`` (and timestamp-like fields with ``identity``)."""
+    stable = {k: v for k, v in item.items() if (identifying(k) if identity else k not in VOLATILE_FIELDS)}
+    return fast_hash(json.dumps(stable, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str))
+
+
+def _get(item: dict, field: Field):
+    if isinstance(field, tuple):
+        outer = item.get(field[0])
+        return outer.get(field[1]) if isinstance(outer, dict) else None
+    return item.get(field)
+
+
+def _label(field: Field) -> str:
+    return ".".join(field) if isinstance(field, tuple) else field
+
+
+class ItemKeyer:
+    """Per-source item keying with a cached field decision."""
+
+    def __init__(self,
+                 id_fields: Sequence[str] = ID_FIELDS,
+                 nested_fields: Sequence[Tuple[str, str]] = NESTED_ID_FIELDS,
+                 content_fields: Optional[Sequence[str]] = None):
+        self._candidates: Tuple[Field, ...] = tuple(id_fields) + tuple(nested_fields)
+        self.field: Optional[Field] = None
+        content_fields = [f for f in content_fields or () if identifying(f)]
+        self.content_fields: Optional[Tuple[str, ...]] = tuple(content_fields) or None
+        self.by_content = False  # no usable id field: key on the item's fingerprint
+        self._label = ""
+
+    @property
+    def learned(self) -> bool:
+        return self.field is not None or self.content_fields is not None or self.by_content
+
+    def learn(self, items: Iterable[dict]) -> None:
+        """
+        Pick the first candidate id field that is a scalar on every item of
+        the sample and unique within it. Otherwise key items on their
+        fingerprint (unless ``content_fields`` were given explicitly).
+        """
+        sample = [it for it in items if isinstance(it, dict)]
+        if not sample:
+            return
+
+        for field in self._candidates:
+            values = [_get(it, field) for it in sample]
+            if all(isinstance(v, _SCALARS) for v in values) and len(set(values)) == len(values):
+                self.field = field
+                self._label = _label(field)
+                return
+
+        if self.content_fields is None:
+            self.by_content = True
+
+    def spec(self) -> dict:
+        """The learned decision, JSON-serialisable (see ``from_spec``)."""
+        return {"version": KEYER_VERSION,
+                "field": list(self.field) if isinstance(self.field, tuple) else self.field,
+                "content_fields": list(self.content_fields) if self.content_fields else None}
+
+    @classmethod
+    def from_spec(cls, spec: dict) -> "ItemKeyer":
+        keyer = cls(content_fields=spec.get("content_fields"))
+        field = spec.get("field")
+        if field is not None:
+            keyer.field = tuple(field) if isinstance(field, list) else field
+            keyer._label = _label(keyer.field)
+        elif keyer.content_fields is None:
+            keyer.by_content = True
+        return keyer
+
+    def key(self, item: dict) -> str:
+        if not self.learned:
+            self.learn([item])
+
+        if self.field is not None:
+            v = _get(item, self.field)
+            if isinstance(v, _SCALARS):
+                return f"{self._label}:{v}"
+
+        # Fallback: the given content fields, else the whole item minus volatile fields
+        if self.content_fields:
+            text = _SEP.join(f"{k}={item.get(k)!s}" for k in self.content_fields)
+            return "hash:" + fast_hash(text)
+        return "hash:" + fingerprint(item, identity=True)
@@ -0,0 +1,331 @@
+"""
+Per-request instrumentation and per-source aggregates.
+
+- ``transport.request`` times every request with a ``RequestTimer``: DNS
+  lookup, connect (TCP + TLS), time to first byte, body download and total,
+  plus status, bytes and retries (a repeat of a request that failed before
+  in the same source).
+- ``timed("stage")`` measures parse functions.
+- Everything is aggregated per source into counters and fixed-bucket latency
+  histograms; the slowest requests are kept for drill-down.
+- ``snapshot()`` gives the aggregates as JSON-serialisable dicts,
+  ``to_prometheus()`` renders them in the Prometheus text format and
+  ``write()`` saves both under ``.jobboard/metrics/``.
+- Scrapers run as subprocesses hand their aggregates back through the file
+  named in ``$JOBBOARD_METRICS_FILE``; the parent ``merge()``s them.
+
+Usage:
+  from jobboard import metrics
+
+  @metrics.timed("parse")
+  def parse_jobs(html): ...
+
+  metrics.write()   # -> .jobboard/metrics/latest.json, latest.prom
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import heapq
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .paths import STATE_DIR
+
+METRICS_DIR = STATE_DIR / "metrics"
+BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+PHASES = ("dns", "connect", "ttfb", "download", "total")
+SLOWEST_KEPT = 5
+
+
+# ---------- aggregates ----------
+class Histogram:
+    """Fixed-bucket histogram; ``counts[i]`` holds observations <= ``buckets[i]`` (last: +Inf)."""
+
+    def __init__(self, buckets: Sequence[float] = BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        i = 0
+        while i < len(self.buckets) and value > self.buckets[i]:
+            i += 1
+        self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bucket bound containing the q-quantile (None if empty or beyond the last bucket)."""
+        if not self.count:
+            return None
+        rank, seen = q * self.count, 0
+        for bound, n in zip(self.buckets, self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"buckets": list(self.buckets), "counts": self.counts, "sum": round(self.sum, 6),
+                "count": self.count, "p50": self.quantile(0.5), "p95": self.quantile(0.95)}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Histogram":
+        h = cls(d["buckets"])
+        h.counts, h.sum, h.count = list(d["counts"]), d["sum"], d["count"]
+        return h
+
+    def merge(self, other: "Histogram") -> None:
+        if other.buckets != self.buckets:
+            raise ValueError("cannot merge histograms with different buckets")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.sum += other.sum
+        self.count += other.count
+
+
+class SourceMetrics:
+    def __init__(self):
+        self.counters: Dict[str, int] = {"requests": 0, "bytes": 0, "errors": 0, "retries": 0}
+        self.status: Dict[str, int] = {}
+        self.phases: Dict[str, Histogram] = {}
+        self.stages: Dict[str, Histogram] = {}
+        self.slowest: List[Tuple[float, str]] = []  # min-heap of (seconds, "METHOD url")
+        self._failed: Set[Tuple[str, str]] = set()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "counters": dict(self.counters),
+            "status": dict(self.status),
+            "phases": {k: h.to_dict() for k, h in self.phases.items()},
+            "stages": {k: h.to_dict() for k, h in self.stages.items()},
+            "slowest": [{"seconds": round(s, 4), "request": r} for s, r in sorted(self.slowest, reverse=True)],
+        }
+
+
+_sources: Dict[str, SourceMetrics] = {}
+_lock = threading.Lock()
+
+
+def _get(source: str) -> SourceMetrics:
+    m = _sources.get(source)
+    if m is None:
+        m = _sources[source] = SourceMetrics()
+    return m
+
+
+def _current_source() -> str:
+    from .transport import current_source  # transport imports this module
+    return current_source()
+
+
+# ---------- requests ----------
+_active = threading.local()
+
+
+class RequestTimer:
+    """Collects httpx trace events for one request (pass ``trace`` as the trace extension)."""
+
+    def __init__(self, source: str, method: str, url: str):
+        self.source, self.method, self.url = source, method, str(url)
+        self.t0 = time.perf_counter()
+        self.dns = 0.0
+        self.marks: Dict[str, float] = {}
+        self._prev = getattr(_active, "timer", None)
+        _active.timer = self
+
+    def trace(self, event: str, info: Dict[str, Any]) -> None:
+        # e.g. connection.connect_tcp.started, http11.receive_response_headers.complete
+        self.marks.setdefault(event.split(".", 1)[-1] if event.startswith("http") else event, time.perf_counter())
+
+    def _span(self, name: str) -> Optional[float]:
+        a, b = self.marks.get(f"{name}.started"), self.marks.get(f"{name}.complete")
+        return b - a if a is not None and b is not None else None
+
+    def _finish(self, status: Optional[int], nbytes: int) -> None:
+        _active.timer = self._prev
+        end = time.perf_counter()
+        phases: Dict[str, float] = {"total": end - self.t0}
+        if self.dns:
+            phases["dns"] = self.dns
+        connect = [s for s in (self._span("connection.connect_tcp"), self._span("connection.start_tls")) if s]
+        if connect:
+            phases["connect"] = sum(connect)
+        headers = self.marks.get("receive_response_headers.complete")
+        if headers is not None:
+            phases["ttfb"] = headers - self.t0
+            phases["download"] = end - headers
+
+        key = (self.method, self.url)
+        failed = status is None or status == 429 or status >= 500
+        with _lock:
+            m = _get(self.source)
+            m.counters["requests"] += 1
+            m.counters["bytes"] += nbytes
+            if key in m._failed:
+                m.counters["retries"] += 1
+            if failed:
+                m._failed.add(key)
+            else:
+                m._failed.discard(key)
+            if status is None:
+                m.counters["errors"] += 1
+            label = str(status) if status is not None else "error"
+            m.status[label] = m.status.get(label, 0) + 1
+            for phase, seconds in phases.items():
+                m.phases.setdefault(phase, Histogram()).observe(seconds)
+            item = (phases["total"], f"{self.method} {self.url}")
+            if len(m.slowest) < SLOWEST_KEPT:
+                heapq.heappush(m.slowest, item)
+            elif item > m.slowest[0]:
+                heapq.heapreplace(m.slowest, item)
+
+    def done(self, response) -> None:
+        self._finish(response.status_code, response.num_bytes_downloaded)
+
+    def fail(self, exc: BaseException) -> None:
+        self._finish(None, 0)
+
+
+def add_dns_time(seconds: float) -> None:
+    """Called by the DNS resolver; charged to the request running in this thread."""
+    timer = getattr(_active, "timer", None)
+    if timer is not None:
+        timer.dns += seconds
+
+
+# ---------- parse stages ----------
+def observe_stage(stage: str, seconds: float, source: Optional[str] = None) -> None:
+    with _lock:
+        _get(source or _current_source()).stages.setdefault(stage, Histogram()).observe(seconds)
+
+
+@contextmanager
+def stage_timer(stage: str) -> Iterator[None]:
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - t0)
+
+
+def timed(stage: str) -> Callable:
+    """Decorator: record the wrapped function's run time under ``stage``."""
+    def deco(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with stage_timer(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+# ---------- export ----------
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    with _lock:
+        return {name: m.to_dict() for name, m in sorted(_sources.items())}
+
+
+def merge(snap: Dict[str, Dict[str, Any]]) -> None:
+    """Fold a ``snapshot()`` from another process into this one."""
+    with _lock:
+        for name, d in snap.items():
+            m = _get(name)
+            for k, v in d.get("counters", {}).items():
+                m.counters[k] = m.counters.get(k, 0) + v
+            for k, v in d.get("status", {}).items():
+                m.status[k] = m.status.get(k, 0) + v
+            for attr in ("phases", "stages"):
+                target = getattr(m, attr)
+                for k, h in d.get(attr, {}).items():
+                    if k in target:
+                        target[k].merge(Histogram.from_dict(h))
+                    else:
+                        target[k] = Histogram.from_dict(h)
+            for s in d.get("slowest", []):
+                heapq.heappush(m.slowest, (s["seconds"], s["request"]))
+            m.slowest = heapq.nlargest(SLOWEST_KEPT, m.slowest)
+            heapq.heapify(m.slowest)
+
+
+def reset() -> None:
+    with _lock:
+        _sources.clear()
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prom_histogram(lines: List[str], metric: str, labels: str, h: Dict[str, Any]) -> None:
+    cumulative = 0
+    for bound, n in zip(h["buckets"] + ["+Inf"], h["counts"]):
+        cumulative += n
+        lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f"{metric}_sum{{{labels}}} {h['sum']}")
+    lines.append(f"{metric}_count{{{labels}}} {h['count']}")
+
+
+def to_prometheus(snap: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+    snap = snapshot() if snap is None else snap
+    lines: List[str] = []
+
+    counters = [
+        ("requests", "jobboard_http_requests_total", "HTTP requests sent"),
+        ("bytes", "jobboard_http_bytes_total", "Response bytes downloaded"),
+        ("errors", "jobboard_http_errors_total", "Requests that raised (no response)"),
+        ("retries", "jobboard_http_retries_total", "Repeats of a previously failed request"),
+    ]
+    for key, metric, help_text in counters:
+        lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} counter"]
+        for source, d in snap.items():
+            lines.append(f'{metric}{{source="{_label(source)}"}} {d["counters"].get(key, 0)}')
+
+    metric = "jobboard_http_responses_total"
+    lines += [f"# HELP {metric} Responses by status code", f"# TYPE {metric} counter"]
+    for source, d in snap.items():
+        for status, n in sorted(d["status"].items()):
+            lines.append(f'{metric}{{source="{_label(source)}",status="{status}"}} {n}')
+
+    metric = "jobboard_http_phase_seconds"
+    lines += [f"# HELP {metric} Request latency by phase", f"# TYPE {metric} histogram"]
+    for source, d in snap.items():
+        for phase in PHASES:
+            if phase in d["phases"]:
+                _prom_histogram(lines, metric, f'source="{_label(source)}",phase="{phase}"', d["phases"][phase])
+
+    metric = "jobboard_stage_seconds"
+    lines += [f"# HELP {metric} Time spent in instrumented functions", f"# TYPE {metric} histogram"]
+    for source, d in snap.items():
+        for stage, h in sorted(d["stages"].items()):
+            _prom_histogram(lines, metric, f'source="{_label(source)}",stage="{_label(stage)}"', h)
+
+    return "\n".join(lines) + "\n"
+
+
+def write(directory: Optional[Path] = None) -> Path:
+    """Save the current aggregates as ``latest.json`` and ``latest.prom``; returns the JSON path."""
+    directory = Path(directory) if directory else METRICS_DIR
+    directory.mkdir(parents=True, exist_ok=True)
+    snap = snapshot()
+    path = directory / "latest.json"
+    path.write_text(json.dumps(snap, ensure_ascii=False, indent=2), encoding="utf-8")
+    (directory / "latest.prom").write_text(to_prometheus(snap), encoding="utf-8")
+    return path
+
+
+def _dump() -> None:
+    path = os.environ.get("JOBBOARD_METRICS_FILE")
+    if path and _sources:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(snapshot(), f)
+
+
+atexit.register(_dump)
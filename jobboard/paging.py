@@ -0,0 +1,144 @@
+"""
+Page-size negotiation for paginated JSON APIs.
+
+- Probes an endpoint with decreasing limit/perPage candidates and reads back
+  how many items the server actually returned (and its ``total``, if any).
+- Remembers the largest window the server was seen to fill per endpoint in
+  ``.jobboard/page_sizes.json`` for ``ttl`` seconds, so only the first run
+  of the week pays for probing. Sources probe concurrently (threads and
+  scraper subprocesses), so a change re-reads the file and writes back only
+  its own endpoint (through a per-writer tmp file).
+- ``fetch`` should fail fast on client errors (no retries on a 4xx): every
+  rejected candidate goes through it.
+- Hands the probe response back to the caller: it is a valid first page.
+
+Usage:
+  probe = PageSizeProbe()
+  size = probe.negotiate(BASE_URL, fetch=lambda n: fetch_page(0, n),
+                         items=extract_items, total=lambda p: p.get("total"),
+                         default=200)
+  size.limit          # page size to use
+  size.first_payload  # offset-0 page fetched with that size (None on cache hit)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence
+
+from .paths import STATE_DIR
+
+CACHE_FILE = STATE_DIR / "page_sizes.json"
+DEFAULT_TTL = 7 * 24 * 3600  # seconds
+DEFAULT_CANDIDATES = (1000, 500, 300, 200, 100)
+
+_lock = threading.Lock()  # in one process; other processes may write the file at the same time
+
+
+@dataclass
+class PageSize:
+    limit: int
+    first_payload: Any = None
+    cached: bool = False
+
+
+class PageSizeProbe:
+    def __init__(self, cache_file: Path = CACHE_FILE, ttl: float = DEFAULT_TTL):
+        self.cache_file = Path(cache_file)
+        self.ttl = ttl
+        self._cache: Optional[dict] = None
+
+    # ---------- cache ----------
+    def _load(self) -> dict:
+        if self._cache is None:
+            try:
+                self._cache = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._cache = {}
+        return self._cache
+
+    def _save(self) -> None:
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_file.with_name(f"{self.cache_file.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(self._load(), indent=2, sort_keys=True), encoding="utf-8")
+        tmp.replace(self.cache_file)
+
+    def cached(self, endpoint: str) -> Optional[int]:
+        entry = self._load().get(endpoint)
+        if entry and time.time() - entry.get("probed_at", 0) < self.ttl:
+            return int(entry["limit"])
+        return None
+
+    def remember(self, endpoint: str, limit: int) -> None:
+        with _lock:
+            self._cache = None  # re-read: keep what other endpoints' probes wrote since we loaded
+            self._load()[endpoint] = {"limit": int(limit), "probed_at": time.time()}
+            self._save()
+
+    def forget(self, endpoint: str) -> None:
+        with _lock:
+            self._cache = None
+            if self._load().pop(endpoint, None) is not None:
+                self._save()
+
+    # ---------- probing ----------
+    def negotiate(self,
+                  endpoint: str,
+                  fetch: Callable[[int], Any],
+                  items: Callable[[Any], List],
+                  total: Optional[Callable[[Any], Optional[int]]] = None,
+                  candidates: Sequence[int] = DEFAULT_CANDIDATES,
+                  default: int = 100) -> PageSize:
+        """
+        Return the largest page size the endpoint honours.
+
+        For each candidate (largest first) the first page is fetched:
+          - a request error (e.g. HTTP 400 for a too-large limit) moves on to
+            the next candidate;
+          - a full page means the candidate is accepted;
+          - a short page that already holds ``total`` items is used for this
+            run, but says nothing about a cap above the item count: only the
+            count (at least ``default``) is cached;
+          - a short page with more items pending means the server capped the
+            window: the returned item count is its real maximum.
+        Without a ``total`` a short page is ambiguous (cap vs. end of data),
+        so the size never drops below ``default``, the known-good value.
+        """
+        hit = self.cached(endpoint)
+        if hit:
+            return PageSize(hit, cached=True)
+
+        for size in sorted(set(candidates), reverse=True):
+            try:
+                payload = fetch(size)
+            except Exception as e:
+                print(f"[probe] {endpoint}: limit={size} rejected ({e})")
+                continue
+
+            got = len(items(payload) or [])
+            reported = total(payload) if total else None
+
+            proven = None  # largest size seen returned in full, if other than limit
+            if got >= size:
+                limit = size
+            elif reported is not None and got >= reported:
+                limit, proven = size, max(got, default)  # everything fit: the cap is unknown
+            elif reported is not None:
+                limit = got if got > 0 else default
+            else:
+                limit = max(got, default)
+
+            print(f"[probe] {endpoint}: asked {size}, got {got}"
+                  + (f" of {reported}" if reported is not None else "")
+                  + f" -> page size {limit}" + (f" (caching {proven})" if proven else ""))
+            self.remember(endpoint, proven or limit)
+            # Only reusable as page 1 if it was fetched with that exact size
+            # or the server trimmed it to exactly that size
+            return PageSize(limit, payload if got <= limit else None)
+
+        return PageSize(default)
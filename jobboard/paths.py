@@ -0,0 +1,9 @@
+"""Well-known locations shared by the scrapers and tooling."""
+
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+SOURCES_CSV = ROOT / "Jobboard - Data Source.csv"
+
+# Caches and run state (not versioned)
+STATE_DIR = ROOT / ".jobboard"
@@ -0,0 +1,51 @@
+"""
+Platform adapters used by the engine.
+
+Each adapter module exposes ``fetch(source) -> Result`` and reads its settings
+from ``source.params``. Adapters that produce their output in-process return
+it as ``Result.payload`` and the engine writes it; the ``script`` adapter runs
+a legacy per-folder scraper, which writes its own file. Adapters that can
+read a change signal off the first page also expose ``probe(source) ->
+Signature`` (``jobboard.probes``); the engine skips the full crawl when it
+matches the last one.
+
+  ohws            prospective.ch ohws JSON API (offset/limit)
+  jsonapi         one-shot JSON GET
+  graphql         persisted-query GraphQL GET, paged via variables (Migros)
+  successfactors  SuccessFactors career sites (startrow pagination)
+  sendpagination  sendPagination(offset) HTML forms (prospective careercenter)
+  umantis         Umantis portals (page count from the pagination widget)
+  script          run the folder's own scraper script
+"""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+ADAPTERS = {
+    "ohws": "jobboard.platforms.ohws",
+    "jsonapi": "jobboard.platforms.jsonapi",
+    "graphql": "jobboard.platforms.graphql",
+    "successfactors": "jobboard.platforms.successfactors",
+    "sendpagination": "jobboard.platforms.sendpagination",
+    "umantis": "jobboard.platforms.umantis",
+    "script": "jobboard.platforms.script",
+}
+
+
+@dataclass
+class Result:
+    payload: Any = None                  # document to write (None: already written)
+    reported_total: Optional[int] = None  # what the site says it has
+    usage: Optional[Dict[str, int]] = None  # requests/bytes made outside this process
+
+
+def get_adapter(name: str) -> ModuleType:
+    """Import adapters lazily: most of them pull in bs4/httpx."""
+    try:
+        return importlib.import_module(ADAPTERS[name])
+    except KeyError:
+        raise KeyError(f"Unknown platform adapter {name!r}") from None
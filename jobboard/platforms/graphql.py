@@ -0,0 +1,64 @@
+"""
+Persisted-query GraphQL over GET, as used by jobs.migros.ch:
+``<url>?__gqlc_language=de&__gqlh=<hash>&__variables=<json>``
+
+params:
+  url         query endpoint
+  query_hash  value of __gqlh (may change when the site redeploys)
+  language    value of __gqlc_language
+  operation   key under "data" holding {"total", "hits"}
+  variables   base variables; "page" and "perPage" are set per request
+  per_page    page size
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List
+
+from .. import transport
+from ..probes import PROBE_ITEMS, Signature, signature
+from . import Result
+
+MAX_PAGES = 200  # safety guard
+
+
+def _page(p: Dict[str, Any], n: int, per_page: int) -> Dict[str, Any]:
+    variables = {**p.get("variables", {}), "page": n, "perPage": per_page}
+    params = {
+        "__gqlc_language": p.get("language", "de"),
+        "__gqlh": p["query_hash"],
+        "__variables": json.dumps(variables),
+    }
+    r = transport.get(p["url"], params=params)
+    r.raise_for_status()
+    return r.json()["data"][p.get("operation", "searchJobs")]
+
+
+def probe(source) -> Signature:
+    """``total`` and the top hits, from one small first page."""
+    data = _page(source.params, 1, PROBE_ITEMS)
+    return signature(data.get("total"), data.get("hits") or [])
+
+
+def fetch(source) -> Result:
+    p = source.params
+    per_page = int(p.get("per_page", 100))
+
+    def page(n: int) -> Dict[str, Any]:
+        return _page(p, n, per_page)
+
+    hits: List[dict] = []
+    total = None
+    for n in range(1, MAX_PAGES + 1):
+        data = page(n)
+        if total is None:
+            total = data.get("total")
+        batch = data.get("hits") or []
+        if not batch:
+            break
+        hits.extend(batch)
+        if total is not None and len(hits) >= total:
+            break
+
+    return Result({"total": total, "hits": hits}, total)
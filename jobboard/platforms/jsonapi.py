@@ -0,0 +1,21 @@
+"""
+Plain JSON endpoint that returns every job in one response.
+
+params:
+  url    endpoint (query string included)
+  total  optional dotted path to a reported total, e.g. "hydra:totalItems"
+"""
+
+from __future__ import annotations
+
+from .. import transport
+from ..jsonpath import get_path
+from . import Result
+
+
+def fetch(source) -> Result:
+    r = transport.get(source.params["url"])
+    r.raise_for_status()
+    doc = r.json()
+    total = get_path(doc, source.params.get("total")) if source.params.get("total") else None
+    return Result(doc, total if isinstance(total, int) else None)
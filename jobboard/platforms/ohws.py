@@ -0,0 +1,82 @@
+"""
+prospective.ch ohws job API: ``.../public/v1/medium/<id>/jobs?lang=..&offset=..&limit=..``
+
+params:
+  url      medium jobs endpoint
+  lang     language (default "de")
+  filters  extra query parameters, e.g. {"f": "25:1140601"}
+  unwrap   write only the job list instead of the API document
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from .. import transport
+from ..keys import ItemKeyer
+from ..paging import PageSizeProbe
+from ..probes import PROBE_ITEMS, Signature, signature
+from . import Result
+
+DEFAULT_LIMIT = 200
+MAX_PAGES = 50  # safety guard
+
+
+def _base(p: Dict[str, Any]) -> Dict[str, Any]:
+    return {"lang": p.get("lang", "de"), **p.get("filters", {})}
+
+
+def probe(source) -> Signature:
+    """The API total and the top postings, from one small page."""
+    p = source.params
+    r = transport.get(p["url"], params={**_base(p), "offset": 0, "limit": PROBE_ITEMS})
+    r.raise_for_status()
+    data = r.json()
+    return signature(data.get("total"), data.get("jobs") or [])
+
+
+def fetch(source) -> Result:
+    p = source.params
+    url = p["url"]
+    base = _base(p)
+
+    def page(offset: int, limit: int) -> Dict[str, Any]:
+        r = transport.get(url, params={**base, "offset": offset, "limit": limit})
+        r.raise_for_status()
+        return r.json()
+
+    endpoint = url + "".join(f"&{k}={v}" for k, v in sorted(p.get("filters", {}).items()))
+    size = PageSizeProbe().negotiate(
+        endpoint,
+        fetch=lambda n: page(0, n),
+        items=lambda d: d.get("jobs", []),
+        total=lambda d: d.get("total"),
+        default=DEFAULT_LIMIT,
+    )
+    first = size.first_payload or page(0, size.limit)
+    total = first.get("total")
+
+    keyer = ItemKeyer()
+    seen = set()
+    jobs: List[dict] = []
+    data, offset = first, 0
+    for _ in range(MAX_PAGES):
+        items = data.get("jobs", []) or []
+        if not keyer.learned:
+            keyer.learn(items)
+        for it in items:
+            k = keyer.key(it)
+            if k not in seen:
+                seen.add(k)
+                jobs.append(it)
+        offset += len(items)
+        if len(items) < size.limit or (total is not None and offset >= total):
+            break
+        data = page(offset, size.limit)
+
+    if p.get("unwrap"):
+        return Result(jobs, total)
+    doc = dict(first)
+    doc["offset"] = 0
+    doc["jobs"] = jobs
+    return Result(doc, total)
@@ -0,0 +1,54 @@
+"""
+Run a source's own scraper script (the per-folder ``*.py``) as a subprocess.
+
+The scripts write their output relative to the working directory, so each
+one runs inside its folder. A subprocess keeps their module-level state and
+``chdir`` apart when the engine runs several sources at once. Scripts that go
+through ``jobboard.transport`` report their request/byte counts and request
+metrics back. With ``run.py --profile`` the script runs under
+``jobboard.profiling``; ``--record``/``--replay`` reach it via the environment.
+
+params:
+  script  file name inside the source folder
+  args    optional extra command-line arguments
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+from .. import metrics, profiling
+from ..paths import ROOT
+from . import Result
+
+TIMEOUT_S = 3600
+IN_PROCESS = False  # the engine must not profile this thread; the subprocess profiles itself
+
+
+def fetch(source) -> Result:
+    script = source.directory / source.params["script"]
+    args = source.params.get("args", [])
+    cmd = [sys.executable, str(script), *args]
+    if profiling.mode():
+        cmd = profiling.script_command(source.name, script, args)
+    with tempfile.TemporaryDirectory() as tmp:
+        usage_file = os.path.join(tmp, "usage.json")
+        metrics_file = os.path.join(tmp, "metrics.json")
+        env = {**os.environ, "JOBBOARD_SOURCE": source.name, "JOBBOARD_USAGE_FILE": usage_file,
+               "JOBBOARD_METRICS_FILE": metrics_file,
+               "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")]))}
+        proc = subprocess.run(cmd, cwd=source.directory, env=env, timeout=TIMEOUT_S)
+        if proc.returncode != 0:
+            raise RuntimeError(f"{script.name} exited with status {proc.returncode}")
+        usage = None
+        if os.path.exists(usage_file):
+            with open(usage_file, encoding="utf-8") as f:
+                usage = json.load(f).get(source.name)
+        if os.path.exists(metrics_file):
+            with open(metrics_file, encoding="utf-8") as f:
+                metrics.merge(json.load(f))
+    return Result(None, usage=usage)
@@ -0,0 +1,149 @@
+"""
+HTML listings paged by a ``sendPagination(offset)`` form (prospective careercenter
+skins such as jobs.helsana.ch or jobs.fenaco.com).
+
+- Loads the landing page, copies the form's inputs as the base payload.
+- POSTs ``offset`` values discovered from ``sendPagination(N)`` on every
+  response, plus ``offset + step``, until a page brings nothing new.
+- Collects teaser links only (no detail pages).
+
+params:
+  start_url      landing page
+  link_contains  substrings a teaser href must contain (any of them)
+  payload        extra/overriding form fields, e.g. {"limit": "12"}
+  step           page size if it cannot be discovered (default 12)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import deque
+from typing import Any, Dict, List, Set, Tuple
+from urllib.parse import urljoin, urlparse
+
+from .. import metrics, transport
+from ..html import soup, text
+from ..probes import Signature, signature
+from . import Result
+
+SEND_PAG_RE = re.compile(r"sendPagination\((\d+)\)")
+MAX_PAGES = 200   # safety guard
+META_SELECTORS = ".c-teaser__meta, .meta, .job-meta, .key-value, .c-key-value"
+
+
+def discover_offsets(html_text: str) -> List[int]:
+    return sorted({0} | {int(m.group(1)) for m in SEND_PAG_RE.finditer(html_text)})
+
+
+@metrics.timed("parse")
+def parse_teasers(start_url: str, html_text: str, link_contains: List[str], offset: int) -> List[Dict[str, Any]]:
+    doc = soup(html_text)
+    host = urlparse(start_url).netloc
+    jobs: List[Dict[str, Any]] = []
+    seen: Set[str] = set()
+    for a in doc.select("a[href]"):
+        href = a.get("href") or ""
+        if href.startswith(("#", "mailto:", "tel:")):
+            continue
+        url = urljoin(start_url, href)
+        parts = urlparse(url)
+        if parts.netloc != host or not any(s in parts.path for s in link_contains):
+            continue
+        if url in seen:
+            continue
+        seen.add(url)
+
+        title = (a.get("title") or "").strip() or text(a)
+        location = None
+        parent = a
+        for _ in range(4):
+            parent = parent.parent
+            if parent is None:
+                break
+            meta = parent.select_one(META_SELECTORS)
+            if meta and len(text(meta)) <= 160:
+                location = text(meta) or None
+                break
+        jobs.append({"title": title, "location": location, "teaser_url": url, "source_offset": offset})
+    return jobs
+
+
+def _form(source, landing_html: str) -> Tuple[str, Dict[str, str]]:
+    """(action URL, base payload) of the landing page's pagination form."""
+    p = source.params
+    start_url = p["start_url"]
+    doc = soup(landing_html)
+    form = next((f for f in doc.find_all("form") if f.find("input", {"name": "offset"})), None) or doc.find("form")
+    if form is None:
+        raise RuntimeError(f"{source.name}: no pagination form on {start_url}")
+    action = urljoin(start_url, form.get("action") or start_url)
+    base_payload = {inp["name"]: inp.get("value") or "" for inp in form.find_all("input") if inp.get("name")}
+    base_payload.update(p.get("payload", {}))
+    return action, base_payload
+
+
+def probe(source) -> Signature:
+    """The last pagination offset and the first teasers (landing page, else the offset-0 POST)."""
+    p = source.params
+    start_url = p["start_url"]
+    link_contains = list(p.get("link_contains", ["/offene-stellen/"]))
+
+    landing = transport.get(start_url)
+    landing.raise_for_status()
+    html_text = landing.text
+    teasers = parse_teasers(start_url, html_text, link_contains, 0)
+    if not teasers:
+        action, base_payload = _form(source, landing.text)
+        r = transport.post(action, data={**base_payload, "offset": "0"})
+        r.raise_for_status()
+        html_text = r.text
+        teasers = parse_teasers(start_url, html_text, link_contains, 0)
+    return signature(max(discover_offsets(html_text)), teasers)
+
+
+def fetch(source) -> Result:
+    p = source.params
+    start_url = p["start_url"]
+    link_contains = list(p.get("link_contains", ["/offene-stellen/"]))
+
+    landing = transport.get(start_url)
+    landing.raise_for_status()
+    action, base_payload = _form(source, landing.text)
+
+    offsets = discover_offsets(landing.text)
+    step = next((o for o in offsets if o > 0), int(p.get("step", 12)))
+
+    queue = deque(offsets)
+    seen_offsets: Set[int] = set()
+    seen_pages: Set[str] = set()
+    seen_urls: Set[str] = set()
+    jobs: List[Dict[str, Any]] = []
+
+    while queue and len(seen_offsets) < MAX_PAGES:
+        off = queue.popleft()
+        if off in seen_offsets:
+            continue
+        seen_offsets.add(off)
+
+        r = transport.post(action, data={**base_payload, "offset": str(off)})
+        r.raise_for_status()
+
+        digest = hashlib.blake2b(r.content, digest_size=16).hexdigest()
+        if digest in seen_pages:
+            break  # the server keeps returning the last page
+        seen_pages.add(digest)
+
+        new = [j for j in parse_teasers(start_url, r.text, link_contains, off) if j["teaser_url"] not in seen_urls]
+        for j in new:
+            seen_urls.add(j["teaser_url"])
+        jobs.extend(new)
+        print(f"[{source.name}] offset={off}: +{len(new)} (total {len(jobs)})")
+        if not new:
+            break
+
+        for n in discover_offsets(r.text) + [off + step]:
+            if n not in seen_offsets and n not in queue:
+                queue.append(n)
+
+    return Result(jobs)
@@ -0,0 +1,114 @@
+"""
+SuccessFactors career sites (``/search/`` and ``/go/<name>/<id>/`` listings).
+
+- Reads "Results 1 – 25 of 136" (de/fr/en/it banners) from the first page.
+- Pages with ``?startrow=N`` by the observed window until the total is reached
+  or a page brings no new jobs.
+- Parses the standard result rows (``a.jobTitle-link``, ``.jobLocation``,
+  ``.jobDate``); no detail pages.
+
+params:
+  start_url  listing URL
+  query      optional extra query parameters
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from .. import metrics, transport
+from ..html import soup, text
+from ..probes import Signature, signature
+from . import Result
+
+MAX_PAGES = 100     # safety guard
+DEFAULT_WINDOW = 25
+
+TOTAL_RE = re.compile(
+    r"(?:Results?|Ergebnisse|Résultats?|Risultati)\s+(\d+)\s*[–-]\s*(\d+)\s*(?:of|von|sur|de|di)\s*(\d+)",
+    re.I,
+)
+ROW_SELECTORS = "tr.data-row, li.job-tile, div.job-tile, li[role='listitem']"
+
+
+def parse_total(html_text: str) -> Tuple[Optional[int], Optional[int]]:
+    """Return (total, window) from the results banner."""
+    m = TOTAL_RE.search(re.sub(r"<[^>]+>", " ", html_text))
+    if not m:
+        return None, None
+    a, b, total = map(int, m.groups())
+    return total, (b - a + 1 if b >= a else None)
+
+
+def _job_id(url: str) -> Optional[str]:
+    parts = [p for p in urlparse(url).path.split("/") if p]
+    nums = [p for p in parts if p.isdigit()]
+    return nums[-1] if nums else None
+
+
+@metrics.timed("parse")
+def parse_jobs(base_url: str, html_text: str) -> List[Dict[str, Any]]:
+    doc = soup(html_text)
+    jobs: List[Dict[str, Any]] = []
+    seen = set()
+    rows = doc.select(ROW_SELECTORS) or [a.parent for a in doc.select("a.jobTitle-link") if a.parent]
+    for row in rows:
+        a = row.select_one("a.jobTitle-link") or row.select_one("a[href*='/job/']")
+        if not a or not a.get("href"):
+            continue
+        url = urljoin(base_url, a["href"])
+        if url in seen:
+            continue  # desktop/mobile variants of the same row
+        seen.add(url)
+        jobs.append({
+            "title": text(a),
+            "url": url,
+            "location": text(row.select_one(".jobLocation")) or None,
+            "date": text(row.select_one(".jobDate")) or None,
+            "job_id": _job_id(url),
+        })
+    return jobs
+
+
+def _page(p: Dict[str, Any], startrow: int) -> str:
+    params = {**p.get("query", {}), **({"startrow": startrow} if startrow else {})}
+    r = transport.get(p["start_url"], params=params)
+    r.raise_for_status()
+    return r.text
+
+
+def probe(source) -> Signature:
+    """The results banner total and the rows of the first page."""
+    html_text = _page(source.params, 0)
+    return signature(parse_total(html_text)[0], parse_jobs(source.params["start_url"], html_text))
+
+
+def fetch(source) -> Result:
+    p = source.params
+    start_url = p["start_url"]
+
+    def page(startrow: int) -> str:
+        return _page(p, startrow)
+
+    html_text = page(0)
+    total, window = parse_total(html_text)
+    window = window or DEFAULT_WINDOW
+
+    jobs: List[Dict[str, Any]] = []
+    seen = set()
+    startrow = 0
+    for _ in range(MAX_PAGES):
+        new = [j for j in parse_jobs(start_url, html_text) if j["url"] not in seen]
+        for j in new:
+            seen.add(j["url"])
+        jobs.extend(new)
+        print(f"[{source.name}] startrow={startrow}: +{len(new)} (total {len(jobs)}"
+              + (f"/{total}" if total else "") + ")")
+        if not new or (total is not None and len(jobs) >= total):
+            break
+        startrow += window
+        html_text = page(startrow)
+
+    return Result(jobs, total)
@@ -0,0 +1,185 @@
+"""
+Umantis (Abacus) recruiting portals, e.g. recruitingapp-2800.umantis.com.
+
+- Reads the pagination widget of page 1: links like ``?tc1152481=p4`` give the
+  tenant-specific table parameter and the real page count.
+- Fetches pages 2..N concurrently over the shared client (``transport``:
+  circuit breaker, pacing, usage and request metrics), retrying connection
+  errors and 429/5xx here.
+- Parses ``/Vacancies/<id>/Description`` job links plus the inline
+  "Art:", "Departement:", "Ort:" metadata next to them.
+
+params:
+  list_url  job list URL (``.../Jobs/All`` or ``.../Jobs/1?lang=ger``)
+  workers   concurrent page fetches (default 4)
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse, urlunparse
+
+import httpx
+from bs4 import BeautifulSoup
+
+from .. import metrics, transport
+from ..probes import Signature, signature
+from . import Result
+
+PAGE_LINK_RE = re.compile(r"[?&](tc\d+)=p(\d+)")
+VACANCY_RE = re.compile(r"/Vacancies/(\d+)")
+DEFAULT_WORKERS = 4
+TIMEOUT_S = 30
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+ATTEMPTS = 5
+BACKOFF_S = 0.4
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Language": "de-DE,de;q=0.9,en;q=0.8",
+}
+
+
+def get_page(url: str, headers: Optional[Dict[str, str]] = None) -> str:
+    """One page over the shared client, retried on connection errors and 429/5xx."""
+    for attempt in range(ATTEMPTS - 1):
+        try:
+            r = transport.get(url, headers=headers or HEADERS, timeout=TIMEOUT_S)
+        except httpx.TransportError:
+            pass
+        else:
+            if r.status_code not in RETRY_STATUSES:
+                r.raise_for_status()
+                return r.text
+        time.sleep(BACKOFF_S * 2 ** attempt)
+    r = transport.get(url, headers=headers or HEADERS, timeout=TIMEOUT_S)  # last attempt: errors propagate
+    r.raise_for_status()
+    return r.text
+
+
+def clean(s: str) -> str:
+    return re.sub(r"\s+", " ", s or "").strip()
+
+
+def extract_job_id(url: str) -> Optional[str]:
+    m = VACANCY_RE.search(url or "")
+    return m.group(1) if m else None
+
+
+def page_url(list_url: str, param: str, page: int) -> str:
+    parts = urlparse(list_url)
+    qs = parse_qs(parts.query, keep_blank_values=True)
+    qs[param] = [f"p{page}"]
+    return urlunparse(parts._replace(query=urlencode(qs, doseq=True)))
+
+
+def discover_pages(html: str) -> Tuple[Optional[str], int]:
+    """(table parameter, page count) from the pagination links; (None, 1) if unpaged."""
+    param, last = None, 1
+    for m in PAGE_LINK_RE.finditer(html):
+        param = param or m.group(1)
+        if m.group(1) == param:
+            last = max(last, int(m.group(2)))
+    return param, last
+
+
+def parse_job_anchor(a, base_url: str) -> dict:
+    title = clean(a.get_text(" ", strip=True))
+    url = urljoin(base_url, a.get("href", "").strip())
+
+    # Walk up a bit and gather nearby text to heuristically fetch metadata
+    container = a
+    for _ in range(3):
+        if container.parent:
+            container = container.parent
+    nearby = " ".join(
+        clean(el.get_text(" ", strip=True))
+        for el in container.find_all(["div", "span", "li", "td", "p"], recursive=True)[:24]
+    )
+
+    # Fields like "Art: Vollzeit", department and location often appear inline
+    m_art = re.search(r"\bArt:\s*([^|•\n\r]+)", nearby, flags=re.I)
+    m_dep = re.search(r"(?:Departement|Department)\s*:\s*([^|•\n\r]+)", nearby, flags=re.I)
+    m_loc = re.search(r"(?:Ort|Standort)\s*:\s*([^|•\n\r]+)", nearby, flags=re.I)
+
+    return {
+        "id": extract_job_id(url),
+        "title": title or None,
+        "url": url,
+        "employment_type": clean(m_art.group(1)) if m_art else None,
+        "department": clean(m_dep.group(1)) if m_dep else None,
+        "location": clean(m_loc.group(1)) if m_loc else None,
+        "source_context": nearby[:240] or None,
+    }
+
+
+@metrics.timed("parse")
+def extract_jobs_from_page(html: str, page_url: str) -> List[dict]:
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Job links look like /Vacancies/<id>/Description/<lang>
+    anchors = soup.select('a[href*="/Vacancies/"][href*="/Description"]')
+    # Fallback: any <a> that looks like a job (title text + /Vacancies/)
+    if not anchors:
+        anchors = [a for a in soup.find_all("a") if "/Vacancies/" in (a.get("href") or "")]
+
+    seen = set()
+    picked = []
+    for a in anchors:
+        href = (a.get("href") or "").strip()
+        txt = clean(a.get_text(" ", strip=True))
+        if not href or not txt:
+            continue
+        key = (href, txt)
+        if key in seen:
+            continue
+        seen.add(key)
+        picked.append(a)
+
+    return [parse_job_anchor(a, page_url) for a in picked]
+
+
+def crawl(list_url: str, workers: int = DEFAULT_WORKERS, headers: Optional[Dict[str, str]] = None) -> List[dict]:
+    """All jobs of an Umantis list, de-duplicated by URL and sorted by id/title."""
+    source = transport.current_source()  # pool threads do not inherit the caller's context
+
+    def get(url: str) -> str:
+        with transport.source_scope(source):
+            return get_page(url, headers)
+
+    first = get(list_url)
+    param, pages = discover_pages(first)
+    print(f"[umantis] {list_url}: {pages} page(s)" + (f" via {param}" if param else ""))
+
+    results = [(list_url, first)]
+    if param and pages > 1:
+        urls = [page_url(list_url, param, n) for n in range(2, pages + 1)]
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(urls)))) as pool:
+            results += list(zip(urls, pool.map(get, urls)))
+
+    by_url: Dict[str, dict] = {}
+    for n, (url, html) in enumerate(results, start=1):
+        jobs = extract_jobs_from_page(html, url)
+        print(f"[+] p{n}: {len(jobs)} job links")
+        for j in jobs:
+            by_url[j["url"]] = j  # de-dupe across pages
+
+    jobs = list(by_url.values())
+    jobs.sort(key=lambda x: (x.get("id") or "", x.get("title") or ""))
+    return jobs
+
+
+def probe(source) -> Signature:
+    """Page 1 only: the page count and the postings on it."""
+    list_url = source.params["list_url"]
+    html = get_page(list_url)
+    _, pages = discover_pages(html)
+    return signature(pages, extract_jobs_from_page(html, list_url))
+
+
+def fetch(source) -> Result:
+    p = source.params
+    return Result(crawl(p["list_url"], int(p.get("workers", DEFAULT_WORKERS))))
@@ -0,0 +1,109 @@
+"""
+First-page probes: skip the full crawl of a source that has not changed.
+
+Most feeds say on their first response whether anything moved: the ohws and
+Migros ``total``, the SuccessFactors "Results 1 – 25 of N" banner, the
+Umantis page count, plus the postings at the top of the list. Adapters that
+can fetch that first page cheaply expose ``probe(source) -> Signature``:
+
+- signature: the reported total (or page count) and a hash over the
+  ``store.fingerprint`` of the first ``PROBE_ITEMS`` postings, so volatile
+  fields (view counters, "posted 3 days ago") do not count as a change;
+- the engine probes before crawling; when total and fingerprint match the
+  signature stored after the last full crawl (``.jobboard/probes.json``), the
+  source is skipped and its current output stands — one request instead of
+  a full crawl;
+- a change below the first page with an unchanged total (one posting swapped
+  for another) is invisible to the probe, so a source is crawled in full at
+  least every ``MAX_SKIP_HOURS`` regardless;
+- ``script`` sources run their own scraper in a subprocess and are not
+  probed; neither are one-shot ``jsonapi`` sources, whose first request is
+  the whole crawl.
+
+Usage:
+  python run.py                 # probe, crawl only what changed
+  python run.py --no-probe      # always crawl in full
+  python -m jobboard.probes     # stored signatures
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from . import jsonio, store
+from .keys import fast_hash
+from .paths import STATE_DIR
+
+STATE_FILE = STATE_DIR / "probes.json"
+PROBE_ITEMS = 20              # postings at the top of the list that make up the fingerprint
+MAX_SKIP_HOURS = 7 * 24.0     # crawl in full at least this often
+
+_lock = threading.Lock()  # sources on different hosts finish concurrently
+
+
+@dataclass
+class Signature:
+    total: Optional[int]      # reported total (page count for Umantis), None if the site has none
+    fingerprint: str
+
+
+def signature(total: Optional[int], items: Iterable[Dict[str, Any]]) -> Signature:
+    """Signature of a first page: its total and its first ``PROBE_ITEMS`` postings, in order."""
+    prints = [store.fingerprint(item) for _, item in zip(range(PROBE_ITEMS), items)]
+    return Signature(total, fast_hash(f"{total}|" + ",".join(prints)))
+
+
+def _load(path: Path = STATE_FILE) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(state: dict, path: Path = STATE_FILE) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    jsonio.write(tmp, state, pretty=True)
+    tmp.replace(path)
+
+
+def unchanged(name: str, sig: Signature, now: Optional[float] = None) -> bool:
+    """True if ``sig`` matches the last full crawl and that crawl is recent enough to trust."""
+    entry = _load().get(name)
+    if not entry:
+        return False
+    age_hours = ((time.time() if now is None else now) - entry.get("crawled_at", 0)) / 3600
+    return (age_hours < MAX_SKIP_HOURS
+            and entry.get("total") == sig.total and entry.get("fingerprint") == sig.fingerprint)
+
+
+def remember(name: str, sig: Signature) -> None:
+    """Store the signature probed right before a successful full crawl."""
+    with _lock:
+        state = _load()
+        state[name] = {"total": sig.total, "fingerprint": sig.fingerprint, "crawled_at": time.time()}
+        _save(state)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--state", type=Path, default=STATE_FILE)
+    args = ap.parse_args(argv)
+
+    print(f"{'source':<22} {'total':>7}  {'fingerprint':<16}  crawled")
+    for name, entry in sorted(_load(args.state).items()):
+        when = time.strftime("%Y-%m-%d %H:%M", time.gmtime(entry.get("crawled_at", 0)))
+        total = "-" if entry.get("total") is None else entry["total"]
+        print(f"{name:<22} {total:>7}  {entry.get('fingerprint', ''):<16}  {when}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Profiling for source runs (``run.py --profile``).
+
+- ``cprofile``: deterministic, exact call counts; writes ``<source>.prof``
+  (open with ``python -m pstats`` or snakeviz).
+- ``sample``: a background thread samples the running thread's stack every
+  ``SAMPLE_INTERVAL_S``; low overhead, writes ``<source>.collapsed``
+  (flamegraph.pl / speedscope input).
+- Either way tracemalloc runs alongside, and ``<source>.txt`` gets the top-N
+  functions and allocation sites plus peak traced memory.
+
+In-process adapters are profiled in the engine's worker thread. Script
+sources run in a subprocess, so the script adapter starts them through
+``python -m jobboard.profiling ... script.py`` instead.
+
+Settings travel in the environment so subprocesses inherit them:
+  JOBBOARD_PROFILE       cprofile | sample
+  JOBBOARD_PROFILE_DIR   output directory
+  JOBBOARD_PROFILE_TOP   rows per summary table (default 25)
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import runpy
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+from typing import Iterator, List, Optional
+
+from .paths import STATE_DIR
+
+MODES = ("cprofile", "sample")
+PROFILE_DIR = STATE_DIR / "profiles"
+SAMPLE_INTERVAL_S = 0.005
+DEFAULT_TOP = 25
+TRACEMALLOC_FRAMES = 10
+
+
+def mode() -> Optional[str]:
+    return os.environ.get("JOBBOARD_PROFILE") or None
+
+
+def enable(profile_mode: str, directory: Path, top: int = DEFAULT_TOP) -> None:
+    if profile_mode not in MODES:
+        raise ValueError(f"Unknown profile mode {profile_mode!r} (expected one of {', '.join(MODES)})")
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    os.environ["JOBBOARD_PROFILE"] = profile_mode
+    os.environ["JOBBOARD_PROFILE_DIR"] = str(directory)
+    os.environ["JOBBOARD_PROFILE_TOP"] = str(top)
+
+
+def _directory() -> Path:
+    return Path(os.environ.get("JOBBOARD_PROFILE_DIR") or PROFILE_DIR)
+
+
+def _top() -> int:
+    return int(os.environ.get("JOBBOARD_PROFILE_TOP") or DEFAULT_TOP)
+
+
+def summary_path(name: str) -> Path:
+    return _directory() / f"{name}.txt"
+
+
+# ---------- sampling profiler ----------
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Sampler:
+    """Samples one thread's stack from a helper thread."""
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL_S):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="jobboard-sampler", daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack: List[str] = []
+            while frame is not None:
+                stack.append(_frame_label(frame))
+                frame = frame.f_back
+            if stack:
+                self.stacks[tuple(reversed(stack))] += 1
+                self.samples += 1
+
+    def start(self) -> "Sampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def write_collapsed(self, path: Path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, n in self.stacks.most_common():
+                f.write(";".join(s.replace(";", ",") for s in stack) + f" {n}\n")
+
+    def summary(self, top: int) -> str:
+        own: Counter = Counter()
+        inclusive: Counter = Counter()
+        for stack, n in self.stacks.items():
+            own[stack[-1]] += n
+            for fn in set(stack):
+                inclusive[fn] += n
+        total = max(self.samples, 1)
+        lines = [f"{self.samples} samples every {self.interval * 1000:.0f} ms", "",
+                 f"{'self %':>7} {'total %':>7}  function"]
+        for fn, n in own.most_common(top):
+            lines.append(f"{100 * n / total:7.1f} {100 * inclusive[fn] / total:7.1f}  {fn}")
+        lines += ["", f"{'total %':>7}  function (inclusive)"]
+        for fn, n in inclusive.most_common(top):
+            lines.append(f"{100 * n / total:7.1f}  {fn}")
+        return "\n".join(lines)
+
+
+# ---------- profiling a block ----------
+def _memory_summary(snapshot: tracemalloc.Snapshot, peak: int, top: int) -> str:
+    lines = [f"peak traced memory: {peak / 1024 / 1024:.1f} MB", ""]
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        lines.append(f"{stat.size / 1024:10.1f} KB {stat.count:8d} blocks  {frame.filename}:{frame.lineno}")
+    return "\n".join(lines)
+
+
+def _cprofile_summary(prof: cProfile.Profile, top: int) -> str:
+    out = io.StringIO()
+    stats = pstats.Stats(prof, stream=out).strip_dirs()
+    for key in ("tottime", "cumulative"):
+        out.write(f"--- top {top} by {key} ---\n")
+        stats.sort_stats(key).print_stats(top)
+    return out.getvalue()
+
+
+@contextmanager
+def profile(name: str, profile_mode: Optional[str] = None) -> Iterator[None]:
+    """Profile the enclosed block (this thread only) and write ``<name>.*`` files."""
+    profile_mode = profile_mode or mode()
+    if not profile_mode:
+        yield
+        return
+    directory, top = _directory(), _top()
+    directory.mkdir(parents=True, exist_ok=True)
+
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    tracemalloc.reset_peak()
+    prof = sampler = None
+    t0 = time.perf_counter()
+    if profile_mode == "cprofile":
+        prof = cProfile.Profile()
+        prof.enable()
+    else:
+        sampler = Sampler(threading.get_ident()).start()
+    try:
+        yield
+    finally:
+        if prof is not None:
+            prof.disable()
+        if sampler is not None:
+            sampler.stop()
+        seconds = time.perf_counter() - t0
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if started_tracemalloc:
+            tracemalloc.stop()
+
+        parts = [f"# {name}: {profile_mode}, {seconds:.2f}s wall", ""]
+        if prof is not None:
+            prof.dump_stats(str(directory / f"{name}.prof"))
+            parts.append(_cprofile_summary(prof, top))
+        else:
+            sampler.write_collapsed(directory / f"{name}.collapsed")
+            parts.append(sampler.summary(top))
+        parts += ["", f"--- top {top} allocation sites ---", _memory_summary(snapshot, peak, top)]
+        summary_path(name).write_text("\n".join(parts) + "\n", encoding="utf-8")
+        print(f"[profile] {name}: {summary_path(name)}")
+
+
+# ---------- scripts (subprocess) ----------
+def script_command(name: str, script: Path, args: List[str]) -> List[str]:
+    """Command line that runs ``script`` under the active profiler."""
+    return [sys.executable, "-m", "jobboard.profiling", "--name", name, str(script), *args]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Run a scraper script under the profiler from $JOBBOARD_PROFILE.")
+    ap.add_argument("--name", required=True, help="source name used for the output files")
+    ap.add_argument("--mode", choices=MODES, default=None)
+    ap.add_argument("script")
+    ap.add_argument("args", nargs=argparse.REMAINDER)
+    args = ap.parse_args(argv)
+
+    script = os.path.abspath(args.script)
+    sys.argv = [script, *args.args]
+    sys.path.insert(0, os.path.dirname(script))
+    with profile(args.name, args.mode or mode() or "cprofile"):
+        try:
+            runpy.run_path(script, run_name="__main__")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                raise
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
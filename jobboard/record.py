@@ -0,0 +1,106 @@
+"""
+Compact job records for scrapers that hold many jobs in memory.
+
+A ``Record`` subclass is declared like a dataclass, but instances have
+``__slots__`` (no per-instance ``__dict__``), repeated strings in the fields
+named by ``intern=`` are interned (one "LANDI Schweiz AG" in memory, however
+many postings carry it), and ``dump`` writes records as a JSON array
+straight from their attributes (through ``jsonio``, compact unless pretty
+output was asked for), without the deep copy ``dataclasses.asdict`` makes of
+every record first.
+
+Usage:
+  class Job(Record, intern=("company", "location", "contract")):
+      title: str
+      company: Optional[str]
+      location: Optional[str] = None
+
+  jobs = [Job("Verkäufer/in", "Volg", "Schafisheim"), ...]
+  with open("jobs.json", "w", encoding="utf-8") as f:
+      record.dump(jobs, f)
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import IO, Any, ClassVar, Dict, Iterable, Optional, Tuple
+
+from . import jsonio
+
+
+class _RecordMeta(type):
+    """Turns annotated class attributes into slots; their values become defaults."""
+
+    def __new__(mcs, name, bases, ns, intern: Iterable[str] = ()):
+        own = tuple(f for f, ann in ns.get("__annotations__", {}).items() if "ClassVar" not in str(ann))
+        defaults = {f: ns.pop(f) for f in own if f in ns}
+        ns["__slots__"] = own
+        cls = super().__new__(mcs, name, bases, ns)
+        inherited = next((b for b in bases if isinstance(b, _RecordMeta)), None)
+        cls.FIELDS = (inherited.FIELDS if inherited else ()) + own
+        cls.DEFAULTS = {**(inherited.DEFAULTS if inherited else {}), **defaults}
+        cls.INTERN = (inherited.INTERN if inherited else frozenset()) | frozenset(intern)
+        with_default = [f in cls.DEFAULTS for f in cls.FIELDS]
+        if with_default != sorted(with_default):
+            raise TypeError(f"{name}: field without a default after a field with one")
+        return cls
+
+
+class Record(metaclass=_RecordMeta):
+    __slots__ = ()
+    FIELDS: ClassVar[Tuple[str, ...]] = ()
+    DEFAULTS: ClassVar[Dict[str, Any]] = {}
+    INTERN: ClassVar[frozenset] = frozenset()
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        fields = self.FIELDS
+        if len(args) > len(fields):
+            raise TypeError(f"{type(self).__name__}() takes {len(fields)} arguments, got {len(args)}")
+        values = dict(zip(fields, args))
+        for k, v in kwargs.items():
+            if k not in fields:
+                raise TypeError(f"{type(self).__name__}() got an unexpected argument {k!r}")
+            if k in values:
+                raise TypeError(f"{type(self).__name__}() got multiple values for {k!r}")
+            values[k] = v
+        intern = self.INTERN
+        for f in fields:
+            if f in values:
+                v = values[f]
+            elif f in self.DEFAULTS:
+                v = self.DEFAULTS[f]
+            else:
+                raise TypeError(f"{type(self).__name__}() missing argument {f!r}")
+            if f in intern and type(v) is str:
+                v = sys.intern(v)
+            object.__setattr__(self, f, v)
+
+    def astuple(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, f) for f in self.FIELDS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow: field values are shared, not copied."""
+        return {f: getattr(self, f) for f in self.FIELDS}
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.astuple() == other.astuple()
+
+    __hash__ = None  # mutable, like a dataclass
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(" + ", ".join(f"{f}={getattr(self, f)!r}" for f in self.FIELDS) + ")"
+
+
+def dump(records: Iterable[Any], f: IO[str], pretty: Optional[bool] = None) -> int:
+    """Write records (``Record`` or plain dicts) as a JSON array, one at a time; returns the count."""
+    pretty = jsonio.pretty_default() if pretty is None else pretty
+    sep = "\n  " if pretty else ""
+    n = 0
+    for r in records:
+        text = jsonio.dumps(r.to_dict() if isinstance(r, Record) else r, pretty)
+        f.write(("[" if n == 0 else ",") + sep + (text.replace("\n", sep) if pretty else text))  # no raw "\n" in strings
+        n += 1
+    f.write(("\n]" if pretty else "]") if n else "[]")
+    return n
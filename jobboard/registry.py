@@ -0,0 +1,210 @@
+"""
+Source registry built from ``Jobboard - Data Source.csv``.
+
+- Every CSV row becomes a ``Source`` (company, careers URL, expected
+  ``# offene Stellen``, ``gescraped?`` flag).
+- ``BINDINGS`` attaches a platform adapter (see ``jobboard.platforms``) and its
+  parameters to a row, plus where the scraped output lives in this repo.
+- Sources we scrape that are not (yet) listed in the CSV are added from
+  ``EXTRA_SOURCES``.
+
+Rows without a binding stay in the registry with ``platform=None`` so they
+show up in reports as not covered.
+"""
+
+from __future__ import annotations
+
+import csv
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from .paths import ROOT, SOURCES_CSV
+
+
+@dataclass
+class Source:
+    name: str                      # slug used on the command line and in state files
+    company: str
+    careers_url: Optional[str] = None
+    expected: Optional[int] = None  # "# offene Stellen" from the CSV
+    scraped: bool = False           # "gescraped?" flag from the CSV
+    platform: Optional[str] = None  # adapter name in jobboard.platforms
+    params: Dict[str, Any] = field(default_factory=dict)  # adapter settings ("host" overrides Source.host)
+    folder: Optional[str] = None    # folder in the repo, relative to ROOT
+    output: Optional[str] = None    # output file, relative to folder
+    items: str = ""                 # dotted path to the job list in the output ("" = top level)
+    total: Optional[str] = None     # dotted path to the site-reported total in the output
+
+    @property
+    def directory(self) -> Optional[Path]:
+        return ROOT / self.folder if self.folder else None
+
+    @property
+    def output_path(self) -> Optional[Path]:
+        if self.folder and self.output:
+            return ROOT / self.folder / self.output
+        return None
+
+    @property
+    def host(self) -> str:
+        """Host the source crawls; sources sharing one are run sequentially."""
+        if self.params.get("host"):
+            return self.params["host"]
+        url = self.params.get("url") or self.params.get("start_url") or self.careers_url or ""
+        return urlparse(url).netloc or self.name
+
+
+OHWS = "https://ohws.prospective.ch/public/v1/medium/{medium}/jobs"
+
+# CSV "Unternehmen" -> binding
+BINDINGS: Dict[str, Dict[str, Any]] = {
+    "Migros": dict(
+        name="migros", platform="graphql", folder="migros", output="migros.json", items="hits", total="total",
+        params={"url": "https://jobs.migros.ch/api/graphql/query/searchJobs",
+                "query_hash": "v8B6uvsJ4A", "language": "de", "operation": "searchJobs",
+                "variables": {"jobType": "JOB", "debug": False, "mode": "RESULTS",
+                              "settings": {"useFulltext": True, "vectorDistanceThreshold": 0.2}},
+                "per_page": 250}),
+    "Kanton Zürich": dict(name="kanton-zuerich", folder="kanton Zürich", output="download.json", items="jobs"),
+    "SBB": dict(name="sbb", folder="sbb", output="sbb.json"),
+    "Bundesverwaltung": dict(
+        name="bundesverwaltung", platform="ohws", folder="Bundesverwaltung", output="jobs.json", items="jobs",
+        total="total",
+        params={"url": OHWS.format(medium=1000624), "lang": "de"}),
+    "Schweizer Post": dict(
+        name="post", platform="script", folder="post", output="swisspost.json", items="items",
+        params={"script": "post.py"}),
+    "Kanton Bern": dict(
+        name="bern", platform="script", folder="kanton Bern", output="jobs_overview.json",
+        params={"script": "bern.py", "host": "ohws.prospective.ch"}),
+    "ETH Zürich": dict(
+        name="ethz", platform="script", folder="ETH Zürich", output="ethz_jobs.json",
+        params={"script": "eth.py"}),
+    "Kanton Genf": dict(
+        name="genf", platform="script", folder="Kanton Genf", output="ge_geneva_jobs.json",
+        params={"script": "genf.py"}),
+    "Kanton St.Gallen": dict(
+        name="st-gallen", platform="umantis", folder="Kanton St.Gallen", output="st_gallen_jobs.json",
+        params={"list_url": "https://recruitingapp-2800.umantis.com/Jobs/All"}),
+    "Raiffeisen": dict(
+        name="raiffeisen", platform="ohws", folder="raiffeisen", output="raiffeisen_jobs.json", items="jobs",
+        total="total",
+        params={"url": OHWS.format(medium=1950), "lang": "de"}),
+    "Kanton Aargau": dict(
+        name="aargau", platform="jsonapi", folder="Kanton Aargau", output="ag_jobs.json", items="jobs",
+        total="total",
+        params={"url": "https://www.ag.ch/io/jobs-proxy//jobs"}),
+    "CHUV (Universitätsspital Lausanne)": dict(
+        name="chuv", platform="script", folder="CHUV", output="chuv_jobs.json",
+        params={"script": "chuv.py"}),
+    "Fenaco": dict(
+        name="fenaco", platform="script", folder="fenaco", output="fenaco_jobs.json",
+        params={"script": "fenaco.py", "host": "jobs.fenaco.com"}),
+    "Insel Gruppe AG": dict(
+        name="insel", platform="ohws", folder="Insel Gruppe", output="jobs.json",
+        params={"url": OHWS.format(medium=1000666), "lang": "de", "unwrap": True}),
+    "Helsana": dict(
+        name="helsana", platform="sendpagination", folder="Helsana", output="helsana_jobs.json",
+        params={"start_url": "https://jobs.helsana.ch/?lang=de", "link_contains": ["/offene-stellen/", "/job/"],
+                "payload": {"limit": "12", "lang": "de"}}),
+    "EPFL": dict(
+        name="epfl", platform="script", folder="EPFL", output="epfl_personnel_scientifique.json",
+        params={"script": "epfl.py"}),
+    "die Mobiliar": dict(
+        name="mobiliar", platform="successfactors", folder="Mobiliar", output="mobiliar_jobs.json",
+        params={"start_url": "https://jobs.mobiliar.ch/go/Jobs/506974/"}),
+    "Rolex": dict(
+        name="rolex", platform="script", folder="Rolex", output="rolex_jobs.json",
+        params={"script": "rolex.py"}),
+    "Hirslanden": dict(
+        name="hirslanden", platform="script", folder="hirslanden", output="hirslanden_jobs.json",
+        params={"script": "hirslanden.py"}),
+    "Schindler": dict(
+        name="schindler", platform="script", folder="Schindler", output="schindler_jobs_ch.json",
+        params={"script": "schindler.py"}),
+    "Ruag": dict(
+        name="ruag", platform="script", folder="RUAG", output="ruag_jobs.json",
+        params={"script": "ruag.py"}),
+    "Suva": dict(
+        name="suva", platform="successfactors", folder="Suva", output="suva_jobs.json",
+        params={"start_url": "https://jobs.suva.ch/go/offene-Stellen/3914501/"}),
+    "Zürcher Kantonalbank": dict(
+        name="zkb", platform="script", folder="Zürcher Kantonalbank", output="zkb_jobs.json",
+        params={"script": "zkb.py"}),
+    "Implenia": dict(
+        name="implenia", platform="script", folder="Implenia", output="implenia_jobs.json",
+        params={"script": "implenia.py"}),
+    "Kanton Schaffhausen": dict(
+        name="schaffhausen", platform="umantis", folder="Kanton Schaffhausen", output="schaffhausen_jobs.json",
+        params={"list_url": "https://recruitingapp-2876.umantis.com/Jobs/1?lang=ger"}),
+}
+
+# Scraped sources that are not rows of the CSV
+EXTRA_SOURCES: List[Dict[str, Any]] = [
+    dict(name="aldi", company="Aldi Suisse", platform="jsonapi", folder="Aldi", output="aldi_jobs.json",
+         items="jobs", params={"url": "https://www.jobs.aldi.ch/rest/jobs/search"}),
+    dict(name="lidl", company="Lidl Schweiz", platform="script", folder="Lidl", output="lidl_jobs.json",
+         items="hits", total="reported_total", params={"script": "lidl.py", "host": "team.lidl.ch"}),
+    dict(name="spar", company="SPAR", platform="jsonapi", folder="SPAR", output="spar_jobs.json",
+         items="hydra:member", total="hydra:totalItems",
+         params={"url": "https://www.spar.ch/_api/success_factors_jobs/jobs?itemsPerPage=9999&page=1"
+                        "&companyUids%5B%5D=4&companyUids%5B%5D=9&companyUids%5B%5D=5&companyUids%5B%5D=7"
+                        "&companyUids%5B%5D=2&companyUids%5B%5D=10&companyUids%5B%5D=8&companyUids%5B%5D=3"
+                        "&companyUids%5B%5D=1&companyUids%5B%5D=6&companyUids%5B%5D=0"}),
+    dict(name="stadler", company="Stadler Rail", platform="jsonapi", folder="Stadler", output="stadler_jobs.json",
+         items="message.jobs",
+         params={"url": "https://www.stadlerrail.com/de/api/prospective-jobs?filter=25:1098730&search="}),
+    dict(name="hoch", company="H-OCH", platform="script", folder="HOCH", output="h_och_jobs.json",
+         params={"script": "hoch.py", "host": "jobs.h-och.ch"}),
+    dict(name="usz", company="Universitätsspital Zürich", platform="ohws", folder="Universitätsspital Zürich",
+         output="usz_jobs.json", items="jobs", total="total",
+         params={"url": OHWS.format(medium=1001134), "lang": "de", "filters": {"f": "25:1140601"}}),
+]
+
+
+def slugify(text: str) -> str:
+    text = text.replace("ü", "ue").replace("ö", "oe").replace("ä", "ae")
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def _int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int((value or "").strip())
+    except ValueError:
+        return None
+
+
+def load_sources(csv_path: Path = SOURCES_CSV) -> List[Source]:
+    sources: List[Source] = []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            company = (row.get("Unternehmen") or "").strip()
+            if not company:
+                continue
+            binding = dict(BINDINGS.get(company, {}))
+            sources.append(Source(
+                name=binding.pop("name", slugify(company)),
+                company=company,
+                careers_url=(row.get("offene Stellen Link") or "").strip() or None,
+                expected=_int(row.get("# offene Stellen")),
+                scraped=(row.get("gescraped?") or "").strip().lower() == "ja",
+                **binding,
+            ))
+    sources.extend(Source(**extra) for extra in EXTRA_SOURCES)
+    return sources
+
+
+def by_name(sources: List[Source]) -> Dict[str, Source]:
+    return {s.name: s for s in sources}
+
+
+def get_source(name: str, csv_path: Path = SOURCES_CSV) -> Source:
+    try:
+        return by_name(load_sources(csv_path))[name]
+    except KeyError:
+        raise KeyError(f"Unknown source {name!r}") from None
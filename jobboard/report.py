@@ -0,0 +1,139 @@
+"""
+Completeness and latency report for a run.
+
+For every source: expected count from the CSV, total reported by the site,
+collected count, changes since the previous snapshot, requests, bytes, wall
+time and time per job, plus flags:
+
+  failed   the source raised
+  short    collected < reported total, or < SHORT_RATIO of the CSV expectation
+  slow     more than SLOW_SECONDS_PER_JOB per collected job
+  no-data  nothing collected / output missing
+
+Written as JSON to ``.jobboard/reports/`` (timestamped + ``latest.json``) and
+printed as a table.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .paths import STATE_DIR
+
+REPORT_DIR = STATE_DIR / "reports"
+SHORT_RATIO = 0.9
+SLOW_SECONDS_PER_JOB = 0.5
+
+
+def _flags(row: Dict[str, Any]) -> List[str]:
+    flags = []
+    if not row["ok"]:
+        flags.append("failed")
+    collected = row["collected"]
+    if not collected:
+        flags.append("no-data")
+    else:
+        if row["reported_total"] is not None and collected < row["reported_total"]:
+            flags.append("short")
+        elif row["expected"] and collected < SHORT_RATIO * row["expected"]:
+            flags.append("short")
+        if row["seconds_per_job"] is not None and row["seconds_per_job"] > SLOW_SECONDS_PER_JOB:
+            flags.append("slow")
+    return flags
+
+
+def build_report(runs: Iterable) -> Dict[str, Any]:
+    """Turn engine ``SourceRun``s into a JSON-serialisable report."""
+    rows = []
+    for r in runs:
+        s = r.source
+        row = {
+            "source": s.name,
+            "company": s.company,
+            "platform": s.platform,
+            "ok": r.ok,
+            "skipped": r.skipped,
+            "error": r.error,
+            "expected": s.expected,
+            "reported_total": r.reported_total,
+            "collected": r.collected,
+            "changes": r.changes,
+            "requests": r.requests,
+            "bytes": r.bytes,
+            "seconds": round(r.seconds, 3),
+            "seconds_per_job": round(r.seconds / r.collected, 4) if r.collected else None,
+        }
+        row["flags"] = _flags(row)
+        rows.append(row)
+
+    def total(key: str) -> int:
+        return sum(row[key] or 0 for row in rows)
+
+    return {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "sources": rows,
+        "totals": {
+            "sources": len(rows),
+            "failed": sum(1 for row in rows if not row["ok"]),
+            "skipped": sum(1 for row in rows if row["skipped"]),
+            "flagged": sum(1 for row in rows if row["flags"]),
+            "collected": total("collected"),
+            "requests": total("requests"),
+            "bytes": total("bytes"),
+            "seconds": round(sum(row["seconds"] for row in rows), 3),
+        },
+    }
+
+
+def write_report(report: Dict[str, Any], path: Optional[Path] = None) -> Path:
+    if path is None:
+        REPORT_DIR.mkdir(parents=True, exist_ok=True)
+        stamp = report["generated_at"].replace(":", "").replace("-", "")
+        path = REPORT_DIR / f"run-{stamp}.json"
+        (REPORT_DIR / "latest.json").write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def _fmt(v: Any) -> str:
+    return "-" if v is None else str(v)
+
+
+def _fmt_bytes(n: Optional[int]) -> str:
+    if n is None:
+        return "-"
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f}{unit}"
+        n /= 1024
+    return f"{n:.1f}GB"
+
+
+def _fmt_changes(c: Optional[Dict[str, int]]) -> str:
+    return "-" if not c else f"+{c['added']} -{c['removed']} ~{c['modified']}"
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    header = ("source", "expected", "reported", "collected", "changes", "req", "bytes", "secs", "s/job", "flags")
+    lines = [header]
+    rows = sorted(report["sources"], key=lambda r: (not r["flags"], r["source"]))
+    for r in rows:
+        lines.append((
+            r["source"], _fmt(r["expected"]), _fmt(r["reported_total"]), _fmt(r["collected"]),
+            "unchanged" if r.get("skipped") else _fmt_changes(r.get("changes")),
+            _fmt(r["requests"]), _fmt_bytes(r["bytes"]), f"{r['seconds']:.1f}",
+            _fmt(r["seconds_per_job"]), ",".join(r["flags"]),
+        ))
+    widths = [max(len(row[i]) for row in lines) for i in range(len(header))]
+    out = ["  ".join(c.ljust(w) if i in (0, 9) else c.rjust(w) for i, (c, w) in enumerate(zip(row, widths))).rstrip()
+           for row in lines]
+    out.insert(1, "-" * len(out[0]))
+    t = report["totals"]
+    out.append(f"\n{t['sources']} sources, {t['failed']} failed, {t['flagged']} flagged; "
+               f"{t['collected']} jobs, {t['requests']} requests, {_fmt_bytes(t['bytes'])}, {t['seconds']:.1f}s")
+    return "\n".join(out)
@@ -0,0 +1,198 @@
+"""
+Per-source refresh intervals from observed churn.
+
+Sources change at very different speeds: a dozen EPFL postings may not move
+for a week while Migros or Coop turn over dozens a day. Instead of crawling
+everything at the same cadence, each source gets its own interval:
+
+- churn: after every run the engine records how many postings were added,
+  removed or modified since the previous snapshot and how many hours lay in
+  between (``.jobboard/schedule.json``, last ``WINDOW`` observations;
+  ``--learn`` replays the stored snapshots with ``jobboard.diff``). A run the
+  first-page probe skipped (``jobboard.probes``) counts as a check that found
+  no change since the previous snapshot or check;
+- rate: changes per hour over that window (total changes / total hours, so a
+  quiet week outweighs one busy hour). Without observations a prior of
+  ``PRIOR_DAILY_TURNOVER`` of the source's size (last snapshot, else the CSV
+  ``expected``) per day is used;
+- interval: the time until about ``TARGET_CHANGES`` changes are expected,
+  clamped to ``[MIN_HOURS, MAX_HOURS]``. A source is due once that much time
+  has passed since its last snapshot or check.
+
+Usage:
+  python -m jobboard.schedule              # plan: churn, interval, next refresh
+  python -m jobboard.schedule --learn      # (re)learn churn from stored snapshots
+  python run.py --due                      # run only the sources that are due
+"""
+
+from __future__ import annotations
+
+import argparse
+import calendar
+import json
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from . import diff, jsonio, registry, store
+from .paths import STATE_DIR
+from .registry import Source
+
+STATE_FILE = STATE_DIR / "schedule.json"
+WINDOW = 20                   # observations kept per source
+TARGET_CHANGES = 5.0          # refresh when about this many postings are expected to have changed
+MIN_HOURS, MAX_HOURS = 1.0, 7 * 24.0
+MIN_GAP_HOURS = 0.25          # snapshots closer than this say nothing about churn
+PRIOR_DAILY_TURNOVER = 0.03   # share of a source's postings assumed to change per day
+
+_lock = threading.Lock()  # sources on different hosts finish concurrently
+
+
+def _epoch(stamp: str) -> float:
+    return float(calendar.timegm(time.strptime(stamp, "%Y%m%dT%H%M%SZ")))
+
+
+def _load(path: Path = STATE_FILE) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save(state: dict, path: Path = STATE_FILE) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    jsonio.write(tmp, state, pretty=True)
+    tmp.replace(path)
+
+
+# ---------- observations ----------
+def _observe(state: dict, name: str, stamp: str, since: float, changes: int) -> bool:
+    """Note ``changes`` between epoch ``since`` and ``stamp``."""
+    hours = (_epoch(stamp) - since) / 3600
+    if hours < MIN_GAP_HOURS:
+        return False
+    obs = state.setdefault(name, {}).setdefault("observed", [])
+    if any(o[0] == stamp for o in obs):
+        return False
+    obs.append([stamp, round(hours, 3), changes])
+    obs.sort()
+    del obs[:-WINDOW]
+    return True
+
+
+def record(name: str, changes: Optional[Dict[str, int]]) -> None:
+    """Note the changes between the source's two latest snapshots (``diff.summarize`` counts)."""
+    old, new = diff.pick(name)
+    if old is None or new is None or changes is None:
+        return
+    with _lock:
+        state = _load()
+        since = max(_epoch(store.stamp_of(old)), state.get(name, {}).get("checked", 0.0))
+        if _observe(state, name, store.stamp_of(new), since, sum(changes.values())):
+            _save(state)
+
+
+def record_unchanged(name: str) -> None:
+    """Note a run the probe skipped: no change since the latest snapshot or check."""
+    with _lock:
+        state = _load()
+        last = _last_run(name, state)
+        stamp = store.stamp_now()
+        if last is not None and _observe(state, name, stamp, last, 0):
+            state[name]["checked"] = _epoch(stamp)
+            _save(state)
+
+
+def learn(name: str) -> int:
+    """Replay every pair of consecutive snapshots; returns the number of observations."""
+    state = _load()
+    state.pop(name, None)
+    paths = store.snapshots(name)
+    for old, new in zip(paths, paths[1:]):
+        _observe(state, name, store.stamp_of(new), _epoch(store.stamp_of(old)),
+                 sum(diff.summarize(diff.diff_paths(old, new)).values()))
+    _save(state)
+    return len(state.get(name, {}).get("observed", []))
+
+
+# ---------- planning ----------
+@dataclass
+class Plan:
+    source: Source
+    last_run: Optional[float]     # epoch of the latest snapshot or probe check
+    rate_per_day: float           # expected changed postings per day
+    learned: bool                 # rate from observations (else the prior)
+    interval_hours: float
+
+    @property
+    def next_due(self) -> float:
+        return (self.last_run or 0.0) + self.interval_hours * 3600
+
+    def due(self, now: Optional[float] = None) -> bool:
+        return self.last_run is None or self.next_due <= (time.time() if now is None else now)
+
+
+def _last_run(name: str, state: dict) -> Optional[float]:
+    paths = store.snapshots(name)
+    runs = [_epoch(store.stamp_of(paths[-1]))] if paths else []
+    if "checked" in state.get(name, {}):
+        runs.append(state[name]["checked"])
+    return max(runs) if runs else None
+
+
+def _size(source: Source, latest: Optional[Path]) -> int:
+    if latest is not None:
+        return sum(1 for _ in store.read_index(latest))
+    return source.expected or 0
+
+
+def plan_for(source: Source, state: Optional[dict] = None) -> Plan:
+    state = _load() if state is None else state
+    paths = store.snapshots(source.name)
+    latest = paths[-1] if paths else None
+    obs = state.get(source.name, {}).get("observed", [])
+    hours = sum(o[1] for o in obs)
+    if hours:
+        per_hour, learned = sum(o[2] for o in obs) / hours, True
+    else:
+        per_hour, learned = PRIOR_DAILY_TURNOVER * _size(source, latest) / 24, False
+    interval = MAX_HOURS if per_hour <= 0 else min(MAX_HOURS, max(MIN_HOURS, TARGET_CHANGES / per_hour))
+    return Plan(source, _last_run(source.name, state), per_hour * 24, learned, interval)
+
+
+def plan(sources: Iterable[Source]) -> List[Plan]:
+    """Plans for ``sources``, soonest due first."""
+    state = _load()
+    return sorted((plan_for(s, state) for s in sources), key=lambda p: p.next_due)
+
+
+def due(sources: Iterable[Source], now: Optional[float] = None) -> List[Source]:
+    return [p.source for p in plan(sources) if p.due(now)]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("sources", nargs="*", help="source names (default: all runnable)")
+    ap.add_argument("--learn", action="store_true", help="relearn churn from the stored snapshots first")
+    args = ap.parse_args(argv)
+
+    from .engine import runnable  # the engine imports this module
+    sources = [registry.get_source(n) for n in args.sources] if args.sources else runnable(registry.load_sources())
+    if args.learn:
+        for s in sources:
+            print(f"[schedule] {s.name}: {learn(s.name)} observation(s)")
+    now = time.time()
+    print(f"{'source':<22} {'changes/day':>11} {'':<7} {'every':>7}  next")
+    for p in plan(sources):
+        when = "now" if p.due(now) else time.strftime("%Y-%m-%d %H:%M", time.gmtime(p.next_due))
+        print(f"{p.source.name:<22} {p.rate_per_day:>11.1f} {'' if p.learned else '(prior)':<7} "
+              f"{p.interval_hours:>6.1f}h  {when}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+"""
+Full-text search over every source's postings (titles and descriptions).
+
+One index segment per source under ``.jobboard/index/``, rebuilt from the
+source's snapshot after each successful run (so the index grows incrementally,
+source by source, instead of rescanning every output file):
+
+- ``<source>.json``: stored fields per doc (``DOC_FIELDS``), doc lengths, the
+  sorted term list with each term's offset/length/df into the postings file,
+- ``<source>.post``: per term, varint-encoded ``(doc-id gap, tf)`` pairs.
+
+Tokenization folds case and accents, splits gender forms (``Mitarbeiter:in``,
+``Chef-fe``) and elisions (``l'``, ``dell'``), detects the doc's language
+(de/fr/it/en) from stopwords and applies that language's light stemmer. Query
+terms are stemmed with all four, so "infirmière" finds "infirmier". Title
+tokens count ``TITLE_BOOST`` times. Ranking is BM25 with corpus-wide statistics;
+``term*`` is a prefix query on the sorted term list.
+
+Usage:
+  python -m jobboard.search --build --all           # (re)build every segment
+  python -m jobboard.search "pflegefach*"           # all terms must match
+  python -m jobboard.search "infirmier nuit" --any --source chuv -n 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import json
+import math
+import re
+import sys
+import time
+import unicodedata
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from . import geo, history, jsonio, registry, store
+from .paths import STATE_DIR
+from .registry import Source
+
+INDEX_DIR = STATE_DIR / "index"
+LANGUAGES = ("de", "fr", "it", "en")
+TITLE_BOOST = 3
+K1, B = 1.2, 0.75
+MAX_EXPANSIONS = 128          # index terms a prefix query may expand to
+CACHE_SIZE = 2048             # decoded posting lists kept per segment
+# Stored per doc, precomputed for filtering (``jobboard.api``)
+DOC_FIELDS = ("key", "title", "location", "employer", "url", "lang", "workload_min", "workload_max",
+              "contract", "first_seen", "canton", "points")
+
+STOPWORDS = {
+    "de": frozenset("der die das und oder in im am an auf fur mit von zu zum zur bei als ein eine einer eines "
+                    "sie ihre wir unser unsere ist sind den dem des auch sowie".split()),
+    "fr": frozenset("le la les des du de et ou en au aux un une pour avec dans sur par vous nous notre votre "
+                    "est sont qui que ce cette".split()),
+    "it": frozenset("il lo la gli le dei delle del della di e o in un una uno per con nel nella su da "
+                    "che sono siamo nostro vostro".split()),
+    "en": frozenset("the and or of in on at to for with an by from you we our your is are as this that".split()),
+}
+_ALL_STOPWORDS = frozenset().union(*STOPWORDS.values())
+
+_GENDER_RE = re.compile(r"(\w)(?:[:*/·]-?|-)(?:in|innen|e|fe|ere|euse|rice|trice|se|ne)\b")
+_ELISION_RE = re.compile(r"\b(?:l|d|j|m|n|s|t|c|qu|dell|dall|nell|all|sull|un)['’]")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+# ---------- analysis ----------
+def fold(text: str) -> str:
+    text = unicodedata.normalize("NFKD", text.replace("ß", "ss"))
+    return "".join(c for c in text if not unicodedata.combining(c)).lower()
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Folded word tokens; gender suffixes and elided articles dropped."""
+    if not text:
+        return []
+    text = _ELISION_RE.sub(" ", _GENDER_RE.sub(r"\1", fold(text)))
+    return _TOKEN_RE.findall(text)
+
+
+def detect_language(tokens: Iterable[str]) -> str:
+    hits = dict.fromkeys(LANGUAGES, 0)
+    for tok in tokens:
+        if tok in _ALL_STOPWORDS:
+            for lang in LANGUAGES:
+                if tok in STOPWORDS[lang]:
+                    hits[lang] += 1
+    return max(LANGUAGES, key=lambda lang: hits[lang])  # ties (no hits) -> "de"
+
+
+def _strip(tok: str, suffixes: Tuple[str, ...], keep: int) -> str:
+    for suf in suffixes:
+        if tok.endswith(suf) and len(tok) - len(suf) >= keep:
+            return tok[: -len(suf)]
+    return tok
+
+
+def stem(tok: str, lang: str) -> str:
+    """Light stemming: plural, feminine and common inflection endings only."""
+    if len(tok) <= 3 or tok.isdigit():
+        return tok
+    if lang == "de":
+        if tok.endswith("innen") and len(tok) > 8:
+            tok = tok[:-5]
+        elif tok.endswith("erin") and len(tok) > 6:
+            tok = tok[:-2]
+        return _strip(tok, ("ern", "em", "er", "en", "es", "e", "s", "n"), 4)
+    if lang == "fr":
+        tok = _strip(tok, ("s", "x"), 4)
+        for fem, masc in (("euse", "eur"), ("trice", "teur"), ("ienne", "ien"), ("ere", "er"), ("ive", "if")):
+            if tok.endswith(fem) and len(tok) > len(fem) + 2:
+                return tok[: -len(fem)] + masc
+        return _strip(tok, ("e",), 4)
+    if lang == "it":
+        return _strip(tok, ("a", "e", "i", "o"), 4)
+    if tok.endswith("ies") and len(tok) > 4:
+        return tok[:-3] + "y"
+    return tok if tok.endswith("ss") else _strip(tok, ("s",), 3)
+
+
+def analyze(text: Optional[str], lang: str) -> List[str]:
+    return [stem(t, lang) for t in tokenize(text) if t not in STOPWORDS[lang]]
+
+
+# ---------- postings encoding ----------
+def _varint(n: int, out: bytearray) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def encode_postings(postings: List[Tuple[int, int]]) -> bytes:
+    out, prev = bytearray(), 0
+    for doc, tf in postings:
+        _varint(doc - prev, out)
+        _varint(tf, out)
+        prev = doc
+    return bytes(out)
+
+
+def decode_postings(data: bytes) -> List[Tuple[int, int]]:
+    out: List[Tuple[int, int]] = []
+    vals, n, shift, doc = [], 0, 0, 0
+    for byte in data:
+        n |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        vals.append(n)
+        n, shift = 0, 0
+        if len(vals) == 2:
+            doc += vals[0]
+            out.append((doc, vals[1]))
+            vals = []
+    return out
+
+
+# ---------- segments ----------
+def _rows(source: Source, snapshot: Optional[Path]) -> Iterator[Tuple[str, dict]]:
+    if snapshot is not None:
+        for key, _, item in store.read(snapshot):
+            yield key, item
+        return
+    items = store.load_items(source)
+    keyer = store.keyer_for(source, items)
+    for item in items:
+        yield keyer.key(item), item
+
+
+def build_segment(source: Source, snapshot: Optional[Path] = None) -> Optional[Path]:
+    """Index the source's postings (its newest snapshot by default); returns the segment path."""
+    if snapshot is None:
+        snapshot = (store.snapshots(source.name) or [None])[-1]
+    first_seen = {key: first for key, first, _, _ in history.History.load(source.name).lifetimes()}
+    docs, lengths = [], []
+    postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    for key, item in _rows(source, snapshot):
+        fields = store.normalize(item, source)
+        desc = store.description(item)
+        body = " ".join(filter(None, (fields["location"], fields["employer"], desc)))
+        lang = detect_language(tokenize(f"{fields['title'] or ''} {body}"))
+        tf: Dict[str, int] = defaultdict(int)
+        for term in analyze(fields["title"], lang):
+            tf[term] += TITLE_BOOST
+        for term in analyze(body, lang):
+            tf[term] += 1
+        doc = len(docs)
+        pensum = store.workload(fields["title"]) or store.workload(desc) or (None, None)
+        places = geo.resolve_all(fields["location"])
+        docs.append([key, fields["title"], fields["location"], fields["employer"], fields["url"], lang,
+                     pensum[0], pensum[1], store.contract_type(fields["title"], desc), first_seen.get(key),
+                     places[0].canton if places else None,
+                     [[p.lat, p.lon] for p in places if p.precision == "place"]])
+        lengths.append(sum(tf.values()))
+        for term, n in tf.items():
+            postings[term].append((doc, n))
+    if not docs:
+        return None
+
+    terms = sorted(postings)
+    blob, offsets, dfs = bytearray(), [], []
+    for term in terms:
+        offsets.append(len(blob))
+        blob += encode_postings(postings[term])
+        dfs.append(len(postings[term]))
+    offsets.append(len(blob))
+
+    INDEX_DIR.mkdir(parents=True, exist_ok=True)
+    meta_path, post_path = INDEX_DIR / f"{source.name}.json", INDEX_DIR / f"{source.name}.post"
+    post_tmp, meta_tmp = post_path.with_suffix(".post.tmp"), meta_path.with_suffix(".json.tmp")
+    post_tmp.write_bytes(bytes(blob))
+    jsonio.write(meta_tmp, {"source": source.name, "docs": docs, "lengths": lengths, "terms": terms,
+                            "offsets": offsets, "dfs": dfs}, pretty=False)
+    post_tmp.replace(post_path)
+    meta_tmp.replace(meta_path)
+    return meta_path
+
+
+class Segment:
+    def __init__(self, name: str):
+        self.name = name
+        meta = json.loads((INDEX_DIR / f"{name}.json").read_text(encoding="utf-8"))
+        self.docs: List[list] = meta["docs"]
+        self.lengths: List[int] = meta["lengths"]
+        self.terms: List[str] = meta["terms"]
+        self.offsets: List[int] = meta["offsets"]
+        self.dfs: List[int] = meta["dfs"]
+        self.blob = (INDEX_DIR / f"{name}.post").read_bytes()
+        self._cache: "OrderedDict[int, List[Tuple[int, int]]]" = OrderedDict()
+
+    def find(self, term: str) -> int:
+        i = bisect.bisect_left(self.terms, term)
+        return i if i < len(self.terms) and self.terms[i] == term else -1
+
+    def prefixed(self, prefix: str) -> range:
+        lo = bisect.bisect_left(self.terms, prefix)
+        hi = bisect.bisect_left(self.terms, prefix + "￿")
+        return range(lo, hi)
+
+    def postings(self, i: int) -> List[Tuple[int, int]]:
+        hit = self._cache.get(i)
+        if hit is not None:
+            self._cache.move_to_end(i)
+            return hit
+        hit = decode_postings(self.blob[self.offsets[i]:self.offsets[i + 1]])
+        self._cache[i] = hit
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return hit
+
+
+@dataclass
+class Hit:
+    score: float
+    source: str
+    key: str
+    title: Optional[str]
+    location: Optional[str]
+    employer: Optional[str]
+    url: Optional[str]
+
+    def to_dict(self) -> dict:
+        return {"score": round(self.score, 4), "source": self.source, "key": self.key, "title": self.title,
+                "location": self.location, "employer": self.employer, "url": self.url}
+
+
+class Index:
+    """All segments, with corpus-wide BM25 statistics."""
+
+    def __init__(self, names: Optional[Iterable[str]] = None):
+        if names is None:
+            names = sorted(p.stem for p in INDEX_DIR.glob("*.json")) if INDEX_DIR.exists() else []
+        self.segments = [Segment(n) for n in names if (INDEX_DIR / f"{n}.json").exists()]
+        self.num_docs = sum(len(s.docs) for s in self.segments)
+        self.avgdl = (sum(sum(s.lengths) for s in self.segments) / self.num_docs) if self.num_docs else 1.0
+        self._df: Dict[str, int] = {}
+
+    def df(self, term: str) -> int:
+        n = self._df.get(term)
+        if n is None:
+            n = 0
+            for seg in self.segments:
+                i = seg.find(term)
+                if i >= 0:
+                    n += seg.dfs[i]
+            self._df[term] = n
+        return n
+
+    def _expand(self, seg: Segment, word: str) -> Set[int]:
+        """Term ids in ``seg`` for one query word (all-language stems, or a prefix range)."""
+        if word.endswith("*"):
+            raw = word.rstrip("*")
+            prefix = min([raw] + [stem(raw, lang) for lang in LANGUAGES], key=len)
+            ids = seg.prefixed(prefix)
+            if len(ids) > MAX_EXPANSIONS:
+                return set(sorted(ids, key=lambda i: -seg.dfs[i])[:MAX_EXPANSIONS])
+            return set(ids)
+        found = (seg.find(t) for t in {word} | {stem(word, lang) for lang in LANGUAGES})
+        return {i for i in found if i >= 0}
+
+    def scored(self, query: str, sources: Optional[Iterable[str]] = None,
+               require_all: bool = True) -> List[Tuple[float, Segment, int]]:
+        """Every matching ``(score, segment, doc id)``, best first."""
+        words = [w + ("*" if raw.endswith("*") else "") for raw in query.split()
+                 for w in tokenize(raw.rstrip("*")) if w not in _ALL_STOPWORDS or raw.endswith("*")]
+        if not words:
+            return []
+        wanted = set(sources) if sources else None
+        hits: List[Tuple[float, Segment, int]] = []
+        for seg in self.segments:
+            if wanted is not None and seg.name not in wanted:
+                continue
+            scores: Dict[int, float] = defaultdict(float)
+            matched: Dict[int, int] = defaultdict(int)
+            for w in words:
+                seen: Set[int] = set()
+                for ti in self._expand(seg, w):
+                    df = self.df(seg.terms[ti])
+                    idf = math.log(1 + (self.num_docs - df + 0.5) / (df + 0.5))
+                    for doc, tf in seg.postings(ti):
+                        norm = K1 * (1 - B + B * seg.lengths[doc] / self.avgdl)
+                        scores[doc] += idf * tf * (K1 + 1) / (tf + norm)
+                        seen.add(doc)
+                for doc in seen:
+                    matched[doc] += 1
+            need = len(words) if require_all else 1
+            hits += [(score, seg, doc) for doc, score in scores.items() if matched[doc] >= need]
+        hits.sort(key=lambda h: -h[0])
+        return hits
+
+    def search(self, query: str, limit: int = 10, sources: Optional[Iterable[str]] = None,
+               require_all: bool = True) -> List[Hit]:
+        return [Hit(score, seg.name, *seg.docs[doc][:5])
+                for score, seg, doc in self.scored(query, sources, require_all)[:limit]]
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("query", nargs="*")
+    ap.add_argument("--build", nargs="*", metavar="SOURCE", help="(re)build these segments")
+    ap.add_argument("--all", action="store_true", help="with --build: every source with an output file")
+    ap.add_argument("--source", action="append", help="restrict the query to a source (repeatable)")
+    ap.add_argument("--any", action="store_true", help="rank docs matching any term, not only all")
+    ap.add_argument("-n", type=int, default=10)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args(argv)
+
+    if args.build is not None:
+        sources = registry.load_sources() if args.all or not args.build else [registry.get_source(n)
+                                                                               for n in args.build]
+        for source in sources:
+            t0 = time.perf_counter()
+            path = build_segment(source)
+            if path:
+                print(f"[search] {source.name}: indexed in {time.perf_counter() - t0:.2f}s")
+    if not args.query:
+        return 0
+
+    index = Index()
+    t0 = time.perf_counter()
+    hits = index.search(" ".join(args.query), args.n, args.source, require_all=not args.any)
+    ms = (time.perf_counter() - t0) * 1000
+    for h in hits:
+        print(json.dumps(h.to_dict(), ensure_ascii=False) if args.json else
+              f"{h.score:6.2f}  {h.source:<18} {h.title} | {h.location or '-'} | {h.url or '-'}")
+    print(f"[search] {len(hits)} hits of {index.num_docs} docs in {ms:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
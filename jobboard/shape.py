@@ -0,0 +1,176 @@
+"""
+Find the job list in an API payload once per source, then look it up directly.
+
+Feeds wrap their job list differently (a bare list, ``{"items": [...]}``,
+``{"data": {"items": [...]}}``, ``{"jobItems": [...], "hasMoreJobItems": ...}``).
+Instead of probing a list of keys on every page, ``JobList`` sniffs the path
+on the first payload and remembers it:
+
+- sniffing prefers the usual keys (``LIST_KEYS``, also one level down), then
+  the largest list of objects anywhere within ``MAX_DEPTH`` levels;
+- the decision is kept per source in ``.jobboard/shapes/<source>.json``
+  (path and whether items are objects), so later runs skip sniffing
+  entirely. One file per source: scrapers on different hosts run at the
+  same time and never write each other's entries;
+- every later payload is a plain ``get_path`` plus a type check. When the
+  path is gone or holds something else, the payload is sniffed again and the
+  drift is printed and recorded with the source's entry, instead of the page
+  quietly yielding ``[]``.
+
+Usage:
+  jobs = JobList("chuv")
+  items = jobs.extract(payload)         # list, [] only if the payload has none
+
+  python -m jobboard.shape              # cached paths and recorded drift
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .jsonpath import get_path
+from .paths import STATE_DIR
+
+CACHE_DIR = STATE_DIR / "shapes"
+LIST_KEYS = ("items", "jobs", "jobItems", "results", "rows", "offers", "vacancies", "hits", "data")
+MAX_DEPTH = 3
+MAX_DRIFT = 20  # drift events kept per source
+
+
+def _kind(items: List[Any]) -> Optional[str]:
+    if not items:
+        return None
+    return "object" if isinstance(items[0], dict) else "scalar"
+
+
+def _lists(node: Any, prefix: str, depth: int) -> List[Tuple[str, List[Any]]]:
+    """Every ``(path, list)`` below ``node`` within ``depth`` levels of dicts."""
+    out: List[Tuple[str, List[Any]]] = []
+    if depth == 0 or not isinstance(node, dict):
+        return out
+    for k, v in node.items():
+        path = f"{prefix}.{k}" if prefix else str(k)
+        if isinstance(v, list):
+            out.append((path, v))
+        elif isinstance(v, dict):
+            out.extend(_lists(v, path, depth - 1))
+    return out
+
+
+def sniff(payload: Any) -> Optional[str]:
+    """Dotted path of the job list in ``payload`` (``""`` = the payload itself), None if there is none."""
+    if isinstance(payload, list):
+        return ""
+    if not isinstance(payload, dict):
+        return None
+    for key in LIST_KEYS:
+        v = payload.get(key)
+        if isinstance(v, list):
+            return key
+        if isinstance(v, dict):
+            for inner in LIST_KEYS:
+                if isinstance(v.get(inner), list):
+                    return f"{key}.{inner}"
+    found = _lists(payload, "", MAX_DEPTH)
+    objects = [(len(v), path) for path, v in found if _kind(v) == "object"]
+    if objects:
+        return max(objects)[1]
+    return found[0][0] if found else None
+
+
+class JobList:
+    def __init__(self, source: str, cache_dir: Path = CACHE_DIR):
+        self.source = source
+        self.cache_file = Path(cache_dir) / f"{source}.json"
+        self._entry: Optional[dict] = None
+        entry = self._load()
+        self.path: Optional[str] = entry.get("path")
+        self.kind: Optional[str] = entry.get("kind")
+
+    # ---------- cache ----------
+    def _load(self) -> dict:
+        if self._entry is None:
+            self._entry = _read(self.cache_file)
+        return self._entry
+
+    def _save(self) -> None:
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_file.with_name(f"{self.cache_file.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(self._load(), indent=2, sort_keys=True), encoding="utf-8")
+        tmp.replace(self.cache_file)
+
+    def _remember(self, path: str, kind: Optional[str], drift: Optional[Dict[str, Any]] = None) -> None:
+        entry = self._load()
+        entry.update(path=path, kind=kind, sniffed_at=time.time())
+        if drift:
+            entry["drift"] = (entry.get("drift") or [])[-(MAX_DRIFT - 1):] + [drift]
+        self.path, self.kind = path, kind
+        self._save()
+
+    # ---------- extraction ----------
+    def _valid(self, value: Any) -> bool:
+        if not isinstance(value, list):
+            return False
+        return not value or self.kind is None or _kind(value) == self.kind
+
+    def extract(self, payload: Any) -> List[Any]:
+        if self.path is not None:
+            value = get_path(payload, self.path)
+            if self._valid(value):
+                if self.kind is None and value:  # first non-empty page fixes the item kind
+                    self._remember(self.path, _kind(value))
+                return value
+
+        path = sniff(payload)
+        items = get_path(payload, path) if path is not None else None
+        if self.path is None:
+            if path is None:
+                print(f"[shape] {self.source}: no job list in payload ({_outline(payload)})")
+                return []
+            self._remember(path, _kind(items))
+            return items
+
+        if path is None:
+            print(f"[shape] {self.source}: job list at {self.path!r} is gone and none found ({_outline(payload)})")
+            return []
+        print(f"[shape] {self.source}: job list moved from {self.path!r} to {path!r}")
+        self._remember(path, _kind(items), {"at": time.time(), "from": self.path, "to": path})
+        return items
+
+
+def _read(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _outline(payload: Any) -> str:
+    if isinstance(payload, dict):
+        return "keys: " + ", ".join(map(str, list(payload)[:10]))
+    return type(payload).__name__
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--cache", type=Path, default=CACHE_DIR)
+    args = ap.parse_args(argv)
+
+    for path in sorted(args.cache.glob("*.json")):
+        source, entry = path.stem, _read(path)
+        print(f"{source:<20} {entry.get('path')!r:<20} {entry.get('kind') or '-'}")
+        for d in entry.get("drift") or []:
+            when = time.strftime("%Y-%m-%d %H:%M", time.gmtime(d["at"]))
+            print(f"  {when}  {d['from']!r} -> {d['to']!r}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+"""
+Per-run snapshots of every source's job list.
+
+After each successful run the engine archives the source's output as
+``.jobboard/snapshots/<source>/<stamp>.tsv.gz``: one line per job, sorted by
+key, as ``key<TAB>fingerprint<TAB>codes-json<TAB>item-json``.
+
+- key: ``ItemKeyer`` on the source's items; the learned field is saved in
+  ``keyer.json`` and reused, so keys stay comparable between runs. A
+  ``keyer.json`` from an older ``KEYER_VERSION`` is relearned, and the
+  source's snapshots are re-keyed with it (``rewrite``).
+- fingerprint: 64-bit hash of the item's canonical JSON, minus
+  ``VOLATILE_FIELDS`` (page offsets etc. that change without the job changing).
+- codes, item: the item with its categorical fields dictionary-encoded by
+  the source's ``columns.Codec`` (``codes.json``); ``read`` and ``decode``
+  return the item as the source wrote it. Lines of older snapshots hold the
+  plain item and are read as such until re-encoded (``rewrite``).
+
+Sorted keys let ``jobboard.diff`` compare two runs in one streaming pass.
+
+``normalize()`` maps a source's item onto common fields (title, location,
+employer, url) for cross-source work such as ``jobboard.dedup``;
+``description()`` gathers its free-text fields as plain text, ``workload()``
+and ``contract_type()`` read the pensum and contract kind out of such text.
+
+Usage:
+  from jobboard import store
+  path = store.archive(source)          # after the output file was written
+  for key, fp, item in store.read(path): ...
+"""
+
+from __future__ import annotations
+
+import gzip
+import html
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import jsonio, jsonstream
+from .jsonpath import get_path
+from .keys import KEYER_VERSION, VOLATILE_FIELDS, ItemKeyer, fingerprint
+from .paths import STATE_DIR
+from .registry import Source
+from .vocab import Vocabulary
+
+SNAPSHOT_DIR = STATE_DIR / "snapshots"
+SUFFIX = ".tsv.gz"
+LEARN_SAMPLE = 200
+
+# Candidate paths per common field, first non-empty wins (ohws "attributes" hold lists)
+FIELD_PATHS: Dict[str, Tuple[str, ...]] = {
+    "title": ("title", "title.value", "title.title", "document.title", "jobTitle", "Titre", "stelle",
+              "title_list"),
+    "location": ("location.city", "location", "city", "locations", "arbeitsort", "attributes.arbeitsort",
+                 "Lieu", "site", "info.location", "document.addressLocality", "market.city", "attributes.100"),
+    "employer": ("company", "facility", "info.department", "attributes.verwaltungseinheit", "document.brand",
+                 "market.name", "org.name", "department"),
+    "url": ("url", "detail_url", "teaser_url", "weblink", "stelle_url", "linkDetailPage", "links.directlink",
+            "document.link", "link"),
+}
+# Free-text fields, all present ones are joined (ohws "szas" blocks are HTML)
+DESCRIPTION_PATHS: Tuple[str, ...] = (
+    "szas.sza_introduction", "szas.sza_tasks", "szas.sza_requirements", "text", "htmlContent", "summary",
+    "snippet", "descResponsibilities", "description", "employment_type", "company_department",
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+# "80-100%", "80 – 100 %", "60 bis 80%", "100%"
+_WORKLOAD_RE = re.compile(r"(?<!\d)(\d{1,3})\s*%?\s*(?:-|–|bis|à|a)\s*(\d{1,3})\s*%|(?<!\d)(\d{1,3})\s*%")
+# Checked in order: a "Lehrstelle ... befristet" is an apprenticeship, not a temporary job
+CONTRACT_TYPES: Dict[str, Vocabulary] = {
+    label: Vocabulary(terms, whole_words=True, ignore_case=True) for label, terms in (
+        ("apprenticeship", ["Lehrstelle", "Lehre", "Lernende", "Lernender", "Apprentissage", "Apprenti",
+                            "Apprentie", "Apprendista", "Apprendistato", "Apprenticeship"]),
+        ("internship", ["Praktikum", "Praktikantin", "Praktikant", "Praktikumsstelle", "Stage", "Stagiaire",
+                        "Tirocinio", "Stagista", "Internship", "Intern"]),
+        ("doctoral", ["Doktorand", "Doktorandin", "Doctoral", "Doctorant", "Doctorante", "PhD", "Postdoc",
+                      "Post-doc", "Postdoctoral"]),
+        ("temporary", ["befristet", "befristete", "Aushilfe", "temporär", "Temporärstelle", "CDD",
+                       "durée déterminée", "temporaire", "tempo determinato", "temporary", "fixed-term"]),
+        ("permanent", ["unbefristet", "unbefristete", "Festanstellung", "CDI", "durée indéterminée",
+                       "tempo indeterminato", "permanent"]),
+    )
+}
+
+
+def source_dir(name: str) -> Path:
+    return SNAPSHOT_DIR / name
+
+
+def stamp_now() -> str:
+    return time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+
+
+def iter_items(source: Source) -> Iterator[Dict[str, Any]]:
+    """Job items of the source's current output file, streamed one at a time (none if missing)."""
+    path = source.output_path
+    if path is None or not path.exists():
+        return
+    for it in jsonstream.iter_records(path, source.items or ""):
+        if isinstance(it, dict):
+            yield it
+
+
+def load_items(source: Source) -> List[Dict[str, Any]]:
+    """Job items of the source's current output file (``[]`` if missing)."""
+    return list(iter_items(source))
+
+
+def keyer_for(source: Source, items: List[Dict[str, Any]]) -> ItemKeyer:
+    """The source's saved keyer, or one learned from ``items`` and saved (re-keying older snapshots)."""
+    spec_path = source_dir(source.name) / "keyer.json"
+    stale = False
+    if spec_path.exists():
+        spec = json.loads(spec_path.read_text(encoding="utf-8"))
+        if spec.get("version") == KEYER_VERSION:
+            return ItemKeyer.from_spec(spec)
+        stale = True
+    keyer = ItemKeyer()
+    keyer.learn(items[:LEARN_SAMPLE])
+    if keyer.learned:
+        spec_path.parent.mkdir(parents=True, exist_ok=True)
+        spec_path.write_text(json.dumps(keyer.spec()), encoding="utf-8")
+        if stale:
+            rewrite(source, keyer)
+    return keyer
+
+
+def _rows(keyer: ItemKeyer, items: Iterable[Dict[str, Any]]) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    rows: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    for item in items:
+        rows.setdefault(_clean_key(keyer.key(item)), (fingerprint(item), item))  # first one wins
+    return rows
+
+
+def _write(path: Path, rows: Dict[str, Tuple[str, Dict[str, Any]]], source: Source, codec) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=6) as f:
+        for key in sorted(rows):
+            fp, item = rows[key]
+            codes, stored = codec.encode(item, source)
+            f.write(f"{key}\t{fp}\t{jsonio.dumps(codes, pretty=False)}\t{jsonio.dumps(stored, pretty=False)}\n")
+    tmp.replace(path)
+
+
+def rewrite(source: Source, keyer: Optional[ItemKeyer] = None) -> int:
+    """Re-encode the source's snapshots; with ``keyer``, re-key them too and rebuild what derives from keys."""
+    from . import columns, history  # both import this module
+
+    codec = columns.Codec.load(source.name)
+    paths = snapshots(source.name)
+    for path in paths:
+        items = [item for _, _, item in read(path)]
+        codec.learn(items[:LEARN_SAMPLE])
+        _write(path, _rows(keyer or keyer_for(source, items), items), source, codec)
+    codec.save()
+    _codecs.pop(source.name, None)
+    if paths and keyer is not None:
+        history.rebuild(source.name)
+        print(f"[store] {source.name}: re-keyed {len(paths)} snapshot(s) ({keyer.spec()})")
+    return len(paths)
+
+
+def _scalar(value: Any) -> Optional[str]:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = next((value[k] for k in ("label", "title", "name", "value") if value.get(k)), None)
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    text = " ".join(str(value).split())
+    return text if text and text != "None" else None
+
+
+def normalize(item: Dict[str, Any], source: Source) -> Dict[str, Optional[str]]:
+    """Common fields of one item; employer falls back to the source's company."""
+    out: Dict[str, Optional[str]] = {}
+    for field, paths in FIELD_PATHS.items():
+        out[field] = next((v for v in (_scalar(get_path(item, p)) for p in paths) if v), None)
+    out["employer"] = out["employer"] or source.company
+    for field in ("employer", "location"):  # few distinct values, held by many records
+        if out[field]:
+            out[field] = sys.intern(out[field])
+    return out
+
+
+def description(item: Dict[str, Any]) -> str:
+    parts = []
+    for path in DESCRIPTION_PATHS:
+        value = get_path(item, path)
+        if isinstance(value, str) and value:
+            parts.append(html.unescape(_TAG_RE.sub(" ", value)))
+    return " ".join(" ".join(parts).split())
+
+
+def workload(text: Optional[str]) -> Optional[Tuple[int, int]]:
+    """Pensum range in percent from e.g. "80-100%" (first mention wins)."""
+    m = _WORKLOAD_RE.search(text or "")
+    if m is None:
+        return None
+    lo, hi = (int(m.group(1)), int(m.group(2))) if m.group(1) else (int(m.group(3)),) * 2
+    if not 0 < lo <= hi <= 100:
+        return None
+    return lo, hi
+
+
+def contract_type(*texts: Optional[str]) -> Optional[str]:
+    """First contract kind found, trying ``texts`` in order (e.g. title, then description)."""
+    for text in texts:
+        if text:
+            for label, vocab in CONTRACT_TYPES.items():
+                if vocab.search(text):
+                    return label
+    return None
+
+
+def _clean_key(key: str) -> str:
+    return key.replace("\t", " ").replace("\n", " ")
+
+
+def archive(source: Source, items: Optional[List[Dict[str, Any]]] = None,
+            stamp: Optional[str] = None) -> Optional[Path]:
+    """Write the snapshot for this run; returns its path (None if there is nothing to store)."""
+    items = load_items(source) if items is None else items
+    if not items:
+        return None
+    from . import columns  # imports this module
+
+    rows = _rows(keyer_for(source, items), items)
+    codec = columns.Codec.load(source.name)
+    codec.learn(items[:LEARN_SAMPLE])
+    directory = source_dir(source.name)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{stamp or stamp_now()}{SUFFIX}"
+    _write(path, rows, source, codec)
+    codec.save()
+    _codecs.pop(source.name, None)
+    return path
+
+
+def snapshots(name: str) -> List[Path]:
+    """The source's snapshots, oldest first."""
+    directory = source_dir(name)
+    if not directory.exists():
+        return []
+    return sorted(directory.glob(f"*{SUFFIX}"))
+
+
+def stamp_of(path: Path) -> str:
+    return path.name[: -len(SUFFIX)]
+
+
+def read_index(path: Path) -> Iterator[Tuple[str, str, str]]:
+    """Stream ``(key, fingerprint, raw row)`` in key order without parsing items (``decode`` parses a row)."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            key, fp, raw = line.rstrip("\n").split("\t", 2)
+            yield key, fp, raw
+
+
+_codecs: Dict[str, Any] = {}  # source -> columns.Codec, for decoding
+
+
+def decode(name: str, raw: str) -> Dict[str, Any]:
+    """The item of one raw snapshot row of source ``name``."""
+    codes_text, sep, item_text = raw.partition("\t")
+    if not sep:  # written before snapshots were encoded
+        return json.loads(raw)
+    from . import columns  # imports this module
+
+    codes, item = json.loads(codes_text), json.loads(item_text)
+    codec = _codecs.get(name)
+    if codec is not None:
+        try:
+            return codec.decode(codes, item)
+        except (IndexError, KeyError):  # codes added since the codec was loaded
+            pass
+    codec = _codecs[name] = columns.Codec.load(name)
+    return codec.decode(codes, item)
+
+
+def read(path: Path) -> Iterator[Tuple[str, str, Dict[str, Any]]]:
+    name = path.parent.name
+    for key, fp, raw in read_index(path):
+        yield key, fp, decode(name, raw)
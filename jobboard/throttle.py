@@ -0,0 +1,146 @@
+"""
+Adaptive (AIMD) per-host concurrency for the shared transport.
+
+Every host gets a ``HostController`` with two knobs:
+
+- ``limit``: requests allowed in flight at once,
+- ``delay``: minimum spacing between request starts.
+
+On a healthy response the controller first raises its request rate
+additively (``1/delay`` grows by ``RATE_STEP`` per response), then grows
+``limit`` by ``1/limit``, i.e. about one slot per round trip, but only while
+all slots are in use. On 429/5xx, transport errors or a latency spike (more
+than ``SPIKE_FACTOR`` times the host's EWMA latency) it halves ``limit``; if
+only one request was in flight it doubles ``delay`` as well. At most one cut
+per round trip; ``Retry-After`` is honoured.
+
+Sequential scrapers only ever hold one slot, so for them this replaces
+hand-tuned sleeps with a delay that follows what the host tolerates today.
+
+Usage (``jobboard.transport`` does this for every request):
+  r = throttle.call("jobs.fenaco.com", lambda: client.post(url, data=data))
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+INITIAL_LIMIT = 2.0
+MAX_LIMIT = 8.0
+DECREASE = 0.5
+RATE_STEP = 0.5       # requests/second added per healthy response while spaced
+MIN_DELAY_S = 0.01    # spacing below this is dropped
+MIN_BACKOFF_S = 0.5
+MAX_DELAY_S = 10.0
+SPIKE_FACTOR = 3.0
+SPIKE_FLOOR_S = 1.0   # latencies below this never count as a spike
+EWMA_ALPHA = 0.2
+CONGESTION_STATUS = frozenset({429, 502, 503, 504})
+
+
+class HostController:
+    def __init__(self, host: str):
+        self.host = host
+        self.limit = INITIAL_LIMIT
+        self.delay = 0.0
+        self.in_flight = 0
+        self.latency: Optional[float] = None  # EWMA of healthy responses
+        self._next_start = 0.0
+        self._last_cut = 0.0
+        self._cond = threading.Condition()
+
+    def _slots(self) -> int:
+        return max(1, int(self.limit))
+
+    def acquire(self) -> None:
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                if self.in_flight < self._slots():
+                    if now >= self._next_start:
+                        self.in_flight += 1
+                        self._next_start = now + self.delay
+                        return
+                    self._cond.wait(self._next_start - now)
+                else:
+                    self._cond.wait()
+
+    def release(self, status: Optional[int], seconds: float, retry_after: Optional[float] = None) -> None:
+        """Feed back one finished request (``status=None``: it raised)."""
+        with self._cond:
+            busy = self.in_flight  # including this one
+            self.in_flight -= 1
+            now = time.monotonic()
+            spike = (self.latency is not None and seconds > SPIKE_FLOOR_S
+                     and seconds > SPIKE_FACTOR * self.latency)
+            if status is None or status in CONGESTION_STATUS or status >= 500 or spike:
+                self._decrease(now, sequential=busy <= 1)
+            else:
+                self.latency = seconds if self.latency is None else (
+                    EWMA_ALPHA * seconds + (1 - EWMA_ALPHA) * self.latency)
+                if self.delay > 0:
+                    self.delay = 1.0 / (1.0 / self.delay + RATE_STEP)
+                    if self.delay < MIN_DELAY_S:
+                        self.delay = 0.0
+                elif busy >= self._slots():
+                    self.limit = min(MAX_LIMIT, self.limit + 1.0 / self.limit)
+            if retry_after:
+                self._next_start = max(self._next_start, now + min(retry_after, MAX_DELAY_S * 6))
+            self._cond.notify_all()
+
+    def _decrease(self, now: float, sequential: bool) -> None:
+        if now - self._last_cut < (self.latency or 0.0):
+            return  # one cut per round trip: a burst of 429s is one signal
+        self._last_cut = now
+        self.limit = max(1.0, self.limit * DECREASE)
+        if sequential:
+            self.delay = min(MAX_DELAY_S, max(MIN_BACKOFF_S, self.delay * 2))
+        self._next_start = max(self._next_start, now + self.delay)
+
+    def state(self) -> Dict[str, Any]:
+        with self._cond:
+            return {"limit": round(self.limit, 2), "delay": round(self.delay, 3), "in_flight": self.in_flight,
+                    "latency": round(self.latency, 4) if self.latency is not None else None}
+
+
+_controllers: Dict[str, HostController] = {}
+_lock = threading.Lock()
+
+
+def for_host(host: str) -> HostController:
+    with _lock:
+        ctl = _controllers.get(host)
+        if ctl is None:
+            ctl = _controllers[host] = HostController(host)
+        return ctl
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    with _lock:
+        controllers = list(_controllers.values())
+    return {c.host: c.state() for c in controllers}
+
+
+def call(host: str, send: Callable[[], Any]) -> Any:
+    """Run ``send()`` (returns an httpx/requests response) inside ``host``'s controller."""
+    ctl = for_host(host)
+    ctl.acquire()
+    t0 = time.perf_counter()
+    try:
+        response = send()
+    except BaseException:
+        ctl.release(None, time.perf_counter() - t0)
+        raise
+    ctl.release(response.status_code, time.perf_counter() - t0,
+                retry_after_seconds(response.headers.get("Retry-After")))
+    return response
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds from a ``Retry-After`` header (the HTTP-date form is ignored)."""
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
@@ -0,0 +1,205 @@
+"""
+Shared HTTP transport for the scrapers.
+
+- One pooled, keep-alive ``httpx.Client`` per process, so multi-page crawls
+  reuse their TCP/TLS connections instead of handshaking on every request.
+- HTTP/2 where the host negotiates it (needs the ``h2`` package).
+- Advertises only the encodings httpx can decode: ``br`` needs ``brotli``.
+- Caches DNS answers in-process for ``DNS_TTL`` seconds.
+- Counts requests and bytes per source (see ``source_scope``); a scraper
+  started by the engine as a subprocess hands its counts back through the
+  file named in ``$JOBBOARD_USAGE_FILE``.
+- Times every request phase for ``jobboard.metrics``.
+- Paces each host with an adaptive (AIMD) controller, see ``jobboard.throttle``;
+  scrapers need no fixed sleeps between requests.
+- Fails fast with ``breaker.CircuitOpenError`` once a host keeps failing
+  (see ``jobboard.breaker``).
+- Can record responses to, or replay them from, a cassette
+  (``$JOBBOARD_HTTP_MODE``, see ``jobboard.cassette``).
+
+Usage:
+  from jobboard import transport
+  r = transport.get(url, headers=HEADERS, params=params)
+  r.raise_for_status()
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextvars
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+import httpx
+
+from . import breaker, cassette, metrics, throttle
+
+try:
+    import h2  # noqa: F401  (enables http2=True)
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "br, gzip"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; JobboardScraper/1.0)",
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+TIMEOUT_S = 30
+DNS_TTL = 300  # seconds
+LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60)
+
+
+# ---------- DNS cache ----------
+_real_getaddrinfo = socket.getaddrinfo
+_dns_cache: Dict[Tuple, Tuple[float, list]] = {}
+_dns_lock = threading.Lock()
+
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    with _dns_lock:
+        hit = _dns_cache.get(key)
+        if hit and hit[0] > now:
+            return hit[1]
+    t0 = time.perf_counter()
+    try:
+        answer = _real_getaddrinfo(host, port, family, type, proto, flags)
+    finally:
+        metrics.add_dns_time(time.perf_counter() - t0)
+    with _dns_lock:
+        _dns_cache[key] = (now + DNS_TTL, answer)
+    return answer
+
+
+def install_dns_cache() -> None:
+    socket.getaddrinfo = _cached_getaddrinfo
+
+
+# ---------- client ----------
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def client() -> httpx.Client:
+    """Return the process-wide client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                install_dns_cache()
+                _client = httpx.Client(
+                    http2=HTTP2,
+                    headers=DEFAULT_HEADERS,
+                    timeout=TIMEOUT_S,
+                    limits=LIMITS,
+                    follow_redirects=True,
+                    transport=cassette.transport_from_env(http2=HTTP2, limits=LIMITS),
+                )
+    return _client
+
+
+def close() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+# ---------- usage accounting ----------
+_source: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "jobboard_source", default=os.environ.get("JOBBOARD_SOURCE", "-")
+)
+_usage: Dict[str, Dict[str, int]] = {}
+_usage_lock = threading.Lock()
+
+
+def current_source() -> str:
+    return _source.get()
+
+
+@contextmanager
+def source_scope(name: str) -> Iterator[None]:
+    """Attribute requests made in this context (thread) to ``name``."""
+    token = _source.set(name)
+    try:
+        yield
+    finally:
+        _source.reset(token)
+
+
+def _record(response: httpx.Response) -> None:
+    with _usage_lock:
+        u = _usage.setdefault(_source.get(), {"requests": 0, "bytes": 0})
+        u["requests"] += 1
+        u["bytes"] += response.num_bytes_downloaded
+
+
+def usage(name: str) -> Dict[str, int]:
+    with _usage_lock:
+        return dict(_usage.get(name, {"requests": 0, "bytes": 0}))
+
+
+def _dump_usage() -> None:
+    path = os.environ.get("JOBBOARD_USAGE_FILE")
+    if path and _usage:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(_usage, f)
+
+
+atexit.register(_dump_usage)
+
+
+def _send(method: str, url: str, kwargs: Dict) -> httpx.Response:
+    timer = metrics.RequestTimer(_source.get(), method, url)
+    extensions = {**(kwargs.pop("extensions", None) or {}), "trace": timer.trace}
+    try:
+        response = client().request(method, url, extensions=extensions, **kwargs)
+    except BaseException as e:
+        timer.fail(e)
+        raise
+    timer.done(response)
+    return response
+
+
+def request(method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a request over the shared client (per-request headers are merged)."""
+    if os.environ.get("JOBBOARD_HTTP_MODE") == "replay":
+        response = _send(method, url, kwargs)  # no network, nothing to pace
+    else:
+        response = guarded(httpx.URL(url).host, lambda: _send(method, url, kwargs))
+    _record(response)
+    return response
+
+
+def guarded(host: str, send) -> object:
+    """Run ``send()`` behind ``host``'s circuit breaker and pacing controller.
+
+    For scrapers that keep their own client, e.g.
+    ``transport.guarded(HOST, lambda: session.get(url))``.
+    """
+    return breaker.call(host, lambda: throttle.call(host, send))
+
+
+def get(url: str, **kwargs) -> httpx.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> httpx.Response:
+    return request("POST", url, **kwargs)
@@ -0,0 +1,61 @@
+"""
+Controlled-vocabulary matching for row classification.
+
+A ``Vocabulary`` compiles its terms once into a single regex whose
+alternatives are factored by common prefix (a trie), so each text position
+is tried against the whole vocabulary in one step. Matching is leftmost,
+and longest at that position ("Stage découverte" wins over "Stage").
+
+Usage:
+  SITES = Vocabulary({"Genève", "Bienne"}, whole_words=True)
+  SITES.search("Horloger Genève CDI")   # -> "Genève"
+  HINTS.startswith("Berufserfahrene")   # term is a prefix of the text
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    trie: Dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end of a term
+
+    def build(node: Dict[str, dict]) -> str:
+        alts = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        if "" in node:  # a shorter term ends here: the rest is optional (greedy = longest first)
+            return ("(?:" + body + ")?") if len(alts) == 1 else body + "?"
+        return body
+
+    return build(trie)
+
+
+class Vocabulary:
+    def __init__(self, terms: Iterable[str], whole_words: bool = False, ignore_case: bool = False):
+        self.terms = frozenset(t for t in terms if t)
+        if not self.terms:
+            raise ValueError("Vocabulary needs at least one term")
+        pattern = _trie_pattern(self.terms)
+        if whole_words:
+            pattern = rf"(?<!\w){pattern}(?!\w)"
+        self.regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+    def search(self, text: str) -> Optional[str]:
+        """First (leftmost, longest) term found in ``text``."""
+        m = self.regex.search(text or "")
+        return m.group(0) if m else None
+
+    def findall(self, text: str) -> List[str]:
+        return self.regex.findall(text or "")
+
+    def startswith(self, text: str) -> bool:
+        """True if ``text`` begins with one of the terms."""
+        return self.regex.match(text or "") is not None
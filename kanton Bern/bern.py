@@ -1,24 +1,25 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json, re, time
+import re, sys
+from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
-import requests
+import httpx
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, transport
+
 START_URL = "https://ohws.prospective.ch/public/v1/careercenter/1001760/?lang=de"
 
 UA = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome Safari"
-SESSION = requests.Session()
-SESSION.headers.update({
+HEADERS = {
     "User-Agent": UA,
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Referer": START_URL,
     "Origin": "https://ohws.prospective.ch",
-})
-
-SLEEP = 0.4  # be polite
+}
 
 def bs(html: str) -> BeautifulSoup:
     try:
@@ -126,17 +127,17 @@ def candidate_pagination_fields(form_el: BeautifulSoup) -> List[str]:
                     ids.append(nm)
     return ids
 
-def submit(action: str, method: str, data: Dict[str, str]) -> requests.Response:
+def submit(action: str, method: str, data: Dict[str, str]) -> httpx.Response:
     if method.lower() == "get":
-        r = SESSION.get(action, params=data, timeout=30)
+        r = transport.get(action, params=data, headers=HEADERS, timeout=30)
     else:
-        r = SESSION.post(action, data=data, timeout=30)
+        r = transport.post(action, data=data, headers=HEADERS, timeout=30)
     r.raise_for_status()
     return r
 
 def scrape_listing() -> List[Dict]:
     # First page
-    r0 = SESSION.get(START_URL, timeout=30)
+    r0 = transport.get(START_URL, headers=HEADERS, timeout=30)
     r0.raise_for_status()
     soup0 = bs(r0.text)
 
@@ -251,12 +252,11 @@ def scrape_listing() -> List[Dict]:
 
         start += step
         loops += 1
-        time.sleep(SLEEP)
 
     return list(all_jobs.values())
 
 def fetch_detail(url: str) -> Dict:
-    r = SESSION.get(url, timeout=30)
+    r = transport.get(url, headers=HEADERS, timeout=30)
     r.raise_for_status()
     s = bs(r.text)
 
@@ -293,7 +293,7 @@ def fetch_detail(url: str) -> Dict:
 def main():
     jobs = scrape_listing()
     with open("jobs_overview.json", "w", encoding="utf-8") as f:
-        json.dump(jobs, f, ensure_ascii=False, indent=2)
+        jsonio.dump(jobs, f)
     print(f"Overview: {len(jobs)} jobs")
 
     # Optional: fetch details for each job
@@ -301,11 +301,10 @@ def main():
     for j in jobs:
         try:
             detailed.append({**j, **fetch_detail(j["detail_url"])})
-            time.sleep(SLEEP)
         except Exception as e:
             detailed.append({**j, "error": str(e)})
     with open("jobs_detailed.json", "w", encoding="utf-8") as f:
-        json.dump(detailed, f, ensure_ascii=False, indent=2)
+        jsonio.dump(detailed, f)
     print(f"Detailed: {len(detailed)} jobs")
 
 if __name__ == "__main__":
@@ -1,8 +1,11 @@
-import requests
 import json
 import os
-import time
+import sys
 import glob
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, transport
 
 BASE_URL = "https://jobs.migros.ch/api/graphql/query/searchJobs"
 PARAMS_TEMPLATE = {
@@ -31,7 +34,7 @@ def fetch_page(page_number: int):
     variables["page"] = page_number
     params["__variables"] = json.dumps(variables)
 
-    response = requests.get(BASE_URL, params=params)
+    response = transport.get(BASE_URL, params=params)
     response.raise_for_status()
     return response.json()
 
@@ -39,7 +42,7 @@ def fetch_page(page_number: int):
 def save_page(page_number: int, data: dict):
     filepath = os.path.join(OUTPUT_DIR, f"page_{page_number}.json")
     with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        jsonio.dump(data, f)
 
 
 def mergeAll():
@@ -68,7 +71,7 @@ def mergeAll():
     }
 
     with open("migros.json", "w", encoding="utf-8") as f:
-        json.dump(merged, f, indent=2, ensure_ascii=False)
+        jsonio.dump(merged, f)
 
     print(f"Merged {len(files)} pages into migros.json with {len(hits_all)} jobs.")
 
@@ -92,7 +95,6 @@ def main():
             break
 
         page += 1
-        time.sleep(1)
 
     # merge all pages into one JSON file
     mergeAll()
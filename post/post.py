@@ -1,9 +1,13 @@
-import requests
 import json
 import os
-import time
+import sys
+from pathlib import Path
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-import hashlib
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import jsonio, transport
+from jobboard.keys import ItemKeyer
+from jobboard.shape import JobList
 
 BASE_URL = ("https://www.post.ch/api/jobs/loadMore/16845b197bac43d9b9e13b79d91ebd50"
             "?jobsCategory=professionals&workload-maximum=1&workload-minimum=0"
@@ -18,7 +22,6 @@ HEADERS = {
 }
 
 STEP = 5              # Consider 10 to avoid overlapping windows upstream
-DELAY_SECONDS = 1
 
 def set_query_param(url: str, key: str, value: str) -> str:
     parts = urlparse(url)
@@ -29,67 +32,19 @@ def set_query_param(url: str, key: str, value: str) -> str:
 
 def fetch_page(start_number: int) -> dict:
     url = set_query_param(BASE_URL, "startNumber", start_number)
-    resp = requests.get(url, headers=HEADERS, timeout=30)
+    resp = transport.get(url, headers=HEADERS, timeout=30)
     resp.raise_for_status()
     return resp.json()
 
 def save_page(start_number: int, data: dict) -> None:
     path = os.path.join(OUTPUT_DIR, f"start_{start_number}.json")
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+        jsonio.dump(data, f)
+
+_JOBS = JobList("post")
 
 def _extract_items(payload: dict):
-    # Common patterns
-    for key in ("jobItems", "items", "jobs", "results"):
-        v = payload.get(key)
-        if isinstance(v, list):
-            return v
-
-    # Shallow search for first list value
-    for v in payload.values():
-        if isinstance(v, list):
-            return v
-        if isinstance(v, dict):
-            for vv in v.values():
-                if isinstance(vv, list):
-                    return vv
-    return []
-
-def _item_key(item: dict) -> str:
-    """
-    Produce a stable, unique key for a job item.
-    Try common identifier fields first; if none, hash a normalized serialization.
-    """
-    # Try common fields (adjust if you see a specific schema)
-    candidate_keys = [
-        "id", "jobId", "jobID", "job_id", "guid", "uuid",
-        "jobReference", "reference", "slug", "url", "detailUrl", "applyUrl",
-        "jobItemId"
-    ]
-
-    # direct
-    for k in candidate_keys:
-        if k in item and isinstance(item[k], (str, int)):
-            return f"{k}:{item[k]}"
-
-    # nested (e.g., item.get("link", {}).get("url"))
-    nested_candidates = [
-        ("link", "url"),
-        ("links", "self"),
-        ("meta", "id"),
-    ]
-    for a, b in nested_candidates:
-        v = item.get(a)
-        if isinstance(v, dict) and b in v and isinstance(v[b], (str, int)):
-            return f"{a}.{b}:{v[b]}"
-
-    # fallback: stable hash of the item
-    try:
-        normalized = json.dumps(item, sort_keys=True, ensure_ascii=False)
-    except TypeError:
-        # in case of non-serializable types
-        normalized = str(item)
-    return "hash:" + hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return _JOBS.extract(payload)
 
 def mergeAll(output_file: str = "swisspost.json") -> None:
     """
@@ -101,6 +56,7 @@ def mergeAll(output_file: str = "swisspost.json") -> None:
     """
     seen = set()
     items_unique = []
+    keyer = ItemKeyer()  # learns the id field from the first non-empty page
 
     # Sort by numeric startNumber to keep natural order
     def _startnum_from_name(name: str) -> int:
@@ -115,8 +71,11 @@ def mergeAll(output_file: str = "swisspost.json") -> None:
         with open(os.path.join(OUTPUT_DIR, name), "r", encoding="utf-8") as f:
             data = json.load(f)
 
-        for item in _extract_items(data):
-            key = _item_key(item)
+        items = _extract_items(data)
+        if not keyer.learned:
+            keyer.learn(items)
+        for item in items:
+            key = keyer.key(item)
             if key in seen:
                 continue
             seen.add(key)
@@ -124,7 +83,7 @@ def mergeAll(output_file: str = "swisspost.json") -> None:
 
     merged = {"count": len(items_unique), "items": items_unique}
     with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(merged, f, indent=2, ensure_ascii=False)
+        jsonio.dump(merged, f)
     print(f"Merged {len(items_unique)} unique items into {output_file}")
 
 def main():
@@ -143,7 +102,6 @@ def main():
             break
 
         start += STEP
-        time.sleep(DELAY_SECONDS)
 
     # Merge everything into one file (deduped)
     mergeAll("swisspost.json")
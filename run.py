@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Run the registered scrapers (see jobboard/registry.py).
+
+Usage:
+  python run.py                   # every source that has a platform adapter
+  python run.py migros raiffeisen # only these
+  python run.py --list            # show the registry
+  python run.py --due             # only sources due for a refresh, by their churn
+  python run.py --no-probe        # crawl in full even if the first page is unchanged
+  python run.py hirslanden --profile          # cProfile + tracemalloc
+  python run.py fenaco --profile sample       # sampling profiler
+  python run.py bern --record                 # save HTTP responses ...
+  python run.py bern --replay --profile       # ... and profile without the network
+  python run.py rolex --pretty-json           # indented output files, for reading
+
+After a run the completeness/latency report is printed and saved to
+.jobboard/reports/ (or --report PATH); per-request timing histograms go to
+.jobboard/metrics/ as JSON and Prometheus text, profiles to
+.jobboard/profiles/<timestamp>/ (<source>.prof / .collapsed plus a <source>.txt
+top-N summary). --record/--replay cover only requests made over
+jobboard.transport; see jobboard/cassette.py for the scrapers that bypass it.
+"""
+
+import argparse
+import sys
+import time
+
+from jobboard import cassette, jsonio, metrics, profiling, schedule
+from jobboard.engine import DEFAULT_WORKERS, run_all, runnable
+from jobboard.registry import by_name, load_sources
+from jobboard.report import build_report, format_table, write_report
+
+
+def list_sources(sources) -> None:
+    for s in sources:
+        print(f"{s.name:<22} {s.platform or '-':<15} {str(s.expected or ''):>5}  {s.company}")
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("sources", nargs="*", help="source names (default: all runnable)")
+    ap.add_argument("--list", action="store_true", help="list registered sources and exit")
+    ap.add_argument("--due", action="store_true", help="only sources whose refresh is due (see jobboard.schedule)")
+    ap.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="hosts crawled in parallel")
+    ap.add_argument("--report", metavar="PATH", help="write the run report here instead of .jobboard/reports/")
+    ap.add_argument("--profile", nargs="?", const="cprofile", choices=profiling.MODES,
+                    help="profile each source (default: cprofile); sources then run one at a time")
+    ap.add_argument("--profile-top", type=int, default=profiling.DEFAULT_TOP, metavar="N",
+                    help="rows in the profile summaries")
+    http = ap.add_mutually_exclusive_group()
+    http.add_argument("--record", action="store_true", help="save HTTP responses to the cassette")
+    http.add_argument("--replay", action="store_true", help="serve HTTP responses from the cassette (no network)")
+    ap.add_argument("--cassette", metavar="DIR", help="cassette directory (default .jobboard/cassettes/)")
+    ap.add_argument("--pretty-json", action="store_true", help="indent output files (default: compact)")
+    ap.add_argument("--no-probe", action="store_true",
+                    help="never skip a source whose first page is unchanged (see jobboard.probes)")
+    args = ap.parse_args(argv)
+
+    sources = load_sources()
+    if args.list:
+        list_sources(sources)
+        return 0
+
+    if args.sources:
+        index = by_name(sources)
+        unknown = [n for n in args.sources if n not in index]
+        if unknown:
+            ap.error(f"unknown source(s): {', '.join(unknown)}")
+        sources = [index[n] for n in args.sources]
+        not_runnable = [s.name for s in sources if s not in runnable(sources)]
+        if not_runnable:
+            ap.error(f"no platform adapter for: {', '.join(not_runnable)}")
+    if args.due:
+        sources = schedule.due(runnable(sources))
+        print(f"Due: {', '.join(s.name for s in sources) or 'nothing'}")
+        if not sources:
+            return 0
+
+    workers = args.workers
+    if args.record or args.replay:
+        cassette.enable("record" if args.record else "replay", args.cassette)
+    if args.pretty_json:
+        jsonio.enable("pretty")
+    if args.profile:
+        profile_dir = profiling.PROFILE_DIR / time.strftime("%Y%m%dT%H%M%S")
+        profiling.enable(args.profile, profile_dir, args.profile_top)
+        workers = 1  # tracemalloc is process-wide: keep sources apart
+
+    # profiles and cassettes are for full crawls
+    probe = not (args.no_probe or args.profile or args.record)
+    runs = run_all(sources, workers=workers, probe=probe)
+    report = build_report(runs)
+    path = write_report(report, args.report)
+    print("\n" + format_table(report))
+    print(f"Report: {path}")
+    print(f"Metrics: {metrics.write()}")
+    if args.profile:
+        print(f"Profiles: {profile_dir}")
+
+    failed = [r.source.name for r in runs if not r.ok]
+    skipped = sum(1 for r in runs if r.skipped)
+    print(f"\nDone. {len(runs) - len(failed)} ok ({skipped} unchanged), {len(failed)} failed"
+          + (f": {', '.join(failed)}" if failed else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
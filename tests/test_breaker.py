@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # shared jobboard package
+from jobboard import breaker, throttle, transport
+
+URL = "https://jobs.example.ch/search"
+
+
+@pytest.fixture
+def fresh(monkeypatch, tmp_path):
+    """Empty breaker/pacing state for the test host, no mirror files, no backoff sleeps."""
+    monkeypatch.setattr(breaker, "BREAKER_DIR", tmp_path)
+    monkeypatch.setattr(breaker, "_breakers", {})
+    monkeypatch.setattr(throttle, "_controllers", {})
+    monkeypatch.setattr(throttle, "MIN_BACKOFF_S", 0.0)
+    monkeypatch.delenv("JOBBOARD_HTTP_MODE", raising=False)
+
+
+def serve(monkeypatch, statuses):
+    """Answer requests over the shared client with ``statuses`` in turn."""
+    answers = iter(statuses)
+    handler = lambda request: httpx.Response(next(answers), request=request)
+    monkeypatch.setattr(transport, "_client", httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def test_congestion_does_not_open_circuit(fresh, monkeypatch):
+    serve(monkeypatch, [503, 503, 503, 200])
+    for _ in range(4):  # a scraper's retry loop
+        r = transport.post(URL, data={"page": "1"})
+        if r.status_code != 503:
+            break
+    assert r.status_code == 200
+    assert breaker.for_host("jobs.example.ch").state()["state"] == "closed"
+
+
+def test_interrupted_probe_keeps_circuit_open(fresh, monkeypatch):
+    b = breaker.for_host("jobs.example.ch")
+    b.failures, b.open_until = breaker.FAILURE_THRESHOLD, 0.0  # cooldown over: next request is the probe
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        breaker.call("jobs.example.ch", interrupted)
+    assert b.state() == {"state": "open", "failures": breaker.FAILURE_THRESHOLD, "open_until": 0.0}